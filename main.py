@@ -8,9 +8,13 @@ import sys
 import os
 import asyncio
 import argparse
+import atexit
 import logging
+import queue
 import signal
+import threading
 import time
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 # Add src directory to Python path
@@ -20,15 +24,94 @@ if str(src_dir) not in sys.path:
     sys.path.insert(0, str(src_dir))
 
 def setup_logging():
-    """Setup basic logging configuration"""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler('service.log', encoding='utf-8')
-        ]
-    )
+    """Setup logging with file/console IO offloaded to a listener thread
+
+    Log calls only enqueue the record; the QueueListener thread does the
+    formatting and disk/console writes, so the asyncio event loop never
+    blocks on file IO in the request hot path.
+    """
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    output_handlers = [
+        logging.StreamHandler(sys.stdout),
+        logging.FileHandler('service.log', encoding='utf-8')
+    ]
+    for handler in output_handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(QueueHandler(log_queue))
+
+    listener = QueueListener(log_queue, *output_handlers)
+    listener.start()
+    atexit.register(listener.stop)  # flush remaining records on exit
+
+def install_fast_event_loop():
+    """Install a C-accelerated event loop policy when available
+
+    winloop (Windows) / uvloop (POSIX) replace the stdlib selector or
+    proactor loop with libuv-backed dispatch. Both are optional; the stdlib
+    loop is used when neither is installed.
+    """
+    logger = logging.getLogger(__name__)
+    try:
+        if os.name == 'nt':
+            import winloop
+            winloop.install()
+            logger.info("Using winloop event loop")
+        else:
+            import uvloop
+            uvloop.install()
+            logger.info("Using uvloop event loop")
+    except ImportError:
+        logger.debug("No accelerated event loop available, using asyncio default")
+
+def install_signal_handlers(service, loop):
+    """Install shutdown signal handling on a dedicated thread
+
+    Classic signal.signal handlers run on whatever thread the signal is
+    delivered to and can interrupt await points mid-acquire under
+    asyncio.run. Instead, shutdown is always scheduled onto the event loop
+    from outside: via SetConsoleCtrlHandler on Windows, or a daemon thread
+    blocked in sigwait on POSIX.
+    """
+    logger = logging.getLogger(__name__)
+
+    def request_stop():
+        logger.info("Shutdown signal received, stopping service...")
+        asyncio.run_coroutine_threadsafe(service.stop(), loop)
+
+    if os.name == 'nt':
+        try:
+            import win32api
+
+            def ctrl_handler(ctrl_type):
+                request_stop()
+                return True  # Handled; prevent abrupt process kill
+
+            win32api.SetConsoleCtrlHandler(ctrl_handler, True)
+            return
+        except ImportError:
+            pass  # Fall through to the signal-based handlers
+
+    if hasattr(signal, 'pthread_sigmask'):
+        shutdown_signals = [signal.SIGINT, signal.SIGTERM]
+        signal.pthread_sigmask(signal.SIG_BLOCK, shutdown_signals)
+
+        def wait_for_signal():
+            signal.sigwait(shutdown_signals)
+            request_stop()
+
+        threading.Thread(target=wait_for_signal, name="signal-wait", daemon=True).start()
+    else:
+        # Last resort: classic handlers
+        def signal_handler(signum, frame):
+            request_stop()
+
+        signal.signal(signal.SIGINT, signal_handler)
+        signal.signal(signal.SIGTERM, signal_handler)
 
 def main():
     """Main entry point"""
@@ -92,22 +175,21 @@ def main():
         print(f"Django Server: {config['server_url']}")
         print(f"Client ID: {config['client_id']}")
         print(f"Local API: http://localhost:{config['local_api_port']}")
-        print(f"Poll Interval: {config['poll_interval']*1000:.0f}ms")
+        print(f"Poll Interval: {config['poll_interval']*1000:.0f}ms base (adaptive, max 5000ms)")
         print()
         
         # Create service instance
         service = WindowsPrintService(config_manager)
-        
-        # Setup signal handlers for graceful shutdown
-        def signal_handler(signum, frame):
-            logger.info(f"Received signal {signum}, shutting down...")
-            service.stop()
-            
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
-        
-        # Run the service
-        asyncio.run(service.run())
+
+        # Use an accelerated event loop when available
+        install_fast_event_loop()
+
+        # Run the service with signal handling on a dedicated thread
+        async def run_service():
+            install_signal_handlers(service, asyncio.get_running_loop())
+            await service.run()
+
+        asyncio.run(run_service())
         return 0
         
     except KeyboardInterrupt:
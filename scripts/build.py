@@ -8,17 +8,40 @@ import os
 import sys
 import subprocess
 import shutil
+import hashlib
 from pathlib import Path
 
 # Get project root directory
 project_root = Path(__file__).parent.parent.absolute()
 os.chdir(project_root)
 
-def build_executable():
+SPEC_FILE = Path("WindowsPrintService.spec")
+BUILD_HASH_FILE = Path("build") / ".build_hash"
+
+def compute_build_hash(onedir):
+    """Hash the build inputs so unchanged sources can reuse PyInstaller's Analysis cache
+
+    The build mode is part of the hash: the cached spec encodes
+    onefile/onedir, so a mode switch must regenerate it rather than
+    rebuild from the other mode's spec.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(b"onedir" if onedir else b"onefile")
+    inputs = [Path("requirements.txt"), Path("main.py")] + sorted(Path("src").glob("*.py"))
+    for path in inputs:
+        if path.exists():
+            hasher.update(str(path).encode())
+            hasher.update(str(path.stat().st_mtime_ns).encode())
+    if Path("requirements.txt").exists():
+        hasher.update(Path("requirements.txt").read_bytes())
+    return hasher.hexdigest()
+
+def build_executable(onedir=False):
     """Build standalone executable with simplified approach"""
     print("🔨 Building Windows Print Service Executable")
     print("=" * 50)
     print(f"Project root: {project_root}")
+    print(f"Build mode: {'onedir (faster cold start)' if onedir else 'onefile (single exe)'}")
     
     try:
         # Check if PyInstaller is installed
@@ -30,56 +53,96 @@ def build_executable():
             subprocess.run([sys.executable, "-m", "pip", "install", "pyinstaller"], check=True)
             print("✓ PyInstaller installed")
         
-        # Clean previous builds
-        build_dirs = ['build', 'dist', '__pycache__', 'scripts/__pycache__', 'src/__pycache__']
-        for dir_name in build_dirs:
+        # Clean output dirs; keep build/ so PyInstaller can reuse its Analysis cache
+        build_hash = compute_build_hash(onedir)
+        cached_hash = BUILD_HASH_FILE.read_text().strip() if BUILD_HASH_FILE.exists() else None
+        inputs_unchanged = cached_hash == build_hash
+
+        clean_dirs = ['dist', '__pycache__', 'scripts/__pycache__', 'src/__pycache__']
+        if not inputs_unchanged:
+            clean_dirs.insert(0, 'build')
+
+        for dir_name in clean_dirs:
             if os.path.exists(dir_name):
                 shutil.rmtree(dir_name)
                 print(f"✓ Cleaned {dir_name}")
-        
+
+        # Fast path: reuse the generated spec when the inputs haven't changed
+        if SPEC_FILE.exists() and inputs_unchanged:
+            print(f"✓ Inputs unchanged, reusing {SPEC_FILE}")
+            cmd = [
+                sys.executable, "-m", "PyInstaller",
+                str(SPEC_FILE),
+                "--noconfirm"
+            ]
+            return run_pyinstaller(cmd, onedir, build_hash)
+
         # Simplified PyInstaller command
         cmd = [
             sys.executable, "-m", "PyInstaller",
-            "--onefile",                       # Single executable
+            "--onedir" if onedir else "--onefile",  # onefile extracts to temp on every launch
             "--console",                       # Keep console window
             "--name=WindowsPrintService",      # Executable name
             "--paths=src",                     # Add src to Python path
             "--hidden-import=win32print",      # Essential Windows modules
             "--hidden-import=win32api",
-            "--hidden-import=uvicorn.main",    # Uvicorn main module
             "--hidden-import=fastapi",
+            "--hidden-import=winloop",         # Optional accelerated event loop
+            "--hidden-import=orjson",          # C JSON encoder for API responses
+
             "--exclude-module=tkinter",        # Exclude unnecessary modules
             "--exclude-module=matplotlib",
             "--exclude-module=PIL",
             "--exclude-module=numpy",
+            "--exclude-module=pytest",         # Dev/packaging tooling never used at runtime
+            "--exclude-module=unittest",
+            "--exclude-module=test",
+            "--exclude-module=setuptools",
+            "--exclude-module=pip",
+            "--exclude-module=distutils",
+            "--exclude-module=lib2to3",
+            "--optimize=2",                    # -OO bytecode: strip asserts and docstrings
             "main.py"                          # Main script
         ]
-        
+
+        # Keep the generated spec at the project root for reuse on later builds
+        cmd.insert(-1, "--specpath=.")
+
+        # Compress with UPX when a local UPX binary is available
+        upx_dir = project_root / "upx"
+        if upx_dir.exists():
+            cmd.insert(-1, f"--upx-dir={upx_dir}")
+            print(f"✓ UPX compression enabled ({upx_dir})")
+
+        return run_pyinstaller(cmd, onedir, build_hash)
+
+    except KeyboardInterrupt:
+        print("\n❌ Build cancelled by user")
+        return False
+    except Exception as e:
+        print(f"\n❌ Build error: {e}")
+        return False
+
+def run_pyinstaller(cmd, onedir, build_hash):
+    """Run PyInstaller and package the result"""
+    try:
         print("Building executable...")
         print(f"Command: {' '.join(cmd)}")
         print("\nThis may take several minutes...")
-        
-        # Run with real-time output and timeout
-        process = subprocess.Popen(
-            cmd, 
-            stdout=subprocess.PIPE, 
-            stderr=subprocess.STDOUT,
-            universal_newlines=True,
-            bufsize=1
-        )
-        
-        # Print output in real-time
-        while True:
-            output = process.stdout.readline()
-            if output == '' and process.poll() is not None:
-                break
-            if output:
-                print(output.strip())
-        
-        rc = process.poll()
-        
+
+        # Inherit stdout/stderr so PyInstaller writes straight to the console;
+        # the old readline loop paid a Python round-trip per output line and
+        # could stall on Windows PIPE buffering during large output bursts
+        rc = subprocess.call(cmd)
+
         if rc == 0:
-            exe_path = Path("dist/WindowsPrintService.exe")
+            # Record the input hash so the next build can reuse the Analysis cache
+            BUILD_HASH_FILE.parent.mkdir(exist_ok=True)
+            BUILD_HASH_FILE.write_text(build_hash)
+            if onedir:
+                exe_path = Path("dist/WindowsPrintService/WindowsPrintService.exe")
+            else:
+                exe_path = Path("dist/WindowsPrintService.exe")
             if exe_path.exists():
                 size_mb = exe_path.stat().st_size / (1024 * 1024)
                 print(f"\n✓ Build successful!")
@@ -88,9 +151,9 @@ def build_executable():
                 
                 # Test the executable quickly
                 test_exe(exe_path)
-                
+
                 # Create deployment package
-                create_deployment_package()
+                create_deployment_package(exe_path)
                 
                 return True
             else:
@@ -132,19 +195,23 @@ def test_exe(exe_path):
     except Exception as e:
         print(f"⚠️  Executable test failed: {e}")
 
-def create_deployment_package():
+def create_deployment_package(exe_path="dist/WindowsPrintService.exe"):
     """Create deployment package with all necessary files"""
     try:
         print("\n📦 Creating deployment package...")
-        
+
         # Create deployment directory
         deploy_dir = Path("deployment")
         if deploy_dir.exists():
             shutil.rmtree(deploy_dir)
         deploy_dir.mkdir()
-        
-        # Copy executable
-        shutil.copy("dist/WindowsPrintService.exe", deploy_dir)
+
+        # Copy executable (onedir builds ship the whole directory)
+        exe_path = Path(exe_path)
+        if exe_path.parent.name == "WindowsPrintService":
+            shutil.copytree(exe_path.parent, deploy_dir / "WindowsPrintService")
+        else:
+            shutil.copy(exe_path, deploy_dir)
         print("✓ Copied executable")
         
         # Copy existing batch files from scripts directory
@@ -249,8 +316,8 @@ if __name__ == "__main__":
     print("🚀 Windows Print Service Build Script")
     print("Press Ctrl+C to cancel at any time")
     print()
-    
-    success = build_executable()
+
+    success = build_executable(onedir="--onedir" in sys.argv)
     
     if success:
         print("\n🎉 Build completed successfully!")
@@ -3,16 +3,32 @@ Configuration Manager
 Handles all service configuration with automatic defaults
 """
 
+import atexit
 import json
 import os
+import threading
+import types
 import uuid
 import logging
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Mapping
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 class ConfigManager:
     """Manages service configuration with automatic setup"""
-    
+
+    # Polling below 50ms burns a CPU core for no latency benefit
+    MIN_POLL_INTERVAL = 0.05
+
+    # Directories already verified this process; skips mkdir syscalls when
+    # ConfigManager is instantiated more than once
+    _ensured_dirs = set()
+
     def __init__(self, config_path: str = None):
         self.logger = logging.getLogger(__name__)
         
@@ -25,12 +41,22 @@ class ConfigManager:
             self.config_path = self.config_dir / "config.json"
         
         self.config_dir = self.config_path.parent
-        
+
+        # Debounced persistence: runtime update bursts coalesce into one write
+        self._dirty = False
+        self._save_timer: threading.Timer = None
+        self._save_lock = threading.Lock()
+
         # Create all required directories
         self._create_directories()
         
         # Load or create configuration
         self._load_config()
+
+        # The save timer is a daemon thread and dies unrun at interpreter
+        # exit; flush any debounced write so a fast-exiting process (e.g.
+        # the installer right after persisting server_url) cannot lose it
+        atexit.register(self._flush)
     
     def _create_directories(self):
         """Create all required directories"""
@@ -42,8 +68,12 @@ class ConfigManager:
         ]
         
         for directory in directories:
+            if directory in ConfigManager._ensured_dirs:
+                continue
             try:
-                directory.mkdir(parents=True, exist_ok=True)
+                if not directory.is_dir():
+                    directory.mkdir(parents=True, exist_ok=True)
+                ConfigManager._ensured_dirs.add(directory)
                 self.logger.debug(f"Directory ensured: {directory}")
             except Exception as e:
                 self.logger.error(f"Failed to create directory {directory}: {e}")
@@ -52,16 +82,19 @@ class ConfigManager:
         """Load configuration from file or create default"""
         try:
             if self.config_path.exists():
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    self.config = json.load(f)
+                with open(self.config_path, 'rb') as f:
+                    raw = f.read()
+                # orjson parses in C when available; stdlib json otherwise
+                self.config = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
                 self.logger.info("Configuration loaded successfully")
                 
-                # Ensure all required keys exist
+                # Ensure all required keys exist; one C-level dict merge,
+                # with loaded values winning over defaults
                 default_config = self._create_default_config()
-                for key, value in default_config.items():
-                    if key not in self.config:
-                        self.config[key] = value
-                        self.logger.info(f"Added missing config key: {key}")
+                missing = default_config.keys() - self.config.keys()
+                if missing:
+                    self.config = {**default_config, **self.config}
+                    self.logger.info(f"Added missing config keys: {sorted(missing)}")
                 
             else:
                 self.config = self._create_default_config()
@@ -72,6 +105,39 @@ class ConfigManager:
             self.logger.error(f"Configuration load error: {e}")
             self.config = self._create_default_config()
             self._save_config()
+
+        # Enforce the polling floor regardless of what the file says
+        try:
+            self.config['poll_interval'] = max(
+                self.MIN_POLL_INTERVAL, float(self.config.get('poll_interval', 0.1))
+            )
+        except (TypeError, ValueError):
+            self.config['poll_interval'] = 0.1
+
+        # Cache a read-only view so get_config() callers never trigger
+        # re-parsing or per-call copies (the view tracks in-place updates)
+        self._cached = types.MappingProxyType(self.config)
+        self._build_views()
+
+    def _build_views(self):
+        """(Re)build the cached read-only sub-config views"""
+        self._server_view = types.MappingProxyType({
+            "server_url": self.config["server_url"],
+            "client_id": self.config["client_id"],
+            "api_key": self.config["api_key"],
+            "poll_interval": self.config["poll_interval"],
+            "long_poll_timeout": self.config.get("long_poll_timeout", 25),
+            "max_retries": self.config["max_retries"],
+            "timeout_seconds": self.config["timeout_seconds"]
+        })
+        self._performance_view = types.MappingProxyType({
+            "max_concurrent_jobs": self.config["max_concurrent_jobs"],
+            "enable_caching": self.config["enable_caching"],
+            "cache_max_size": self.config["cache_max_size"],
+            "enable_burst_mode": self.config["enable_burst_mode"],
+            "burst_duration": self.config["burst_duration"],
+            "burst_interval": self.config["burst_interval"]
+        })
     
     def _create_default_config(self) -> Dict[str, Any]:
         """Create default configuration"""
@@ -86,6 +152,7 @@ class ConfigManager:
             
             # Polling configuration (ultra-fast)
             "poll_interval": 0.1,  # 100ms
+            "long_poll_timeout": 25,  # seconds the server may hold a poll; 0 disables
             "max_retries": 3,
             "timeout_seconds": 30,
             
@@ -116,61 +183,71 @@ class ConfigManager:
             "printer_refresh_interval": 300  # 5 minutes
         }
     
-    def _save_config(self):
-        """Save configuration to file"""
+    def _save_config(self, keep_backup: bool = False):
+        """Save configuration atomically (temp file + rename)"""
         try:
-            # Create backup if config exists
-            if self.config_path.exists():
+            # Optional backup of the previous file
+            if keep_backup and self.config_path.exists():
                 backup_path = self.config_path.with_suffix('.json.backup')
                 self.config_path.replace(backup_path)
-            
-            # Save new configuration
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
-            
+
+            # Write to a temp file then rename over the target: atomic on
+            # both NT and POSIX, so readers never see a partial file
+            tmp_path = self.config_path.with_suffix('.json.tmp')
+            if ORJSON_AVAILABLE:
+                with open(tmp_path, 'wb') as f:
+                    f.write(orjson.dumps(self.config, option=orjson.OPT_INDENT_2))
+            else:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self.config, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.config_path)
+
             self.logger.debug("Configuration saved successfully")
-            
+
         except Exception as e:
             self.logger.error(f"Failed to save configuration: {e}")
+
+    def _flush(self):
+        """Write pending configuration changes to disk"""
+        with self._save_lock:
+            self._save_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+        self._save_config()
     
-    def get_config(self) -> Dict[str, Any]:
-        """Get current configuration (copy)"""
-        return self.config.copy()
+    def get_config(self) -> Mapping[str, Any]:
+        """Get current configuration (read-only cached view)"""
+        return self._cached
+
+    def reload(self):
+        """Re-read configuration from disk and atomically swap the cached view"""
+        self._load_config()
+        self.logger.info("Configuration reloaded from disk")
     
     def update_config(self, updates: Dict[str, Any]):
-        """Update configuration with new values"""
+        """Update configuration with new values (persisted with a short debounce)"""
         try:
             self.config.update(updates)
-            self._save_config()
+            self._build_views()
+            with self._save_lock:
+                self._dirty = True
+                if self._save_timer is None:
+                    self._save_timer = threading.Timer(1.0, self._flush)
+                    self._save_timer.daemon = True
+                    self._save_timer.start()
             self.logger.info(f"Configuration updated: {list(updates.keys())}")
         except Exception as e:
             self.logger.error(f"Failed to update configuration: {e}")
     
-    def get_server_config(self) -> Dict[str, Any]:
-        """Get server-related configuration"""
-        return {
-            "server_url": self.config["server_url"],
-            "client_id": self.config["client_id"],
-            "api_key": self.config["api_key"],
-            "poll_interval": self.config["poll_interval"],
-            "max_retries": self.config["max_retries"],
-            "timeout_seconds": self.config["timeout_seconds"]
-        }
+    def get_server_config(self) -> Mapping[str, Any]:
+        """Get server-related configuration (read-only cached view)"""
+        return self._server_view
     
-    def get_api_config(self) -> Dict[str, Any]:
-        """Get local API configuration"""
-        return {
-            "local_api_port": self.config["local_api_port"],
-            "enable_cors": self.config["enable_cors"]
-        }
+    def get_api_config(self) -> Mapping[str, Any]:
+        """Get local API configuration (same cached view as get_config)"""
+        return self._cached
     
-    def get_performance_config(self) -> Dict[str, Any]:
-        """Get performance-related configuration"""
-        return {
-            "max_concurrent_jobs": self.config["max_concurrent_jobs"],
-            "enable_caching": self.config["enable_caching"],
-            "cache_max_size": self.config["cache_max_size"],
-            "enable_burst_mode": self.config["enable_burst_mode"],
-            "burst_duration": self.config["burst_duration"],
-            "burst_interval": self.config["burst_interval"]
-        }
\ No newline at end of file
+    def get_performance_config(self) -> Mapping[str, Any]:
+        """Get performance-related configuration (read-only cached view)"""
+        return self._performance_view
\ No newline at end of file
@@ -8,10 +8,27 @@ import aiohttp
 import logging
 import time
 import json
+from collections import OrderedDict
+from multidict import CIMultiDict, CIMultiDictProxy
 from typing import Dict, Any, Optional
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Sleep schedule for consecutive poll errors; indexed by error count
+_ERROR_BACKOFFS = (0.1, 0.2, 0.4, 0.8, 1.6, 3.2, 5.0)
+
 class JobManager:
     """Manages job polling and processing with ultra-fast response times and retry limits"""
+
+    # Bound on the retry-count table; the LRU eviction keeps maintenance O(1)
+    MAX_RETRY_ENTRIES = 1000
+
+    # Jobs finishing faster than this skip the advisory "processing" update
+    PROCESSING_NOTIFY_DELAY = 0.5
     
     def __init__(self, config: Dict[str, Any], print_executor, printer_manager):
         self.config = config
@@ -24,20 +41,133 @@ class JobManager:
         self.session: Optional[aiohttp.ClientSession] = None
         
         # NEW: Job retry tracking
-        self.job_retry_counts = {}  # job_id -> retry_count
+        # job_id -> retry_count, LRU-bounded so stale entries age out
+        # without a periodic cleanup scan
+        self.job_retry_counts: OrderedDict = OrderedDict()
         self.max_job_retries = 3   # Maximum retries per job
         
         # Performance tracking
         self.total_polls = 0
         self.jobs_processed = 0
         self.jobs_failed_permanently = 0  # NEW: Track permanently failed jobs
-        self.last_successful_contact = 0
+        # Monotonic timestamp: immune to wall-clock jumps
+        self.last_successful_contact = 0.0
         self.consecutive_errors = 0
+
+        # Signalled on healthy/unhealthy transitions so the health
+        # monitor can react immediately instead of on its next wakeup
+        self.health_changed = asyncio.Event()
+        self._last_healthy = True
         
-        # Polling configuration
-        self.poll_interval = config.get('poll_interval', 0.1)  # 100ms default
+        # Polling configuration with adaptive backoff: empty polls double
+        # the interval up to the cap, any received job resets it to base
+        self.base_poll_interval = config.get('poll_interval', 0.1)  # 100ms default
+        self.poll_interval = self.base_poll_interval
+        self.max_poll_interval = 5.0
         self.max_retries = config.get('max_retries', 3)
         self.timeout_seconds = config.get('timeout_seconds', 30)
+
+        # Long polling: ask the server to hold the request open until jobs
+        # arrive (or its timeout fires), collapsing idle round-trips into
+        # one blocked connection. 0 disables and falls back to fast polling.
+        self.long_poll_timeout = config.get('long_poll_timeout', 25)
+
+        # Coalescing status updates: transitions are queued and shipped in
+        # batches by a writer task started alongside the polling loop
+        self._status_queue: Optional[asyncio.Queue] = None
+        self._status_writer_task: Optional[asyncio.Task] = None
+        self._batch_status_supported = True
+
+        # Invariants hoisted out of the polling loop: URLs, params and
+        # headers never change after init, so build them once instead of
+        # re-deriving dicts and f-strings on every poll
+        self._pending_url = f"{config['server_url']}/api/print-jobs/pending/"
+        self._status_url = f"{config['server_url']}/api/print-jobs/status/"
+        self._batch_status_url = f"{config['server_url']}/api/print-jobs/status/batch/"
+
+        self._poll_params = {"client_id": config['client_id']}
+        self._poll_timeout = None
+        if self.long_poll_timeout:
+            self._poll_params['wait'] = str(self.long_poll_timeout)
+            self._poll_timeout = aiohttp.ClientTimeout(
+                total=self.long_poll_timeout + 10, connect=5
+            )
+
+        # Frozen CIMultiDict proxies: aiohttp passes these through without
+        # rebuilding a case-insensitive dict per request
+        poll_headers = CIMultiDict()
+        if config.get('api_key'):
+            poll_headers['X-API-Key'] = config['api_key']
+        status_headers = CIMultiDict(poll_headers)
+        status_headers['Content-Type'] = 'application/json'
+        self._poll_headers = CIMultiDictProxy(poll_headers)
+        self._status_headers = CIMultiDictProxy(status_headers)
+
+        # Persistent worker pool: N workers drain one queue, so Task
+        # allocation happens once at startup instead of per dispatched job
+        self.max_concurrent_jobs = config.get('max_concurrent_jobs', 5)
+        self._job_queue: Optional[asyncio.Queue] = None
+        self._workers = []
+        self._inflight = set()  # job ids queued or printing right now
+
+        # Response-shape extractor: configurable via server_response_format
+        # ('list' or the wrapper key, e.g. 'pending_jobs'); when unset, the
+        # first successful poll detects the shape and locks in a fast path
+        fmt = config.get('server_response_format')
+        self._extract_jobs = self._build_extractor(fmt) if fmt else self._detect_and_extract
+
+    def _build_extractor(self, fmt):
+        """Build a specialized payload -> jobs callable for a known response shape"""
+        if fmt == 'list':
+            return lambda payload: payload if type(payload) is list else None
+
+        def extract(payload, _key=fmt):
+            try:
+                jobs = payload[_key]
+            except TypeError:
+                return None
+            except KeyError:
+                # Some servers omit the jobs key entirely when idle; a
+                # success-shaped dict without it is an empty poll (and
+                # must count as contact), not a malformed response
+                if isinstance(payload, dict) and payload.get('success') is True:
+                    return []
+                return None
+            return jobs if type(jobs) is list else None
+        return extract
+
+    def _detect_and_extract(self, payload):
+        """Normalize an unknown payload shape once, then specialize for next polls"""
+        if isinstance(payload, str):
+            self.logger.error("Server returned string instead of JSON object: %.200s...", payload)
+            return None
+
+        fmt = None
+        jobs = payload
+        if isinstance(payload, dict):
+            for key in ('pending_jobs', 'jobs', 'data'):
+                if key in payload:
+                    jobs = payload[key]
+                    fmt = key
+                    break
+            else:
+                if payload.get('success') is True:
+                    jobs = payload.get('pending_jobs', [])
+                    fmt = 'pending_jobs'
+                else:
+                    # Single job object - wrap in list
+                    jobs = [payload] if 'id' in payload else []
+        else:
+            fmt = 'list'
+
+        if not isinstance(jobs, list):
+            self.logger.error("Expected jobs to be a list, got %s: %s", type(jobs), jobs)
+            return None
+
+        if fmt:
+            # Shape is now known; later polls skip the detection chain
+            self._extract_jobs = self._build_extractor(fmt)
+        return jobs
     
     async def start_processing(self):
         """Start the ultra-fast job processing loop"""
@@ -57,29 +187,64 @@ class JobManager:
             sock_read=10
         )
         
+        # orjson serializes request bodies in C instead of pure Python
+        session_kwargs = {}
+        if ORJSON_AVAILABLE:
+            session_kwargs['json_serialize'] = lambda obj: orjson.dumps(obj).decode()
+
         self.session = aiohttp.ClientSession(
             connector=connector,
             timeout=timeout,
-            headers={'User-Agent': 'WindowsPrintService/1.0'}
+            headers={'User-Agent': 'WindowsPrintService/1.0'},
+            read_bufsize=2 ** 17,  # fewer StreamReader refills on large job lists
+            auto_decompress=True,
+            **session_kwargs
         )
-        
+
+        # Share the session with the executor so content downloads reuse
+        # this keep-alive pool instead of opening their own
+        self.print_executor.set_session(self.session)
+
+        # Start the coalescing status writer
+        self._status_queue = asyncio.Queue()
+        self._status_writer_task = asyncio.create_task(self._status_writer())
+
+        # Start the persistent job workers
+        self._job_queue = asyncio.Queue(maxsize=self.max_concurrent_jobs * 4)
+        self._workers = [
+            asyncio.create_task(self._job_worker())
+            for _ in range(self.max_concurrent_jobs)
+        ]
+
         try:
             self.logger.info("Starting ultra-fast job processing")
-            self.logger.info(f"Poll interval: {self.poll_interval*1000:.0f}ms")
-            self.logger.info(f"Max retries per job: {self.max_job_retries}")
+            self.logger.info("Poll interval: %.0fms", self.poll_interval * 1000)
+            self.logger.info("Max retries per job: %d", self.max_job_retries)
             
             while self.running:
                 try:
                     # Process pending jobs
-                    await self._process_pending_jobs()
-                    
-                    # Clean up old retry counts periodically
-                    if self.total_polls % 1000 == 0:  # Every 1000 polls (~100 seconds)
-                        self._cleanup_old_retry_counts()
-                    
+                    poll_started = time.monotonic()
+                    jobs_found = await self._process_pending_jobs()
+                    poll_elapsed = time.monotonic() - poll_started
+
+                    # Adaptive backoff: idle polls stretch the interval,
+                    # activity snaps it back to the configured base
+                    if jobs_found:
+                        self.poll_interval = self.base_poll_interval
+                    else:
+                        self.poll_interval = min(
+                            self.max_poll_interval, self.poll_interval * 2
+                        )
+
                     # Update metrics
                     self.total_polls += 1
-                    
+
+                    # When the server honoured the long poll it already did
+                    # the waiting for us; reconnect immediately
+                    if self.long_poll_timeout and poll_elapsed >= 1.0:
+                        continue
+
                     # Sleep for poll interval
                     await asyncio.sleep(self.poll_interval)
                     
@@ -87,116 +252,148 @@ class JobManager:
                     break
                 except Exception as e:
                     self.consecutive_errors += 1
-                    self.logger.error(f"Job processing error #{self.consecutive_errors}: {e}")
+                    self._note_health_transition()
+                    self.logger.error("Job processing error #%d: %s", self.consecutive_errors, e)
                     
                     # Exponential backoff on errors (max 5 seconds)
-                    error_sleep = min(5.0, 0.1 * (2 ** min(self.consecutive_errors, 5)))
-                    await asyncio.sleep(error_sleep)
+                    await asyncio.sleep(
+                        _ERROR_BACKOFFS[min(self.consecutive_errors, len(_ERROR_BACKOFFS) - 1)]
+                    )
                     
         finally:
+            for worker in self._workers:
+                worker.cancel()
+            self._workers = []
+            self._job_queue = None
+            self._inflight.clear()
+            if self._status_writer_task:
+                self._status_writer_task.cancel()
+                try:
+                    await self._status_writer_task
+                except (asyncio.CancelledError, Exception):
+                    pass
+                self._status_writer_task = None
+
+                # Ship anything still queued before the session closes: a
+                # dropped terminal status means the server re-dispatches
+                # the job after restart and the document prints twice
+                remaining = []
+                while not self._status_queue.empty():
+                    remaining.append(self._status_queue.get_nowait())
+                self._status_queue = None
+                if remaining and self.session and not self.session.closed:
+                    try:
+                        await asyncio.wait_for(
+                            self._post_status_updates(remaining), timeout=10.0
+                        )
+                        self.logger.info("Flushed %d pending status updates on shutdown", len(remaining))
+                    except Exception as e:
+                        self.logger.warning("Failed to flush %d status updates on shutdown: %s", len(remaining), e)
             if self.session:
+                self.print_executor.set_session(None)
                 await self.session.close()
             self.logger.info("Job processing stopped")
     
     async def _process_pending_jobs(self):
-        """Check for and process pending jobs"""
+        """Check for and process pending jobs
+
+        Returns truthy when jobs were dispatched so the caller's adaptive
+        backoff can reset; any empty/error path falls through falsy.
+        """
         try:
-            # Build request URL and parameters
-            url = f"{self.config['server_url']}/api/print-jobs/pending/"
-            params = {"client_id": self.config['client_id']}
-            headers = {}
-            
-            # Add API key if configured
-            if self.config.get('api_key'):
-                headers['X-API-Key'] = self.config['api_key']
-            
-            # Make the request
-            async with self.session.get(url, params=params, headers=headers) as response:
+            # Make the request with the prebuilt URL/params/headers; the
+            # wait parameter asks the server to long-poll when supported
+            async with self.session.get(
+                self._pending_url,
+                params=self._poll_params,
+                headers=self._poll_headers,
+                timeout=self._poll_timeout
+            ) as response:
+                if response.status == 204:
+                    # Long poll elapsed with no jobs
+                    self.consecutive_errors = 0
+                    self.last_successful_contact = time.monotonic()
+                    self._note_health_transition()
+                    return False
+
                 if response.status == 200:
                     try:
                         # Get response content type
                         content_type = response.headers.get('content-type', '').lower()
                         
                         if 'application/json' in content_type:
-                            jobs = await response.json()
+                            # Read raw bytes once and parse directly; skips
+                            # the charset sniff inside response.json()
+                            raw = await response.read()
+                            jobs = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
                         else:
                             # Not JSON - log the response for debugging
                             text_response = await response.text()
-                            self.logger.warning(f"Server returned non-JSON response (content-type: {content_type}): {text_response[:200]}...")
+                            self.logger.warning("Server returned non-JSON response (content-type: %s): %.200s...", content_type, text_response)
                             return  # Skip processing
                         
-                        # Validate that jobs is a list or dict, not a string
-                        if isinstance(jobs, str):
-                            self.logger.error(f"Server returned string instead of JSON object: {jobs[:200]}...")
-                            return
-                        
-                        # Handle different response formats
-                        if isinstance(jobs, dict):
-                            # If response is wrapped in an object (e.g., {"pending_jobs": [...], "success": true})
-                            if 'pending_jobs' in jobs:
-                                jobs = jobs['pending_jobs']
-                            elif 'jobs' in jobs:
-                                jobs = jobs['jobs']
-                            elif 'data' in jobs:
-                                jobs = jobs['data']
-                            elif jobs.get('success') is True:
-                                # Status response with no jobs - check for pending_jobs field
-                                jobs = jobs.get('pending_jobs', [])
-                            else:
-                                # Single job object - wrap in list
-                                jobs = [jobs] if 'id' in jobs else []
-                        
-                        # Ensure jobs is a list
-                        if not isinstance(jobs, list):
-                            self.logger.error(f"Expected jobs to be a list, got {type(jobs)}: {jobs}")
+                        # Single extractor call replaces the old per-poll
+                        # isinstance/key-probing chain
+                        jobs = self._extract_jobs(jobs)
+                        if jobs is None:
                             return
-                        
+
                         if jobs and len(jobs) > 0:
-                            self.logger.info(f"Raw jobs from server: {jobs}")
+                            # repr of the full job list is expensive; only
+                            # build it when debug logging is on
+                            if self.logger.isEnabledFor(logging.DEBUG):
+                                self.logger.debug("Raw jobs from server: %s", jobs)
                             
                             # Validate job objects
-                            valid_jobs = []
-                            for job in jobs:
-                                if isinstance(job, dict) and 'id' in job:
-                                    valid_jobs.append(job)
-                                else:
-                                    self.logger.warning(f"Invalid job object (missing 'id'): {job}")
+                            valid_jobs = [j for j in jobs if type(j) is dict and 'id' in j]
+                            if len(valid_jobs) != len(jobs):
+                                self.logger.warning("Dropped %d invalid job objects (missing 'id')", len(jobs) - len(valid_jobs))
                             
                             if valid_jobs:
-                                self.logger.info(f"Valid jobs found: {len(valid_jobs)}")
+                                self.logger.info("Valid jobs found: %d", len(valid_jobs))
                                 
                                 # Filter out jobs that have exceeded retry limit
                                 processable_jobs = self._filter_processable_jobs(valid_jobs)
                                 
                                 if processable_jobs:
-                                    self.logger.info(f"Processing {len(processable_jobs)} jobs (filtered from {len(valid_jobs)} pending)")
-                                    
-                                    # Process jobs concurrently for speed
-                                    max_concurrent = self.config.get('max_concurrent_jobs', 5)
-                                    semaphore = asyncio.Semaphore(max_concurrent)
-                                    
-                                    tasks = [
-                                        self._process_single_job_with_semaphore(semaphore, job)
-                                        for job in processable_jobs
-                                    ]
-                                    
-                                    await asyncio.gather(*tasks, return_exceptions=True)
+                                    self.logger.info("Processing %d jobs (filtered from %d pending)", len(processable_jobs), len(valid_jobs))
+
+                                    # Hand the jobs to the worker pool; the
+                                    # in-flight set stops a job the server
+                                    # still lists as pending from being
+                                    # queued twice
+                                    queued = 0
+                                    for job in processable_jobs:
+                                        job_id = job['id']
+                                        if job_id in self._inflight:
+                                            continue
+                                        self._inflight.add(job_id)
+                                        await self._job_queue.put(job)
+                                        queued += 1
+
+                                    # Reset error counter on successful contact
+                                    self.consecutive_errors = 0
+                                    self.last_successful_contact = time.monotonic()
+                                    self._note_health_transition()
+                                    return queued > 0
                                 else:
-                                    self.logger.debug(f"All {len(valid_jobs)} jobs have exceeded retry limit, skipping")
+                                    self.logger.debug("All %d jobs have exceeded retry limit, skipping", len(valid_jobs))
                             else:
-                                self.logger.warning(f"No valid job objects found in response")
+                                self.logger.warning("No valid job objects found in response")
                             
                         # Reset error counter on successful contact
                         self.consecutive_errors = 0
-                        self.last_successful_contact = time.time()
+                        self.last_successful_contact = time.monotonic()
+                        self._note_health_transition()
                         
-                    except json.JSONDecodeError as e:
+                    except ValueError as e:
+                        # Covers json.JSONDecodeError and orjson.JSONDecodeError
                         # Get the raw response for debugging
                         try:
                             raw_text = await response.text()
-                            self.logger.error(f"Invalid JSON response: {e}. Raw response: {raw_text[:500]}...")
+                            self.logger.error("Invalid JSON response: %s. Raw response: %.500s...", e, raw_text)
                         except:
-                            self.logger.error(f"Invalid JSON response: {e}")
+                            self.logger.error("Invalid JSON response: %s", e)
                         
                 elif response.status == 404:
                     # Endpoint not found - server might not be ready
@@ -206,47 +403,52 @@ class JobManager:
                     # Server error - log response for debugging
                     try:
                         error_text = await response.text()
-                        self.logger.error(f"Server error (500): {error_text[:300]}...")
+                        self.logger.error("Server error (500): %.300s...", error_text)
                     except:
                         self.logger.error("Server error (500) - could not read response")
                         
                 else:
                     try:
                         error_text = await response.text()
-                        self.logger.warning(f"Server returned status {response.status}: {error_text[:200]}...")
+                        self.logger.warning("Server returned status %d: %.200s...", response.status, error_text)
                     except:
-                        self.logger.warning(f"Server returned status {response.status}")
+                        self.logger.warning("Server returned status %d", response.status)
                     
         except asyncio.TimeoutError:
             self.logger.warning("Request timeout while checking for jobs")
             
         except aiohttp.ClientError as e:
-            self.logger.warning(f"Network error: {e}")
+            self.logger.warning("Network error: %s", e)
             
         except Exception as e:
             import traceback
-            self.logger.error(f"Unexpected error in job polling: {e}")
-            self.logger.debug(f"Full traceback: {traceback.format_exc()}")
+            self.logger.error("Unexpected error in job polling: %s", e)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Full traceback: %s", traceback.format_exc())
     
     def _filter_processable_jobs(self, jobs: list) -> list:
         """Filter out jobs that have exceeded retry limits"""
-        processable_jobs = []
-        
-        for job in jobs:
-            job_id = job.get('id', 'unknown')
-            current_retry_count = self.job_retry_counts.get(job_id, 0)
-            
-            if current_retry_count < self.max_job_retries:
-                processable_jobs.append(job)
-            else:
-                # Job has exceeded retry limit - mark as permanently failed
-                if current_retry_count == self.max_job_retries:
-                    self.logger.warning(f"Job {job_id} exceeded {self.max_job_retries} retries, marking as permanently failed")
+        retry_counts = self.job_retry_counts
+        limit = self.max_job_retries
+
+        # Common path is a single comprehension; the retry table is usually
+        # empty so the .get() short-circuits fast
+        processable_jobs = [
+            j for j in jobs if retry_counts.get(j.get('id', 'unknown'), 0) < limit
+        ]
+
+        if len(processable_jobs) != len(jobs):
+            # Handle jobs that just crossed the limit in a separate pass so
+            # the hot path above stays branch-free
+            for job in jobs:
+                job_id = job.get('id', 'unknown')
+                if retry_counts.get(job_id, 0) == limit:
+                    self.logger.warning("Job %s exceeded %d retries, marking as permanently failed", job_id, limit)
                     asyncio.create_task(self._mark_job_permanently_failed(job_id))
                     # Increment to prevent repeated logging
-                    self.job_retry_counts[job_id] = current_retry_count + 1
+                    retry_counts[job_id] = limit + 1
                     self.jobs_failed_permanently += 1
-        
+
         return processable_jobs
     
     async def _mark_job_permanently_failed(self, job_id: str):
@@ -255,29 +457,48 @@ class JobManager:
         await self._update_job_status(job_id, "failed", error_message)
         self.logger.error(f"Job {job_id}: {error_message}")
     
-    async def _process_single_job_with_semaphore(self, semaphore: asyncio.Semaphore, job: Dict[str, Any]):
-        """Process a single job with concurrency control"""
-        async with semaphore:
-            await self._process_single_job(job)
+    async def _job_worker(self):
+        """Drain the job queue; one of max_concurrent_jobs persistent workers"""
+        while True:
+            job = await self._job_queue.get()
+            try:
+                await self._process_single_job(job)
+            except Exception as e:
+                self.logger.error("Worker error processing job %s: %s", job.get('id', 'unknown'), e)
+            finally:
+                self._inflight.discard(job.get('id'))
+                self._job_queue.task_done()
     
     async def _process_single_job(self, job: Dict[str, Any]):
         """Process a single print job with retry tracking"""
         job_id = job.get('id', 'unknown')
-        start_time = time.time()
+        start_time = time.monotonic()
         
-        # Track retry attempt
+        # Track retry attempt; move-to-end keeps the table LRU-ordered so
+        # eviction only ever drops the coldest entry
         current_retry = self.job_retry_counts.get(job_id, 0)
         self.job_retry_counts[job_id] = current_retry + 1
+        self.job_retry_counts.move_to_end(job_id)
+        if len(self.job_retry_counts) > self.MAX_RETRY_ENTRIES:
+            self.job_retry_counts.popitem(last=False)
         
         try:
             retry_info = f" (attempt {current_retry + 1}/{self.max_job_retries})" if current_retry > 0 else ""
-            self.logger.info(f"Processing job {job_id}{retry_info}")
+            self.logger.info("Processing job %s%s", job_id, retry_info)
             
-            # Update job status to processing
-            await self._update_job_status(job_id, "processing")
-            
-            # Execute the print job
-            success = await self.print_executor.execute_print_job(job)
+            # Defer the advisory "processing" update: fast prints finish
+            # before the timer fires and go straight to "completed",
+            # halving the status traffic for the common case
+            processing_timer = asyncio.get_running_loop().call_later(
+                self.PROCESSING_NOTIFY_DELAY,
+                self._notify_processing, job_id
+            )
+
+            try:
+                # Execute the print job
+                success = await self.print_executor.execute_print_job(job)
+            finally:
+                processing_timer.cancel()
             
             if success:
                 # Job succeeded - remove from retry tracking and mark completed
@@ -285,9 +506,9 @@ class JobManager:
                 await self._update_job_status(job_id, "completed")
                 
                 # Log completion with timing
-                processing_time = (time.time() - start_time) * 1000
+                processing_time = (time.monotonic() - start_time) * 1000
                 success_info = f" (succeeded after {current_retry + 1} attempts)" if current_retry > 0 else ""
-                self.logger.info(f"Job {job_id} completed in {processing_time:.0f}ms{success_info}")
+                self.logger.info("Job %s completed in %.0fms%s", job_id, processing_time, success_info)
                 
                 # Update metrics
                 self.jobs_processed += 1
@@ -300,17 +521,17 @@ class JobManager:
                     await self._update_job_status(job_id, "failed", error_message)
                     self.jobs_failed_permanently += 1
                     
-                    processing_time = (time.time() - start_time) * 1000
+                    processing_time = (time.monotonic() - start_time) * 1000
                     self.logger.error(f"Job {job_id} permanently failed after {self.max_job_retries} attempts ({processing_time:.0f}ms)")
                 else:
                     # Will retry - don't update status yet, just log
-                    processing_time = (time.time() - start_time) * 1000
+                    processing_time = (time.monotonic() - start_time) * 1000
                     next_attempt = self.job_retry_counts[job_id] + 1
                     self.logger.warning(f"Job {job_id} failed (attempt {self.job_retry_counts[job_id]}/{self.max_job_retries}) - will retry as attempt {next_attempt} ({processing_time:.0f}ms)")
             
         except Exception as e:
             # Exception during processing - still counts as a retry attempt
-            processing_time = (time.time() - start_time) * 1000
+            processing_time = (time.monotonic() - start_time) * 1000
             
             if self.job_retry_counts[job_id] >= self.max_job_retries:
                 # Max retries reached
@@ -323,76 +544,100 @@ class JobManager:
                 next_attempt = self.job_retry_counts[job_id] + 1
                 self.logger.error(f"Job {job_id} failed with exception (attempt {self.job_retry_counts[job_id]}/{self.max_job_retries}): {e} - will retry as attempt {next_attempt} ({processing_time:.0f}ms)")
     
-    def _cleanup_old_retry_counts(self):
-        """Clean up retry counts for jobs that are no longer in the system"""
-        # This is a simple cleanup - in a production system you might want to
-        # track job timestamps and clean up based on age
-        if len(self.job_retry_counts) > 1000:  # Arbitrary limit
-            # Keep only the most recent 500 entries
-            items = list(self.job_retry_counts.items())
-            self.job_retry_counts = dict(items[-500:])
-            self.logger.debug(f"Cleaned up old retry counts, keeping {len(self.job_retry_counts)} entries")
-    
+    def _notify_processing(self, job_id: str):
+        """Timer callback: report "processing" for a job that is taking a while"""
+        task = asyncio.create_task(self._update_job_status(job_id, "processing"))
+        task.add_done_callback(self._log_status_task_error)
+
+    def _log_status_task_error(self, task: asyncio.Task):
+        """Surface exceptions from fire-and-forget status updates"""
+        if not task.cancelled() and task.exception():
+            self.logger.warning(f"Background status update failed: {task.exception()}")
+
     async def _update_job_status(self, job_id: str, status: str, error: Optional[str] = None):
-        """Update job status on the server with retry logic"""
+        """Queue a job status update for the coalescing writer
+
+        Individual transitions used to pay a full HTTP POST (plus retries)
+        each; the writer task drains the queue every ~20ms and ships one
+        batched request instead.
+        """
+        data = {
+            "job_id": job_id,
+            "status": status,
+            "error": error,
+            "client_id": self.config['client_id'],
+            "timestamp": time.time()
+        }
+
+        # NEW: Add retry information for failed jobs
+        if status == "failed" and job_id in self.job_retry_counts:
+            data["retry_count"] = self.job_retry_counts[job_id]
+            data["max_retries"] = self.max_job_retries
+
+        if self._status_queue is not None:
+            self._status_queue.put_nowait(data)
+        else:
+            # Writer not running (e.g. shutdown path) - post directly
+            await self._post_status_updates([data])
+
+    async def _status_writer(self):
+        """Drain queued status updates and POST them as coalesced batches"""
+        while True:
+            # Block for the first update, then briefly collect the burst
+            batch = [await self._status_queue.get()]
+            try:
+                await asyncio.sleep(0.02)
+            except asyncio.CancelledError:
+                # Cancelled mid-window: hand the popped update back so
+                # the shutdown drain ships it with the rest
+                self._status_queue.put_nowait(batch[0])
+                raise
+
+            while len(batch) < 64:
+                try:
+                    batch.append(self._status_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            await self._post_status_updates(batch)
+
+    async def _post_status_updates(self, updates: list):
+        """POST a batch of status updates with retry logic
+
+        Uses the batch endpoint when the server provides one and falls back
+        to per-item posts against the legacy endpoint on 404.
+        """
+        headers = self._status_headers
+
         for attempt in range(self.max_retries):
             try:
-                url = f"{self.config['server_url']}/api/print-jobs/status/"
-                data = {
-                    "job_id": job_id,
-                    "status": status,
-                    "error": error,
-                    "client_id": self.config['client_id'],
-                    "timestamp": time.time()
-                }
-                
-                # NEW: Add retry information for failed jobs
-                if status == "failed" and job_id in self.job_retry_counts:
-                    data["retry_count"] = self.job_retry_counts[job_id]
-                    data["max_retries"] = self.max_job_retries
-                
-                headers = {'Content-Type': 'application/json'}
-                if self.config.get('api_key'):
-                    headers['X-API-Key'] = self.config['api_key']
-                
-                async with self.session.post(url, json=data, headers=headers) as response:
-                    if response.status in [200, 201]:
-                        self.logger.debug(f"Updated job {job_id} status to {status}")
-                        return
-                    else:
-                        self.logger.warning(f"Status update failed with status {response.status}")
-                        
+                if self._batch_status_supported:
+                    async with self.session.post(self._batch_status_url, json=updates, headers=headers) as response:
+                        if response.status in [200, 201]:
+                            self.logger.debug(f"Posted batch of {len(updates)} status updates")
+                            return
+                        elif response.status == 404:
+                            # Server predates the batch endpoint
+                            self._batch_status_supported = False
+                            self.logger.info("Batch status endpoint not available, using per-job updates")
+                        else:
+                            self.logger.warning(f"Batch status update failed with status {response.status}")
+                            continue
+
+                if not self._batch_status_supported:
+                    for data in updates:
+                        async with self.session.post(self._status_url, json=data, headers=headers) as response:
+                            if response.status not in [200, 201]:
+                                self.logger.warning(f"Status update failed with status {response.status}")
+                    return
+
             except Exception as e:
                 if attempt == self.max_retries - 1:
-                    self.logger.error(f"Failed to update job status after {self.max_retries} attempts: {e}")
+                    self.logger.error(f"Failed to post status updates after {self.max_retries} attempts: {e}")
                 else:
                     # Progressive delay between retries
                     await asyncio.sleep(0.5 * (attempt + 1))
     
-    # Burst mode for ultra-fast response
-    async def trigger_burst_mode(self, duration: float = 5.0):
-        """Trigger burst mode for ultra-fast polling"""
-        try:
-            self.logger.info(f"Activating burst mode for {duration} seconds")
-            
-            # Save current poll interval
-            original_interval = self.poll_interval
-            
-            # Set burst interval
-            burst_interval = self.config.get('burst_interval', 0.05)  # 50ms
-            self.poll_interval = burst_interval
-            
-            # Wait for burst duration
-            await asyncio.sleep(duration)
-            
-            # Restore original interval
-            self.poll_interval = original_interval
-            
-            self.logger.info("Burst mode deactivated")
-            
-        except Exception as e:
-            self.logger.error(f"Burst mode error: {e}")
-    
     # NEW: Method to manually reset retry count for a job (if needed)
     def reset_job_retry_count(self, job_id: str):
         """Reset retry count for a specific job"""
@@ -405,7 +650,7 @@ class JobManager:
     # Status and health monitoring
     def is_healthy(self) -> bool:
         """Check if job manager is healthy"""
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Consider unhealthy if no contact with server for 2 minutes
         if current_time - self.last_successful_contact > 120:
@@ -417,10 +662,26 @@ class JobManager:
         
         return True
     
+    def _note_health_transition(self):
+        """Signal the health event when is_healthy() flips"""
+        healthy = self.is_healthy()
+        if healthy != self._last_healthy:
+            self._last_healthy = healthy
+            self.health_changed.set()
+    
     def get_status(self) -> Dict[str, Any]:
         """Get comprehensive job manager status"""
-        current_time = time.time()
-        
+        if self.last_successful_contact:
+            seconds_since_contact = time.monotonic() - self.last_successful_contact
+            # Report contact time on the wall clock for consumers even
+            # though it is tracked monotonically
+            last_contact = time.time() - seconds_since_contact
+        else:
+            # Never contacted: keep the unambiguous sentinels rather than
+            # reconstructing a wall-clock time near machine boot
+            seconds_since_contact = None
+            last_contact = 0
+
         return {
             "running": self.running,
             "poll_interval_ms": self.poll_interval * 1000,
@@ -429,8 +690,8 @@ class JobManager:
             "jobs_failed_permanently": self.jobs_failed_permanently,  # NEW
             "jobs_being_retried": len(self.job_retry_counts),  # NEW
             "max_job_retries": self.max_job_retries,  # NEW
-            "last_successful_contact": self.last_successful_contact,
-            "seconds_since_contact": current_time - self.last_successful_contact,
+            "last_successful_contact": last_contact,
+            "seconds_since_contact": seconds_since_contact,
             "consecutive_errors": self.consecutive_errors,
             "healthy": self.is_healthy(),
             "server_url": self.config['server_url'],
@@ -439,7 +700,7 @@ class JobManager:
     
     def get_performance_metrics(self) -> Dict[str, Any]:
         """Get performance metrics"""
-        uptime = time.time() - self.last_successful_contact if self.last_successful_contact > 0 else 0
+        uptime = time.monotonic() - self.last_successful_contact if self.last_successful_contact > 0 else 0
         polls_per_second = self.total_polls / uptime if uptime > 0 else 0
         
         # NEW: Calculate success rate including permanent failures
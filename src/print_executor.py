@@ -4,17 +4,320 @@ Optimized for fast performance with concurrent multi-printer support
 """
 
 import os
+import re
+import json
+import hashlib
+import shutil
 import subprocess
 import tempfile
 import base64
+import binascii
 import asyncio
 import logging
 import time
 import aiohttp
-import aiofiles
+import operator
+from collections import OrderedDict
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
+# Resolve the Python PDF library once at import time. The per-call import
+# chains and per-page hasattr probes cost thousands of attribute lookups on
+# large documents; binding the classes here turns hot-loop dispatch into
+# plain local lookups. pypdf (the maintained successor, faster xref
+# handling) is preferred; the legacy forks are fallbacks.
+try:
+    import pypdf as _pdf_lib
+except ImportError:
+    try:
+        import PyPDF2 as _pdf_lib
+    except ImportError:
+        try:
+            import PyPDF4 as _pdf_lib
+        except ImportError:
+            _pdf_lib = None
+
+if _pdf_lib is not None:
+    _PDF_READER_CLS = getattr(_pdf_lib, 'PdfReader', None) or _pdf_lib.PdfFileReader
+    _PDF_WRITER_CLS = getattr(_pdf_lib, 'PdfWriter', None) or _pdf_lib.PdfFileWriter
+    _PDF_ADD_PAGE = getattr(_PDF_WRITER_CLS, 'add_page', None) or _PDF_WRITER_CLS.addPage
+    # True for the modern reader API (.pages / .rotate); the legacy
+    # getPage/rotateClockwise spellings only exist on old PyPDF2/PyPDF4
+    _PDF_NEW_API = hasattr(_pdf_lib, 'PdfReader')
+else:
+    _PDF_READER_CLS = _PDF_WRITER_CLS = _PDF_ADD_PAGE = None
+    _PDF_NEW_API = False
+
+if _PDF_NEW_API:
+    _open_pdf_reader = _PDF_READER_CLS
+elif _PDF_READER_CLS is not None:
+    def _open_pdf_reader(stream):
+        # The legacy readers default to strict=True, which runs integrity
+        # checks (and raises on recoverable damage) that nothing here
+        # needs; pypdf is already lenient by default
+        return _PDF_READER_CLS(stream, strict=False)
+else:
+    _open_pdf_reader = None
+
+# Bound once: availability of any Python PDF backend never changes at
+# runtime, so callers read a constant instead of re-probing imports
+_PYTHON_PDF_AVAILABLE = _PDF_READER_CLS is not None
+
+# pikepdf wraps the C++ QPDF library and rewrites PDFs 10-50x faster than
+# the pure-Python readers above; used for cropping when installed
+try:
+    import pikepdf
+    PIKEPDF_AVAILABLE = True
+except ImportError:
+    PIKEPDF_AVAILABLE = False
+
+# pybase64 binds a SIMD (AVX2/AVX-512) base64 codec that decodes at
+# near-memcpy speed; stdlib binascii is the scalar fallback
+try:
+    import pybase64
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    PYBASE64_AVAILABLE = False
+
+if PYBASE64_AVAILABLE:
+    def _b64decode_chunk(data):
+        return pybase64.b64decode(data, validate=False)
+else:
+    _b64decode_chunk = binascii.a2b_base64
+
+# Accepted job content types; frozenset membership is hashed and the
+# constant is built once instead of a fresh list per validation
+_VALID_CONTENT_TYPES = frozenset(('pdf', 'base64_pdf', 'url', 'file'))
+
+# Matches the page count line in pdftk dump_data output; searching the
+# raw bytes in one C-level pass beats decoding and line-splitting a dump
+# that can carry thousands of bookmark records
+_PDFTK_PAGES_RE = re.compile(rb'^NumberOfPages:\s*(\d+)', re.MULTILINE)
+
+# Tokens needed to walk startxref -> trailer -> /Root -> /Pages -> /Count
+# without parsing the rest of the document
+_XREF_STARTXREF_RE = re.compile(rb'startxref\s+(\d+)')
+_XREF_ROOT_RE = re.compile(rb'/Root\s+(\d+)\s+\d+\s+R')
+_XREF_PREV_RE = re.compile(rb'/Prev\s+(\d+)')
+_XREF_PAGES_RE = re.compile(rb'/Pages\s+(\d+)\s+\d+\s+R')
+_XREF_COUNT_RE = re.compile(rb'/Count\s+(\d+)')
+
+# Linearized (web-optimized) PDFs record the page count as /N in the
+# linearization dictionary inside the first KB of the file
+_LINEARIZED_N_RE = re.compile(rb'/Linearized[^>]*?/N\s+(\d+)', re.DOTALL)
+
+# Download client defaults, built once: ClientTimeout and the headers
+# dict were being reconstructed on every URL job
+_DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=15, connect=5)
+_DOWNLOAD_HEADERS = {'User-Agent': 'WindowsPrintService/1.0'}
+
+# Sumatra flags per scaling mode; a table lookup replaces the ~8-way
+# string-comparison chain (custom_NN and the auto-scale default are the
+# only shapes that still need code)
+_SCALING_FLAGS = {
+    'fit_to_paper_enhanced': ('scale=noscale', 'autorotate=yes', 'center=yes'),
+    'fit_to_paper': ('scale=noscale', 'autorotate=yes'),
+    'fit_to_paper_force': ('scale=fit', 'autorotate=yes'),
+    'shrink_to_fit': ('scale=shrink',),
+    'actual_size': ('scale=none',),
+    'none': ('scale=none',),
+    'no_scale': ('scale=noscale',)
+}
+
+@lru_cache(maxsize=256)
+def _build_sumatra_settings(copies: int, orientation: str, scaling_mode: str, auto_scale: bool) -> str:
+    """Compose the -print-settings argument for one settings shape
+
+    Fleets print thousands of jobs with a handful of distinct settings
+    combinations; memoizing the joined string removes the list build and
+    branch chain from every job after the first of each shape.
+    """
+    print_settings = []
+
+    if copies > 1:
+        print_settings.append(f"copies={copies}")
+
+    if orientation == 'landscape':
+        print_settings.append("orientation=landscape")
+    elif orientation == 'portrait':
+        print_settings.append("orientation=portrait")
+
+    if scaling_mode in ('fit_to_paper', 'fit_to_paper_enhanced'):
+        print_settings.append("duplex=off")
+
+    flags = _SCALING_FLAGS.get(scaling_mode)
+    if flags is not None:
+        print_settings.extend(flags)
+    elif scaling_mode.startswith('custom_'):
+        try:
+            scale_percent = int(scaling_mode.split('_')[1])
+            if 10 <= scale_percent <= 500:
+                print_settings.append(f"scale={scale_percent}%")
+            else:
+                print_settings.append("scale=noscale")
+        except (ValueError, IndexError):
+            print_settings.append("scale=noscale")
+    elif auto_scale:
+        print_settings.append("scale=shrink")
+
+    return ",".join(print_settings)
+
+# Paper dimensions in PostScript points, shared by the orientation and
+# fit-to-paper pipelines
+_PAPER_SIZES = {
+    'letter': (612, 792),
+    'a4': (595, 842),
+    'legal': (612, 1008),
+    'a3': (842, 1191),
+    'tabloid': (792, 1224)
+}
+
+# Tool discovery candidates, fixed per process: building them per finder
+# invocation re-ran expanduser and path joins for identical results
+_SUMATRA_CANDIDATES = (
+    r"C:\Program Files\SumatraPDF\SumatraPDF.exe",
+    r"C:\Program Files (x86)\SumatraPDF\SumatraPDF.exe",
+    os.path.join(os.path.expanduser("~"), "AppData", "Local", "SumatraPDF", "SumatraPDF.exe"),
+    Path(__file__).parent / "tools" / "SumatraPDF.exe"
+)
+_ADOBE_CANDIDATES = (
+    r"C:\Program Files (x86)\Adobe\Acrobat Reader DC\Reader\AcroRd32.exe",
+    r"C:\Program Files\Adobe\Acrobat Reader DC\Reader\AcroRd32.exe",
+    r"C:\Program Files (x86)\Adobe\Reader 11.0\Reader\AcroRd32.exe",
+    r"C:\Program Files\Adobe\Reader 11.0\Reader\AcroRd32.exe"
+)
+_PDFTK_CANDIDATES = (
+    r"C:\Program Files (x86)\PDFtk\bin\pdftk.exe",
+    r"C:\Program Files\PDFtk\bin\pdftk.exe",
+    "pdftk.exe"
+)
+
+class _CropCache:
+    """Bounded on-disk LRU of cropped PDFs keyed by content hash + settings
+
+    Re-prints and multi-copy runs hit the cache and skip the whole PDF
+    parse/serialize; entries are evicted (and unlinked) oldest-first.
+    """
+
+    def __init__(self, max_entries: int = 100):
+        self.max_entries = max_entries
+        self.cache_dir = os.path.join(tempfile.gettempdir(), "print_crop_cache")
+        self._entries: OrderedDict = OrderedDict()  # key -> file path
+        self._lock = asyncio.Lock()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Return cached cropped bytes for key, or None"""
+        async with self._lock:
+            path = self._entries.get(key)
+            if path is None:
+                return None
+            self._entries.move_to_end(key)
+        try:
+            # One executor hop for the whole read; aiofiles would pay a
+            # thread hop per call on what is a single bulk slurp
+            return await asyncio.to_thread(Path(path).read_bytes)
+        except OSError:
+            # Entry vanished (temp cleanup); drop it
+            async with self._lock:
+                self._entries.pop(key, None)
+            return None
+
+    async def put(self, key: str, content: bytes):
+        """Store cropped bytes under key, evicting the coldest entries"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = os.path.join(self.cache_dir, key + ".pdf")
+            await asyncio.to_thread(Path(path).write_bytes, content)
+        except OSError:
+            return
+
+        async with self._lock:
+            self._entries[key] = path
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                _, old_path = self._entries.popitem(last=False)
+                try:
+                    os.unlink(old_path)
+                except OSError:
+                    pass
+
+class _B64Stream:
+    """Incremental base64 decoder holding a sub-4-byte residual
+
+    feed() decodes every complete 4-char group in the data seen so far
+    and keeps the remainder, so callers can push arbitrary slices (or a
+    whole payload chunk-by-chunk) without re-decoding earlier bytes;
+    finish() drains the padded tail. Whitespace is stripped per chunk,
+    which keeps group alignment exact for MIME-wrapped payloads.
+    """
+
+    __slots__ = ('_residual',)
+    _WS = b' \t\r\n'
+
+    def __init__(self):
+        self._residual = b''
+
+    def feed(self, chunk) -> bytes:
+        """Decode the complete groups in chunk (plus any residual)"""
+        if not isinstance(chunk, (bytes, bytearray)):
+            chunk = bytes(chunk)
+        if (b'\n' in chunk or b'\r' in chunk or b' ' in chunk or b'\t' in chunk):
+            chunk = chunk.translate(None, self._WS)
+        if self._residual:
+            chunk = self._residual + chunk
+        cut = len(chunk) & ~3
+        self._residual = bytes(chunk[cut:])
+        if not cut:
+            return b''
+        return _b64decode_chunk(chunk if cut == len(chunk) else chunk[:cut])
+
+    def finish(self) -> bytes:
+        """Decode whatever tail remains after the final feed"""
+        residual, self._residual = self._residual, b''
+        return _b64decode_chunk(residual) if residual else b''
+
+class _ExecSettings:
+    """Slotted snapshot of the hot print settings
+
+    _execute_print and the preprocessing stages read the same handful of
+    keys repeatedly; each dict.get hashes its string key, while a slotted
+    attribute read is a fixed-offset fetch. Unpacked once per job.
+    """
+
+    __slots__ = ('scaling', 'force_orientation', 'rotation', 'orientation', 'paper_size')
+
+    def __init__(self, settings: Dict[str, Any]):
+        self.scaling = settings.get('scaling', 'auto_scale').lower()
+        self.force_orientation = settings.get('force_orientation', False)
+        self.rotation = settings.get('rotation', 0)
+        self.orientation = settings.get('orientation', 'portrait').lower()
+        self.paper_size = settings.get('paper_size', 'letter').lower()
+
+class _PdfBuffer:
+    """In-memory PDF content that materializes to a temp file on demand
+
+    Lets the extract/crop pipeline pass bytes between stages and only
+    touch the filesystem when a subprocess tool needs a real filename.
+    """
+
+    def __init__(self, content: bytes, prefix: str = "pdfbuf_"):
+        self.content = content
+        self.prefix = prefix
+        self._path: Optional[str] = None
+
+    def materialize(self) -> str:
+        """Write the buffer to a temp file (once) and return its path"""
+        if self._path is None:
+            tmp = tempfile.NamedTemporaryFile(
+                suffix='.pdf', delete=False, prefix=self.prefix
+            )
+            tmp.write(self.content)
+            tmp.close()
+            self._path = tmp.name
+        return self._path
+
 class PrintExecutor:
     """Executes print jobs with optimized performance and concurrent multi-printer support"""
     
@@ -27,8 +330,53 @@ class PrintExecutor:
         'initialized': False
     }
     
-    # Class-level semaphore for concurrent print job limit
-    _print_semaphore = asyncio.Semaphore(10)  # Max 10 concurrent prints
+    # Global cap on concurrent prints (bounds process handles/spoolers)
+    _print_semaphore = asyncio.BoundedSemaphore(10)
+
+    # Per-printer semaphores, lazily created: each physical queue only
+    # takes a couple of jobs at a time, but throughput scales with the
+    # number of attached printers instead of a single global gate
+    _printer_semaphores: Dict[str, asyncio.Semaphore] = {}
+    PER_PRINTER_CONCURRENCY = 2
+
+    # Seconds an availability answer stays trusted before re-asking the
+    # spooler (failures invalidate immediately)
+    PRINTER_AVAILABLE_TTL = 5.0
+
+    # Largest PDF kept in memory alongside its temp file (bytes); bigger
+    # documents are re-read from disk by the stages that need them
+    CONTENT_BYTES_LIMIT = 8 * 1024 * 1024
+
+    # Entries kept in the prepared-PDF dedup cache (label/shipping jobs
+    # routinely re-send the identical document)
+    PREPARED_CACHE_ENTRIES = 32
+    
+    # Shared cache of cropped PDFs (re-prints skip the crop entirely)
+    _crop_cache = _CropCache()
+
+    # Temp files queue here and a single background task batch-unlinks
+    # them off-loop; deletion never sits on a job's critical path
+    _cleanup_queue: asyncio.Queue = asyncio.Queue()
+    _cleanup_task: Optional[asyncio.Task] = None
+
+    # Cap on assignments a multi-printer job runs at once; bounds the
+    # per-assignment preparation stages (crop/extract run ahead of the
+    # print semaphore) so a 50-printer job cannot start 50 pipelines
+    MULTI_DISPATCH_CONCURRENCY = 10
+
+    # Ceiling on one assignment within a multi-printer job; a wedged
+    # driver then costs one failed printer, not a job that never returns
+    MULTI_PRINT_TIMEOUT = 120
+
+    # Page counts keyed by content fingerprint rather than path, so a
+    # re-downloaded document landing in a fresh temp file still hits
+    _page_count_by_hash: OrderedDict = OrderedDict()
+    PAGE_COUNT_HASH_ENTRIES = 256
+
+    # Each Ghostscript process costs 30-80ms of startup and >100MB RSS;
+    # capping concurrent interpreters keeps a burst of jobs from
+    # spawning one per job while the rest of the pipeline proceeds
+    _gs_semaphore = asyncio.Semaphore(2)
     
     def __init__(self, printer_manager):
         self.printer_manager = printer_manager
@@ -38,6 +386,53 @@ class PrintExecutor:
         self.jobs_processed = 0
         self.successful_jobs = 0
         self.total_processing_time = 0.0
+
+        # Shared HTTP session (provided by JobManager); standalone use
+        # lazily builds an owned pooled session instead
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._owned_session: Optional[aiohttp.ClientSession] = None
+
+        # Page-count memo keyed by (path, mtime); orientation jobs ask for
+        # the count of the same file more than once per pipeline
+        self._page_count_cache: OrderedDict = OrderedDict()
+        self._page_count_lock = asyncio.Lock()
+
+        # Crop dispatch: one dict lookup replaces the per-call if/elif
+        # chain; the 'auto' branch memoizes its inference per settings
+        # shape since sibling jobs repeat the same shape
+        self._crop_dispatch = {
+            'keep_top': self._crop_keep_top,
+            'keep_bottom': self._crop_keep_bottom,
+            'custom': self._crop_custom
+        }
+        self._inferred_crop_handlers: Dict[tuple, Any] = {}
+
+        # Short-TTL memo of spooler availability checks; batches hitting
+        # one printer would otherwise query the spooler per job
+        self._printer_available_cache: Dict[str, tuple] = {}
+
+        # Bytes of recently prepared PDFs, keyed by temp path: the Python
+        # stages re-read the file they were handed, and for small jobs the
+        # content is already in memory from the download
+        self._content_bytes: Dict[str, bytes] = {}
+
+        # Prepared-PDF dedup: sha256 of the source payload -> cache-owned
+        # file; hits hand out a hard link and skip the decode entirely
+        self._prepared_cache: OrderedDict = OrderedDict()
+
+        # Overwritten by _select_preferred_tool once discovery settles
+        self._page_extraction_method = "python_builtin"
+
+        # Last performance-stats payload and the counter state it was
+        # built from; scrape endpoints re-read unchanged stats far more
+        # often than jobs complete
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        self._stats_cache_key = None
+
+        # Long-lived Ghostscript interpreter for page counting; queries
+        # go over its stdin so repeat counts skip process startup
+        self._gs_count_process = None
+        self._gs_count_lock = asyncio.Lock()
         
         # Initialize tools asynchronously if not already done
         if not PrintExecutor._tool_cache['initialized']:
@@ -52,9 +447,152 @@ class PrintExecutor:
             if self.logger.isEnabledFor(logging.INFO):
                 self.logger.info(f"Print executor initialized (cached) with tool: {self.preferred_tool or 'system default'}")
     
+    @classmethod
+    def _get_printer_semaphore(cls, printer_name: Optional[str]) -> asyncio.Semaphore:
+        """Get (or lazily create) the concurrency gate for one printer queue"""
+        key = (printer_name or '').lower()
+        semaphore = cls._printer_semaphores.get(key)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(cls.PER_PRINTER_CONCURRENCY)
+            cls._printer_semaphores[key] = semaphore
+        return semaphore
+
+    def set_session(self, session: Optional[aiohttp.ClientSession]):
+        """Adopt a shared aiohttp session for content downloads"""
+        self._session = session
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, or a lazily-built owned pool
+
+        Standalone use (no JobManager) previously built and tore down a
+        ClientSession per download, discarding keep-alive connections,
+        the DNS cache and TLS tickets every job. The owned session is
+        created once and reused until close().
+        """
+        if self._session is not None and not self._session.closed:
+            return self._session
+        if self._owned_session is None or self._owned_session.closed:
+            self._owned_session = aiohttp.ClientSession(
+                timeout=_DOWNLOAD_TIMEOUT,
+                headers=_DOWNLOAD_HEADERS,
+                connector=aiohttp.TCPConnector(
+                    limit=10,
+                    # Most deployments pull every PDF from one origin;
+                    # browsers cap at ~6 per host, and an uncapped burst
+                    # of 10 sockets trips server-side rate limiting
+                    limit_per_host=4,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=30,
+                    enable_cleanup_closed=True
+                )
+            )
+        return self._owned_session
+
+    async def close(self):
+        """Release the owned HTTP session (shared sessions stay untouched)"""
+        if self._owned_session is not None and not self._owned_session.closed:
+            await self._owned_session.close()
+        self._owned_session = None
+        self._shutdown_gs_count_daemon()
+
+    @staticmethod
+    async def _gather_guarded(coros):
+        """Run coroutines concurrently, returning exceptions in place of results
+
+        Uses asyncio.TaskGroup on Python 3.11+ (lighter task bookkeeping
+        than gather); each coroutine is guarded so one failure never
+        cancels its siblings, preserving return_exceptions semantics.
+        """
+        if hasattr(asyncio, 'TaskGroup'):
+            async def guard(coro):
+                try:
+                    return await coro
+                except Exception as e:
+                    return e
+
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(guard(c)) for c in coros]
+            return [t.result() for t in tasks]
+        return await asyncio.gather(*coros, return_exceptions=True)
+
+    # Persisted tool-path cache version; bump when the discovery logic or
+    # candidate list changes
+    _TOOL_CACHE_VERSION = 2
+
+    @staticmethod
+    def _tool_cache_path() -> str:
+        """Location of the persisted tool-path cache"""
+        base = os.environ.get('LOCALAPPDATA', tempfile.gettempdir())
+        return os.path.join(base, "WindowsPrintService", "tool_cache.json")
+
+    async def _load_persistent_tool_cache(self) -> bool:
+        """Load cached tool paths from disk; True when usable
+
+        Entries are revalidated with a stat per path, which is far cheaper
+        than re-running the --version subprocess probes.
+        """
+        try:
+            cache_path = self._tool_cache_path()
+            if not os.path.exists(cache_path):
+                return False
+
+            raw = await asyncio.to_thread(Path(cache_path).read_bytes)
+            cached = json.loads(raw)
+
+            if cached.get('version') != self._TOOL_CACHE_VERSION:
+                return False
+
+            # A cached path that disappeared invalidates the whole cache so
+            # discovery can find a replacement install
+            for tool in ('sumatra', 'adobe', 'pdftk', 'ghostscript'):
+                path = cached.get(tool)
+                if path and not os.path.exists(path) and os.sep in path:
+                    return False
+
+            self.sumatra_path = cached.get('sumatra')
+            self.adobe_path = cached.get('adobe')
+            self.pdftk_path = cached.get('pdftk')
+            self.ghostscript_path = cached.get('ghostscript')
+            return True
+
+        except Exception as e:
+            self.logger.debug(f"Tool cache load failed: {e}")
+            return False
+
+    async def _save_persistent_tool_cache(self):
+        """Persist discovered tool paths for the next process start"""
+        try:
+            cache_path = self._tool_cache_path()
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            payload = json.dumps({
+                'version': self._TOOL_CACHE_VERSION,
+                'sumatra': self.sumatra_path,
+                'adobe': self.adobe_path,
+                'pdftk': self.pdftk_path,
+                'ghostscript': self.ghostscript_path
+            })
+            await asyncio.to_thread(Path(cache_path).write_text, payload)
+        except Exception as e:
+            self.logger.debug(f"Tool cache save failed: {e}")
+
     async def _initialize_tools(self):
         """Asynchronously initialize all tools in parallel"""
         try:
+            # Fast path: reuse last run's discovery, skipping the exists()
+            # sweeps and --version subprocess probes entirely
+            if await self._load_persistent_tool_cache():
+                PrintExecutor._tool_cache.update({
+                    'sumatra': self.sumatra_path,
+                    'adobe': self.adobe_path,
+                    'pdftk': self.pdftk_path,
+                    'ghostscript': self.ghostscript_path,
+                    'initialized': True
+                })
+                self.preferred_tool = self._select_preferred_tool()
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info(f"Print executor initialized from tool cache with tool: {self.preferred_tool or 'system default'}")
+                return
+
             results = await asyncio.gather(
                 self._find_sumatra_pdf_async(),
                 self._find_adobe_reader_async(),
@@ -77,113 +615,145 @@ class PrintExecutor:
             })
             
             self.preferred_tool = self._select_preferred_tool()
-            
+
+            await self._save_persistent_tool_cache()
+
             if self.logger.isEnabledFor(logging.INFO):
                 self.logger.info(f"Print executor initialized with tool: {self.preferred_tool or 'system default'}")
                 
         except Exception as e:
             self.logger.error(f"Tool initialization error: {e}")
     
+    @staticmethod
+    async def _first_existing_path(possible_paths) -> Optional[str]:
+        """Stat all candidate paths concurrently; return the first hit
+
+        The exists() calls run in threads so a cold filesystem or network
+        AppData never blocks the event loop, and their latency overlaps.
+        """
+        existence = await asyncio.gather(
+            *(asyncio.to_thread(os.path.exists, str(p)) for p in possible_paths)
+        )
+        return next(
+            (str(p) for p, ok in zip(possible_paths, existence) if ok), None
+        )
+
+    @staticmethod
+    async def _resolve_tool_path(candidates) -> Optional[str]:
+        """Resolve the first usable binary without spawning probe processes
+
+        The old approach ran `--version` per candidate; process creation
+        on Windows costs ~20ms each and a missing tool burned the full
+        probe timeout. An absolute candidate only needs a stat, and a
+        bare name resolves through shutil.which (one PATH scan, no
+        subprocess). Checks run concurrently; priority order is kept.
+        """
+        async def resolve(candidate):
+            candidate = str(candidate)
+            if os.path.basename(candidate) != candidate:
+                exists = await asyncio.to_thread(os.path.exists, candidate)
+                return candidate if exists else None
+            return await asyncio.to_thread(shutil.which, candidate)
+
+        if not candidates:
+            return None
+        resolved = await asyncio.gather(*(resolve(c) for c in candidates))
+        return next((path for path in resolved if path), None)
+
     async def _find_sumatra_pdf_async(self) -> Optional[str]:
         """Find SumatraPDF installation asynchronously"""
-        possible_paths = [
-            r"C:\Program Files\SumatraPDF\SumatraPDF.exe",
-            r"C:\Program Files (x86)\SumatraPDF\SumatraPDF.exe",
-            os.path.join(os.path.expanduser("~"), "AppData", "Local", "SumatraPDF", "SumatraPDF.exe"),
-            Path(__file__).parent / "tools" / "SumatraPDF.exe"
-        ]
-        
-        for path in possible_paths:
-            if os.path.exists(str(path)):
-                if self.logger.isEnabledFor(logging.INFO):
-                    self.logger.info(f"Found SumatraPDF: {path}")
-                return str(path)
+        path = await self._first_existing_path(_SUMATRA_CANDIDATES)
+        if path:
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"Found SumatraPDF: {path}")
+            return path
         
         self.logger.debug("SumatraPDF not found")
         return None
     
     async def _find_adobe_reader_async(self) -> Optional[str]:
         """Find Adobe Reader installation asynchronously"""
-        possible_paths = [
-            r"C:\Program Files (x86)\Adobe\Acrobat Reader DC\Reader\AcroRd32.exe",
-            r"C:\Program Files\Adobe\Acrobat Reader DC\Reader\AcroRd32.exe",
-            r"C:\Program Files (x86)\Adobe\Reader 11.0\Reader\AcroRd32.exe",
-            r"C:\Program Files\Adobe\Reader 11.0\Reader\AcroRd32.exe"
-        ]
-        
-        for path in possible_paths:
-            if os.path.exists(path):
-                if self.logger.isEnabledFor(logging.INFO):
-                    self.logger.info(f"Found Adobe Reader: {path}")
-                return path
+        path = await self._first_existing_path(_ADOBE_CANDIDATES)
+        if path:
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"Found Adobe Reader: {path}")
+            return path
         
         self.logger.debug("Adobe Reader not found")
         return None
     
     async def _find_pdftk_async(self) -> Optional[str]:
         """Find PDFtk asynchronously"""
-        possible_paths = [
-            r"C:\Program Files (x86)\PDFtk\bin\pdftk.exe",
-            r"C:\Program Files\PDFtk\bin\pdftk.exe",
-            "pdftk.exe"
-        ]
-        
-        for path in possible_paths:
-            try:
-                process = await asyncio.create_subprocess_exec(
-                    path, "--version",
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
-                )
-                await asyncio.wait_for(process.wait(), timeout=2)
-                if process.returncode == 0:
-                    return path
-            except:
-                continue
-        
-        return None
+        return await self._resolve_tool_path(_PDFTK_CANDIDATES)
     
+    @staticmethod
+    def _scan_gs_installs(base: str, exe_name: str) -> List[str]:
+        """List gs install dirs under base, newest version first
+
+        One scandir pass instead of a recursive glob; sorting descending
+        means the freshest install is probed (and wins) first.
+        """
+        candidates = []
+        try:
+            with os.scandir(base) as entries:
+                versions = sorted(
+                    (e.name for e in entries if e.name.startswith('gs')),
+                    reverse=True
+                )
+            candidates = [os.path.join(base, v, "bin", exe_name) for v in versions]
+        except OSError:
+            pass
+        return candidates
+
     async def _find_ghostscript_async(self) -> Optional[str]:
         """Find Ghostscript asynchronously"""
-        possible_paths = [
-            r"C:\Program Files\gs\gs*\bin\gswin64c.exe",
-            r"C:\Program Files (x86)\gs\gs*\bin\gswin32c.exe",
-            "gs"
-        ]
-        
-        for path_pattern in possible_paths:
-            if "*" in path_pattern:
-                import glob
-                matches = glob.glob(path_pattern)
-                for path in matches:
-                    try:
-                        process = await asyncio.create_subprocess_exec(
-                            path, "--version",
-                            stdout=asyncio.subprocess.PIPE,
-                            stderr=asyncio.subprocess.PIPE
-                        )
-                        await asyncio.wait_for(process.wait(), timeout=2)
-                        if process.returncode == 0:
-                            return path
-                    except:
-                        continue
-            else:
-                try:
-                    process = await asyncio.create_subprocess_exec(
-                        path_pattern, "--version",
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE
-                    )
-                    await asyncio.wait_for(process.wait(), timeout=2)
-                    if process.returncode == 0:
-                        return path_pattern
-                except:
-                    continue
+        candidates = await asyncio.to_thread(
+            self._scan_gs_installs, r"C:\Program Files\gs", "gswin64c.exe"
+        )
+        candidates += await asyncio.to_thread(
+            self._scan_gs_installs, r"C:\Program Files (x86)\gs", "gswin32c.exe"
+        )
+        candidates.append("gs")
         
-        return None
+        return await self._resolve_tool_path(candidates)
     
+    async def _run_ghostscript(self, args: List[str], timeout: float = 10,
+                               input_bytes: Optional[bytes] = None):
+        """Run one Ghostscript invocation under the shared concurrency cap
+
+        Centralizes the spawn/communicate/timeout handling for the five
+        call sites and bounds how many interpreters run at once. When
+        input_bytes is given the document is piped over stdin (the args
+        should name "-" as the input file) so callers holding the bytes
+        in memory avoid a second read from disk.
+        """
+        async with PrintExecutor._gs_semaphore:
+            process = await asyncio.create_subprocess_exec(
+                self.ghostscript_path, *args,
+                stdin=asyncio.subprocess.PIPE if input_bytes is not None else None,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(input=input_bytes), timeout=timeout
+                )
+            except asyncio.TimeoutError:
+                process.kill()
+                raise
+            return process.returncode, stdout, stderr
+
     def _select_preferred_tool(self) -> Optional[str]:
         """Select the best available PDF printing tool"""
+        # Tool paths are settled by the time this runs, so the extraction
+        # method is decided here once rather than re-derived per query
+        if self.pdftk_path:
+            self._page_extraction_method = "pdftk"
+        elif self.ghostscript_path:
+            self._page_extraction_method = "ghostscript"
+        else:
+            self._page_extraction_method = "python_builtin"
+        
         if self.sumatra_path:
             return "sumatra"
         elif self.adobe_path:
@@ -207,14 +777,11 @@ class PrintExecutor:
         if self.logger.isEnabledFor(logging.INFO):
             self.logger.info(f"Executing batch of {len(jobs)} print jobs concurrently")
         
-        # Execute all jobs concurrently
-        tasks = []
-        for job in jobs:
-            task = self.execute_print_job(job)
-            tasks.append(task)
-        
-        # Wait for all jobs to complete
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Execute all jobs concurrently and wait for completion; the
+        # coroutines go straight to the gather without an accumulator list
+        results = await self._gather_guarded(
+            [self.execute_print_job(job) for job in jobs]
+        )
         
         # Build result dictionary
         result_dict = {}
@@ -242,20 +809,28 @@ class PrintExecutor:
         start_time = time.time()
         job_id = job.get('id', 'unknown')
         
+        try:
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"Executing print job {job_id}")
+            
+            if not self._validate_print_job(job):
+                return False
+            
+            # Prepare content before taking the print gates: the download
+            # or decode overlaps other jobs' prints instead of holding a
+            # printer slot through network latency
+            pdf_path = await self._prepare_pdf_content(job)
+            if not pdf_path:
+                self.logger.error(f"Failed to prepare PDF content for job {job_id}")
+                return False
+        except Exception as e:
+            self.logger.error(f"Print job preparation failed for {job_id}: {e}")
+            return False
+        
         # Use semaphore to limit concurrent prints (prevents printer queue overload)
-        async with PrintExecutor._print_semaphore:
+        printer_semaphore = self._get_printer_semaphore(job.get('printer_name'))
+        async with PrintExecutor._print_semaphore, printer_semaphore:
             try:
-                if self.logger.isEnabledFor(logging.INFO):
-                    self.logger.info(f"Executing print job {job_id}")
-                
-                if not self._validate_print_job(job):
-                    return False
-                
-                pdf_path = await self._prepare_pdf_content(job)
-                if not pdf_path:
-                    self.logger.error(f"Failed to prepare PDF content for job {job_id}")
-                    return False
-                
                 try:
                     settings = job.get('settings', {})
                     page_range = settings.get('page_range', '').strip()
@@ -263,8 +838,22 @@ class PrintExecutor:
                     page_orientations = settings.get('page_orientations', {})
                     
                     final_pdf_path = pdf_path
-                    
-                    if page_range and page_range.lower() != 'all' and page_range != '':
+                    want_extract = bool(page_range and page_range.lower() != 'all')
+
+                    if want_extract and crop_settings:
+                        # Jobs needing both stages get a fused single-pass
+                        # path: one parse, one serialize, one temp file
+                        if self.logger.isEnabledFor(logging.INFO):
+                            self.logger.info(f"Extracting pages {page_range} and cropping in one pass")
+                        fused_pdf = await self._extract_and_crop(pdf_path, page_range, crop_settings)
+                        if fused_pdf:
+                            final_pdf_path = fused_pdf
+                            want_extract = False
+                            crop_settings = {}
+                        else:
+                            self.logger.warning("Fused extract+crop failed, falling back to staged pipeline")
+
+                    if want_extract:
                         if self.logger.isEnabledFor(logging.INFO):
                             self.logger.info(f"Extracting pages: {page_range}")
                         extracted_pdf = await self._extract_pages(pdf_path, page_range)
@@ -313,6 +902,10 @@ class PrintExecutor:
                     
                     if success:
                         self.successful_jobs += 1
+                    else:
+                        # A failed print may mean the printer just went
+                        # offline; re-check it on the next job
+                        self._invalidate_printer_cache(job.get('printer_name'))
                     
                     if self.logger.isEnabledFor(logging.INFO):
                         self.logger.info(
@@ -323,7 +916,11 @@ class PrintExecutor:
                     return success
                     
                 finally:
-                    self._cleanup_temp_file(pdf_path)
+                    # Multi-printer assignments share one source file and
+                    # the dispatcher owns its lifetime; everyone else
+                    # cleans up their own copy
+                    if not job.get('retain_source'):
+                        self._cleanup_temp_file(pdf_path)
                     
             except Exception as e:
                 self.logger.error(f"Print job execution failed for {job_id}: {e}")
@@ -355,32 +952,114 @@ class PrintExecutor:
             if self.logger.isEnabledFor(logging.INFO):
                 self.logger.info(f"Orientation groups: {orientation_groups}")
             
-            # Execute all orientation groups concurrently
-            tasks = []
-            for orientation, pages in orientation_groups.items():
-                task = self._print_orientation_group(pdf_path, job, orientation, pages)
-                tasks.append(task)
-            
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            all_successful = all(result is True for result in results if not isinstance(result, Exception))
-            
-            return all_successful
+            # Extract every group's pages in one pass over the source,
+            # then fan out the prints concurrently
+            extracted = await self._extract_multiple_page_sets(
+                pdf_path,
+                {o: [p - 1 for p in pages] for o, pages in orientation_groups.items()}
+            )
+
+            if extracted is None:
+                # Fused extraction unavailable; per-group staged fallback
+                tasks = [
+                    self._print_orientation_group(pdf_path, job, orientation, pages)
+                    for orientation, pages in orientation_groups.items()
+                ]
+                results = await self._gather_guarded(tasks)
+                return all(result is True for result in results if not isinstance(result, Exception))
+
+            try:
+                tasks = [
+                    self._print_extracted_group(path, job, orientation, orientation_groups[orientation])
+                    for orientation, path in extracted.items()
+                ]
+                results = await self._gather_guarded(tasks)
+                return all(result is True for result in results if not isinstance(result, Exception))
+            finally:
+                for path in extracted.values():
+                    self._cleanup_temp_file(path)
             
         except Exception as e:
             self.logger.error(f"Per-page orientation printing failed: {e}")
             return False
     
+    async def _extract_multiple_page_sets(self, pdf_path: str, page_sets: Dict[str, List[int]]) -> Optional[Dict[str, str]]:
+        """Extract several page sets from one PDF in a single parse
+
+        page_sets maps a group key to 0-indexed page numbers. Returns a
+        map of group key to extracted temp-file path, or None when the
+        Python PDF library is unavailable.
+        """
+        try:
+            if _PDF_READER_CLS is None:
+                return None
+
+            content = await self._read_pdf_bytes(pdf_path)
+
+            pdf_reader = _open_pdf_reader(BytesIO(content))
+            max_pages = len(pdf_reader.pages)
+            await self._remember_page_count(pdf_path, max_pages)
+
+            writers = {key: _PDF_WRITER_CLS() for key in page_sets}
+            for key, pages in page_sets.items():
+                writer = writers[key]
+                for page_num in pages:
+                    if 0 <= page_num < max_pages:
+                        _PDF_ADD_PAGE(writer, pdf_reader.pages[page_num])
+
+            extracted = {}
+            try:
+                for key, writer in writers.items():
+                    output = BytesIO()
+                    writer.write(output)
+                    data = output.getvalue()
+                    if not data:
+                        raise ValueError(f"Empty extraction for group {key}")
+                    extracted[key] = _PdfBuffer(data, prefix="extracted_group_").materialize()
+            except Exception:
+                for path in extracted.values():
+                    self._cleanup_temp_file(path)
+                raise
+
+            return extracted
+
+        except Exception as e:
+            self.logger.error(f"Fused multi-extract failed: {e}")
+            return None
+
+    async def _print_extracted_group(self, extracted_pdf: str, job: Dict[str, Any], orientation: str, pages: List[int]) -> bool:
+        """Print an already-extracted orientation group"""
+        try:
+            orientation_settings = job.get('settings', {}).copy()
+            orientation_settings['orientation'] = orientation
+            orientation_settings.pop('page_orientations', None)
+            orientation_settings.pop('page_range', None)
+
+            orientation_job = job.copy()
+            orientation_job['settings'] = orientation_settings
+
+            success = await self._execute_print(extracted_pdf, orientation_job)
+            if not success:
+                self.logger.error(f"Failed to print pages {pages} with orientation {orientation}")
+                return False
+
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"Successfully printed pages {pages} with orientation {orientation}")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Orientation group printing failed: {e}")
+            return False
+    
     async def _print_orientation_group(self, pdf_path: str, job: Dict[str, Any], orientation: str, pages: List[int]) -> bool:
         """Print a group of pages with the same orientation"""
         try:
             if self.logger.isEnabledFor(logging.INFO):
                 self.logger.info(f"Printing pages {pages} with orientation: {orientation}")
             
-            page_ranges = []
-            for page in pages:
-                page_ranges.append(str(page))
-            page_range_str = ",".join(page_ranges)
+            # Contiguous runs collapse to "a-b"; downstream tools handle
+            # ranges natively and whole-document ranges skip extraction
+            page_range_str = self._compress_page_list(pages)
             
             extracted_pdf = await self._extract_pages(pdf_path, page_range_str)
             if not extracted_pdf:
@@ -406,7 +1085,9 @@ class PrintExecutor:
                     return True
                     
             finally:
-                self._cleanup_temp_file(extracted_pdf)
+                # The whole-document fast path returns the source unchanged
+                if extracted_pdf != pdf_path:
+                    self._cleanup_temp_file(extracted_pdf)
                 
         except Exception as e:
             self.logger.error(f"Orientation group printing failed: {e}")
@@ -415,270 +1096,498 @@ class PrintExecutor:
     # [Keep all the other methods from the previous optimized version - _apply_crop_settings, _crop_keep_top, etc.]
     # I'll include the critical path methods here for completeness:
     
+    @staticmethod
+    def _parse_page_range(page_range: str, max_pages: int) -> List[int]:
+        """Parse a page-range string ("3", "2-5", "1,3-4") into 0-indexed pages"""
+        pages = []
+        for token in page_range.split(','):
+            token = token.strip()
+            if not token:
+                continue
+            if '-' in token:
+                start, end = token.split('-', 1)
+                pages.extend(range(int(start) - 1, int(end)))
+            else:
+                pages.append(int(token) - 1)
+        return [p for p in pages if 0 <= p < max_pages]
+
+    def _crop_page(self, page, crop_settings: Dict[str, Any]) -> bool:
+        """Apply the configured crop to a single page in place"""
+        method = crop_settings.get('method', 'auto')
+        mediabox = page.mediabox
+        left = float(mediabox.left)
+        bottom = float(mediabox.bottom)
+        right = float(mediabox.right)
+        top = float(mediabox.top)
+        height = top - bottom
+
+        keep_top = method == 'keep_top' or (
+            method == 'auto'
+            and (crop_settings.get('keep_top', False) or 'keep_top_percent' in crop_settings)
+        )
+        if keep_top:
+            new_height = height * (crop_settings.get('keep_top_percent', 80) / 100.0)
+            page.cropbox.lower_left = (left, top - new_height)
+            page.cropbox.upper_right = (right, top)
+            return True
+
+        keep_bottom = method == 'keep_bottom' or (
+            method == 'auto'
+            and (crop_settings.get('keep_bottom', False) or 'keep_bottom_percent' in crop_settings)
+        )
+        if keep_bottom:
+            new_height = height * (crop_settings.get('keep_bottom_percent', 80) / 100.0)
+            page.cropbox.lower_left = (left, bottom)
+            page.cropbox.upper_right = (right, bottom + new_height)
+            return True
+
+        if method == 'custom' or 'crop_box' in crop_settings:
+            crop_box = crop_settings.get('crop_box', [0, 0, 612, 792])
+            if len(crop_box) != 4:
+                return False
+            crop_left, crop_bottom, crop_right, crop_top = crop_box
+            abs_left = max(left + crop_left, left)
+            abs_bottom = max(bottom + crop_bottom, bottom)
+            abs_right = min(left + crop_right, right)
+            abs_top = min(bottom + crop_top, top)
+            if abs_left >= abs_right or abs_bottom >= abs_top:
+                return False
+            page.cropbox.lower_left = (abs_left, abs_bottom)
+            page.cropbox.upper_right = (abs_right, abs_top)
+            return True
+
+        return False
+
+    async def _extract_and_crop(self, pdf_path: str, page_range: str, crop_settings: Dict[str, Any]) -> Optional[str]:
+        """Extract the selected pages and crop them in a single PyPDF2 pass
+
+        Fuses what used to be parse -> write tempfile -> re-parse -> write
+        into one parse and one serialize.
+        """
+        try:
+            if _PDF_READER_CLS is None:
+                return None
+
+            content = await self._read_pdf_bytes(pdf_path)
+
+            pdf_reader = _open_pdf_reader(BytesIO(content))
+            await self._remember_page_count(pdf_path, len(pdf_reader.pages))
+            pages = self._parse_page_range(page_range, len(pdf_reader.pages))
+            if not pages:
+                self.logger.error(f"Page range '{page_range}' selects no pages")
+                return None
+
+            pdf_writer = _PDF_WRITER_CLS()
+            for page_num in pages:
+                page = pdf_reader.pages[page_num]
+                self._crop_page(page, crop_settings)
+                _PDF_ADD_PAGE(pdf_writer, page)
+
+            output = BytesIO()
+            pdf_writer.write(output)
+            data = output.getvalue()
+            if not data:
+                return None
+
+            out_path = _PdfBuffer(data, prefix="extracted_cropped_").materialize()
+            # The output's count is already known - no later re-parse needed
+            await self._remember_page_count(out_path, len(pages))
+            return out_path
+
+        except Exception as e:
+            self.logger.error(f"Fused extract+crop failed: {e}")
+            return None
+
     async def _apply_crop_settings(self, pdf_path: str, crop_settings: Dict[str, Any]) -> Optional[str]:
-        """Apply cropping/positioning settings to PDF"""
+        """Apply cropping/positioning settings to PDF
+
+        Reads the source once, runs the crop stages on in-memory bytes and
+        writes a temp file only for the final printer handoff.
+        """
         try:
-            crop_method = crop_settings.get('method', 'auto')
-            
-            if crop_method == 'keep_top':
-                return await self._crop_keep_top(pdf_path, crop_settings)
-            elif crop_method == 'keep_bottom':
-                return await self._crop_keep_bottom(pdf_path, crop_settings)
-            elif crop_method == 'custom':
-                return await self._crop_custom(pdf_path, crop_settings)
+            # One executor round-trip for the whole read; aiofiles pays a
+            # thread-pool hop per call for what is a single bulk read
+            content = await self._read_pdf_bytes(pdf_path)
+
+            cache_key = hashlib.sha256(
+                content + repr(sorted(crop_settings.items())).encode()
+            ).hexdigest()
+
+            cropped = await self._crop_cache.get(cache_key)
+            if cropped is not None:
+                self.logger.debug("Crop cache hit")
             else:
-                if crop_settings.get('keep_top', False) or 'keep_top_percent' in crop_settings:
-                    return await self._crop_keep_top(pdf_path, crop_settings)
-                elif crop_settings.get('keep_bottom', False) or 'keep_bottom_percent' in crop_settings:
-                    return await self._crop_keep_bottom(pdf_path, crop_settings)
-                elif 'crop_box' in crop_settings:
-                    return await self._crop_custom(pdf_path, crop_settings)
-                else:
-                    self.logger.warning("No valid crop method detected")
+                cropped = await self._crop_content(content, crop_settings)
+                if cropped is None:
                     return None
-                    
+                await self._crop_cache.put(cache_key, cropped)
+
+            return _PdfBuffer(cropped, prefix="cropped_").materialize()
+
         except Exception as e:
             self.logger.error(f"Crop settings application failed: {e}")
             return None
+
+    async def _crop_content(self, content: bytes, crop_settings: Dict[str, Any]) -> Optional[bytes]:
+        """Dispatch in-memory PDF bytes to the configured crop method"""
+        handler = self._crop_dispatch.get(crop_settings.get('method', 'auto'))
+        if handler is None:
+            handler = self._infer_crop_handler(crop_settings)
+            if handler is None:
+                self.logger.warning("No valid crop method detected")
+                return None
+        return await handler(content, crop_settings)
+
+    def _infer_crop_handler(self, crop_settings: Dict[str, Any]):
+        """Resolve the crop handler for the 'auto' method (memoized)
+
+        Keyed by the settings' key set plus the two boolean flags, so a
+        batch of identically-shaped jobs pays for the inference once.
+        """
+        shape = (
+            frozenset(crop_settings),
+            bool(crop_settings.get('keep_top', False)),
+            bool(crop_settings.get('keep_bottom', False))
+        )
+        try:
+            return self._inferred_crop_handlers[shape]
+        except KeyError:
+            pass
+
+        if crop_settings.get('keep_top', False) or 'keep_top_percent' in crop_settings:
+            handler = self._crop_keep_top
+        elif crop_settings.get('keep_bottom', False) or 'keep_bottom_percent' in crop_settings:
+            handler = self._crop_keep_bottom
+        elif 'crop_box' in crop_settings:
+            handler = self._crop_custom
+        else:
+            handler = None
+
+        self._inferred_crop_handlers[shape] = handler
+        return handler
     
-    async def _crop_keep_top(self, pdf_path: str, crop_settings: Dict[str, Any]) -> Optional[str]:
+    async def _crop_keep_top(self, content: bytes, crop_settings: Dict[str, Any]) -> Optional[bytes]:
         """Crop PDF to keep top portion and remove bottom"""
         try:
-            return await self._crop_keep_top_python(pdf_path, crop_settings)
+            if PIKEPDF_AVAILABLE:
+                percent = crop_settings.get('keep_top_percent', 80)
+                cropped = await self._crop_pikepdf(
+                    content,
+                    lambda mb: [mb[0], mb[3] - (mb[3] - mb[1]) * percent / 100.0, mb[2], mb[3]]
+                )
+                if cropped:
+                    return cropped
+            return await self._crop_keep_top_python(content, crop_settings)
         except Exception as e:
             self.logger.error(f"Keep-top cropping failed: {e}")
             return None
     
-    async def _crop_keep_top_python(self, pdf_path: str, crop_settings: Dict[str, Any]) -> Optional[str]:
+    async def _crop_pikepdf(self, content: bytes, compute_box) -> Optional[bytes]:
+        """Crop every page with pikepdf (native QPDF rewrite)
+
+        compute_box maps a page's [left, bottom, right, top] mediabox to
+        the new crop box, or None to leave that page untouched. Runs in a
+        worker thread so the native parse never stalls the event loop.
+        """
+        def _run():
+            with pikepdf.open(BytesIO(content)) as pdf:
+                for page in pdf.pages:
+                    mb = [float(v) for v in page.mediabox]
+                    box = compute_box(mb)
+                    if box:
+                        page.cropbox = box
+                output = BytesIO()
+                pdf.save(output)
+                return output.getvalue()
+
+        try:
+            return await asyncio.to_thread(_run)
+        except Exception as e:
+            self.logger.debug(f"pikepdf crop failed, falling back: {e}")
+            return None
+    
+    @staticmethod
+    def _crop_keep_top_sync(content: bytes, crop_height_percent: float) -> bytes:
+        """CPU-bound keep-top rewrite; runs on the thread pool"""
+        pdf_reader = _open_pdf_reader(BytesIO(content))
+        pdf_writer = _PDF_WRITER_CLS()
+
+        for page in pdf_reader.pages:
+            mediabox = page.mediabox
+
+            left = float(mediabox.left)
+            right = float(mediabox.right)
+            top = float(mediabox.top)
+
+            height = top - float(mediabox.bottom)
+            new_height = height * (crop_height_percent / 100.0)
+
+            page.cropbox.lower_left = (left, top - new_height)
+            page.cropbox.upper_right = (right, top)
+
+            pdf_writer.add_page(page)
+
+        output = BytesIO()
+        pdf_writer.write(output)
+        return output.getvalue()
+
+    async def _crop_keep_top_python(self, content: bytes, crop_settings: Dict[str, Any]) -> Optional[bytes]:
         """Use Python PDF library to keep top portion"""
         try:
-            import PyPDF2 as pdf_lib
+            if _PDF_READER_CLS is None:
+                return None
             
             crop_height_percent = crop_settings.get('keep_top_percent', 80)
             
-            async with aiofiles.open(pdf_path, 'rb') as input_file:
-                content = await input_file.read()
-                
-            from io import BytesIO
-            pdf_reader = pdf_lib.PdfReader(BytesIO(content))
-            pdf_writer = pdf_lib.PdfWriter()
-            
-            for page in pdf_reader.pages:
-                mediabox = page.mediabox
-                
-                left = float(mediabox.left)
-                bottom = float(mediabox.bottom)
-                right = float(mediabox.right)
-                top = float(mediabox.top)
-                
-                width = right - left
-                height = top - bottom
-                new_height = height * (crop_height_percent / 100.0)
-                
-                page.cropbox.lower_left = (left, top - new_height)
-                page.cropbox.upper_right = (right, top)
-                
-                pdf_writer.add_page(page)
-            
-            output_file = tempfile.NamedTemporaryFile(
-                suffix='_cropped.pdf', 
-                delete=False,
-                prefix="cropped_top_"
+            # The parse+rewrite is pure CPU; offloading it lets the loop
+            # keep serving the other concurrent jobs while PyPDF2 works
+            cropped = await asyncio.to_thread(
+                self._crop_keep_top_sync, content, crop_height_percent
             )
-            
-            pdf_writer.write(output_file)
-            output_file.close()
-            
-            if os.path.exists(output_file.name) and os.path.getsize(output_file.name) > 0:
+
+            if cropped:
                 if self.logger.isEnabledFor(logging.INFO):
                     self.logger.info(f"Python top-crop successful (keep {crop_height_percent}%)")
-                return output_file.name
+                return cropped
             else:
-                self.logger.error("Python top-crop produced empty file")
-                self._cleanup_temp_file(output_file.name)
+                self.logger.error("Python top-crop produced empty output")
                 return None
                     
         except Exception as e:
             self.logger.error(f"Python top-crop error: {e}")
             return None
     
-    async def _crop_keep_bottom(self, pdf_path: str, crop_settings: Dict[str, Any]) -> Optional[str]:
+    async def _crop_keep_bottom(self, content: bytes, crop_settings: Dict[str, Any]) -> Optional[bytes]:
         """Crop PDF to keep bottom portion"""
         try:
-            return await self._crop_keep_bottom_python(pdf_path, crop_settings)
+            if PIKEPDF_AVAILABLE:
+                percent = crop_settings.get('keep_bottom_percent', 80)
+                cropped = await self._crop_pikepdf(
+                    content,
+                    lambda mb: [mb[0], mb[1], mb[2], mb[1] + (mb[3] - mb[1]) * percent / 100.0]
+                )
+                if cropped:
+                    return cropped
+            return await self._crop_keep_bottom_python(content, crop_settings)
         except Exception as e:
             self.logger.error(f"Keep-bottom cropping failed: {e}")
             return None
     
-    async def _crop_keep_bottom_python(self, pdf_path: str, crop_settings: Dict[str, Any]) -> Optional[str]:
+    @staticmethod
+    def _crop_keep_bottom_sync(content: bytes, crop_height_percent: float) -> bytes:
+        """CPU-bound keep-bottom rewrite; runs on the thread pool"""
+        pdf_reader = _open_pdf_reader(BytesIO(content))
+        pdf_writer = _PDF_WRITER_CLS()
+
+        if hasattr(pdf_reader, 'pages'):
+            pages = pdf_reader.pages
+        else:
+            pages = [pdf_reader.getPage(i) for i in range(pdf_reader.getNumPages())]
+
+        # Resolve the attribute spellings once, not per page
+        get_mediabox = None
+        cropbox_attr = None
+
+        for page in pages:
+            if get_mediabox is None:
+                mediabox_attr = 'mediabox' if hasattr(page, 'mediabox') else 'mediaBox'
+                cropbox_attr = 'cropbox' if hasattr(page, 'cropbox') else 'cropBox'
+                get_mediabox = operator.attrgetter(mediabox_attr)
+
+            mediabox = get_mediabox(page)
+
+            height = float(mediabox[3] - mediabox[1])
+            new_height = height * (crop_height_percent / 100.0)
+
+            crop_box = [
+                mediabox[0],
+                mediabox[1],
+                mediabox[2],
+                mediabox[1] + new_height
+            ]
+
+            setattr(page, cropbox_attr, crop_box)
+            _PDF_ADD_PAGE(pdf_writer, page)
+
+        output = BytesIO()
+        pdf_writer.write(output)
+        return output.getvalue()
+
+    async def _crop_keep_bottom_python(self, content: bytes, crop_settings: Dict[str, Any]) -> Optional[bytes]:
         """Use Python PDF library to keep bottom portion"""
         try:
-            pdf_lib = None
-            try:
-                import PyPDF2 as pdf_lib
-                pdf_class = pdf_lib.PdfFileReader
-                pdf_writer_class = pdf_lib.PdfFileWriter
-            except ImportError:
-                try:
-                    import PyPDF4 as pdf_lib
-                    pdf_class = pdf_lib.PdfFileReader
-                    pdf_writer_class = pdf_lib.PdfFileWriter
-                except ImportError:
-                    try:
-                        import pypdf as pdf_lib
-                        pdf_class = pdf_lib.PdfReader
-                        pdf_writer_class = pdf_lib.PdfWriter
-                    except ImportError:
-                        return None
-            
-            if not pdf_lib:
+            if _PDF_READER_CLS is None:
                 return None
             
             crop_height_percent = crop_settings.get('keep_bottom_percent', 80)
             
-            async with aiofiles.open(pdf_path, 'rb') as input_file:
-                content = await input_file.read()
-            
-            from io import BytesIO
-            pdf_reader = pdf_class(BytesIO(content))
-            pdf_writer = pdf_writer_class()
-            
-            page_count = len(pdf_reader.pages) if hasattr(pdf_reader, 'pages') else pdf_reader.getNumPages()
-            
-            for page_num in range(page_count):
-                if hasattr(pdf_reader, 'pages'):
-                    page = pdf_reader.pages[page_num]
-                else:
-                    page = pdf_reader.getPage(page_num)
-                
-                if hasattr(page, 'mediabox'):
-                    mediabox = page.mediabox
-                elif hasattr(page, 'mediaBox'):
-                    mediabox = page.mediaBox
-                else:
-                    continue
-                
-                width = float(mediabox[2] - mediabox[0])
-                height = float(mediabox[3] - mediabox[1])
-                
-                new_height = height * (crop_height_percent / 100.0)
-                
-                crop_box = [
-                    mediabox[0],
-                    mediabox[1],
-                    mediabox[2],
-                    mediabox[1] + new_height
-                ]
-                
-                if hasattr(page, 'cropbox'):
-                    page.cropbox = crop_box
-                elif hasattr(page, 'cropBox'):
-                    page.cropBox = crop_box
-                
-                if hasattr(pdf_writer, 'add_page'):
-                    pdf_writer.add_page(page)
-                else:
-                    pdf_writer.addPage(page)
-            
-            output_file = tempfile.NamedTemporaryFile(
-                suffix='_cropped.pdf', 
-                delete=False,
-                prefix="cropped_bottom_"
+            cropped = await asyncio.to_thread(
+                self._crop_keep_bottom_sync, content, crop_height_percent
             )
-            
-            pdf_writer.write(output_file)
-            output_file.close()
-            
-            if os.path.exists(output_file.name) and os.path.getsize(output_file.name) > 0:
+
+            if cropped:
                 if self.logger.isEnabledFor(logging.INFO):
                     self.logger.info(f"Python bottom-crop successful (keep {crop_height_percent}%)")
-                return output_file.name
+                return cropped
             else:
-                self.logger.error("Python bottom-crop produced empty file")
-                self._cleanup_temp_file(output_file.name)
+                self.logger.error("Python bottom-crop produced empty output")
                 return None
                     
         except Exception as e:
             self.logger.error(f"Python bottom-crop error: {e}")
             return None
     
-    async def _crop_custom(self, pdf_path: str, crop_settings: Dict[str, Any]) -> Optional[str]:
+    async def _crop_custom(self, content: bytes, crop_settings: Dict[str, Any]) -> Optional[bytes]:
         """Apply custom crop box settings"""
         try:
             crop_box = crop_settings.get('crop_box', [0, 0, 612, 792])
-            return await self._crop_custom_python(pdf_path, crop_box)
+
+            # Prefer native rewrites (pikepdf, then Ghostscript) for large
+            # documents; PyPDF2 parses and serializes in pure Python and is
+            # an order of magnitude slower on big files
+            if PIKEPDF_AVAILABLE and len(crop_box) == 4:
+                cropped = await self._crop_pikepdf(
+                    content, lambda mb: self._custom_box_for_page(mb, crop_box)
+                )
+                if cropped:
+                    return cropped
+
+            if self.ghostscript_path and len(crop_box) == 4:
+                cropped = await self._crop_custom_ghostscript(content, crop_box)
+                if cropped:
+                    return cropped
+
+            return await self._crop_custom_python(content, crop_box)
                 
         except Exception as e:
             self.logger.error(f"Custom cropping failed: {e}")
             return None
     
-    async def _crop_custom_python(self, pdf_path: str, crop_box: List[float]) -> Optional[str]:
+    @staticmethod
+    def _custom_box_for_page(mediabox: List[float], crop_box: List[float]) -> Optional[List[float]]:
+        """Clamp a relative custom crop box against one page's mediabox"""
+        left, bottom, right, top = mediabox
+        crop_left, crop_bottom, crop_right, crop_top = crop_box
+        abs_left = max(left + crop_left, left)
+        abs_bottom = max(bottom + crop_bottom, bottom)
+        abs_right = min(left + crop_right, right)
+        abs_top = min(bottom + crop_top, top)
+        if abs_left >= abs_right or abs_bottom >= abs_top:
+            return None
+        return [abs_left, abs_bottom, abs_right, abs_top]
+
+    async def _crop_custom_ghostscript(self, content: bytes, crop_box: List[float]) -> Optional[bytes]:
+        """Set a uniform CropBox via Ghostscript's pdfwrite device
+
+        The parse/rewrite runs in native code. Applies one absolute box to
+        every page (the common uniform-MediaBox case); any failure falls
+        back to the per-page Python path.
+        """
+        in_path = _PdfBuffer(content, prefix="crop_in_").materialize()
+        out_path = await self._new_tempfile('.pdf', "cropped_gs_")
+
+        try:
+            left, bottom, right, top = (float(v) for v in crop_box)
+            pdfmark = f"[/CropBox [{left} {bottom} {right} {top}] /PAGES pdfmark"
+
+            returncode, _, _ = await self._run_ghostscript([
+                "-dBATCH", "-dNOPAUSE", "-dQUIET",
+                "-sDEVICE=pdfwrite",
+                f"-sOutputFile={out_path}",
+                "-c", pdfmark,
+                "-f", in_path
+            ], timeout=30)
+
+            if returncode == 0 and os.path.getsize(out_path) > 0:
+                cropped = await asyncio.to_thread(Path(out_path).read_bytes)
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info("Ghostscript custom-crop successful")
+                return cropped
+
+            self.logger.debug("Ghostscript crop returned no output, falling back to Python")
+            return None
+
+        except Exception as e:
+            self.logger.debug(f"Ghostscript crop failed: {e}")
+            return None
+        finally:
+            self._cleanup_temp_file(in_path)
+            self._cleanup_temp_file(out_path)
+    
+    @classmethod
+    def _crop_custom_sync(cls, content: bytes, crop_box: List[float]) -> bytes:
+        """CPU-bound custom-box rewrite; runs on the thread pool"""
+        pdf_reader = _open_pdf_reader(BytesIO(content))
+        pdf_writer = _PDF_WRITER_CLS()
+
+        for page in pdf_reader.pages:
+            mediabox = page.mediabox
+            box = cls._custom_box_for_page(
+                [float(mediabox.left), float(mediabox.bottom),
+                 float(mediabox.right), float(mediabox.top)],
+                crop_box
+            )
+            if box is None:
+                continue
+
+            page.cropbox.lower_left = (box[0], box[1])
+            page.cropbox.upper_right = (box[2], box[3])
+
+            pdf_writer.add_page(page)
+
+        output = BytesIO()
+        pdf_writer.write(output)
+        return output.getvalue()
+
+    async def _crop_custom_python(self, content: bytes, crop_box: List[float]) -> Optional[bytes]:
         """Apply custom crop box using Python PDF library"""
         try:
-            import PyPDF2 as pdf_lib
+            if _PDF_READER_CLS is None:
+                return None
             
             if len(crop_box) != 4:
                 self.logger.error("Custom crop box must have 4 values: [left, bottom, right, top]")
                 return None
             
-            crop_left, crop_bottom, crop_right, crop_top = crop_box
-            
-            async with aiofiles.open(pdf_path, 'rb') as input_file:
-                content = await input_file.read()
-            
-            from io import BytesIO
-            pdf_reader = pdf_lib.PdfReader(BytesIO(content))
-            pdf_writer = pdf_lib.PdfWriter()
-            
-            for page in pdf_reader.pages:
-                mediabox = page.mediabox
-                
-                original_left = float(mediabox.left)
-                original_bottom = float(mediabox.bottom)
-                original_right = float(mediabox.right)
-                original_top = float(mediabox.top)
-                
-                abs_left = original_left + crop_left
-                abs_bottom = original_bottom + crop_bottom
-                abs_right = original_left + crop_right
-                abs_top = original_bottom + crop_top
-                
-                abs_left = max(abs_left, original_left)
-                abs_bottom = max(abs_bottom, original_bottom)
-                abs_right = min(abs_right, original_right)
-                abs_top = min(abs_top, original_top)
-                
-                if abs_left >= abs_right or abs_bottom >= abs_top:
-                    self.logger.error(f"Invalid crop box")
-                    continue
-                
-                page.cropbox.lower_left = (abs_left, abs_bottom)
-                page.cropbox.upper_right = (abs_right, abs_top)
-                
-                pdf_writer.add_page(page)
-            
-            output_file = tempfile.NamedTemporaryFile(
-                suffix='_cropped.pdf', 
-                delete=False,
-                prefix="cropped_custom_"
+            cropped = await asyncio.to_thread(
+                self._crop_custom_sync, content, crop_box
             )
-            
-            pdf_writer.write(output_file)
-            output_file.close()
-            
-            if os.path.exists(output_file.name) and os.path.getsize(output_file.name) > 0:
+
+            if cropped:
                 if self.logger.isEnabledFor(logging.INFO):
                     self.logger.info(f"Python custom-crop successful")
-                return output_file.name
+                return cropped
             else:
-                self.logger.error("Python custom-crop produced empty file")
-                self._cleanup_temp_file(output_file.name)
+                self.logger.error("Python custom-crop produced empty output")
                 return None
                     
         except Exception as e:
             self.logger.error(f"Python custom-crop error: {e}")
             return None
     
+    def _is_printer_available_cached(self, printer_name: str) -> bool:
+        """Check printer availability with a short-TTL memo
+
+        is_printer_available walks the spooler enumeration; a batch of
+        jobs to the same printer re-asks within seconds and always gets
+        the same answer, so cache it briefly per printer name.
+        """
+        key = printer_name.lower()
+        cached = self._printer_available_cache.get(key)
+        if cached is not None:
+            checked_at, available = cached
+            if time.monotonic() - checked_at < self.PRINTER_AVAILABLE_TTL:
+                return available
+
+        available = self.printer_manager.is_printer_available(printer_name)
+        self._printer_available_cache[key] = (time.monotonic(), available)
+        return available
+
+    def _invalidate_printer_cache(self, printer_name: Optional[str]):
+        """Drop the cached availability for a printer (e.g. after a failure)"""
+        if printer_name:
+            self._printer_available_cache.pop(printer_name.lower(), None)
+
     def _validate_print_job(self, job: Dict[str, Any]) -> bool:
         """Validate print job parameters"""
         printer_name = job.get('printer_name')
@@ -686,25 +1595,109 @@ class PrintExecutor:
             self.logger.error("No printer name specified in job")
             return False
         
-        if not self.printer_manager.is_printer_available(printer_name):
+        if not self._is_printer_available_cached(printer_name):
             self.logger.error(f"Printer '{printer_name}' is not available")
             return False
         
         content_type = job.get('content_type', '').lower()
-        if content_type not in ['pdf', 'base64_pdf', 'url']:
+        if content_type not in _VALID_CONTENT_TYPES:
             self.logger.error(f"Unsupported content type: {content_type}")
             return False
-        
+
         if content_type == 'base64_pdf' and not job.get('content'):
             self.logger.error("No base64 content provided")
             return False
-        
+
         if content_type in ['pdf', 'url'] and not job.get('content_url'):
             self.logger.error("No content URL provided")
             return False
+
+        if content_type == 'file' and not job.get('file_path'):
+            self.logger.error("No file path provided")
+            return False
         
         return True
     
+    async def _prepared_cache_get(self, digest: str, job: Dict[str, Any]) -> Optional[str]:
+        """Hand out a hard link to a previously prepared identical PDF"""
+        source = self._prepared_cache.get(digest)
+        if not source:
+            return None
+        self._prepared_cache.move_to_end(digest)
+
+        dest = await self._new_tempfile('.pdf', f"printjob_{job.get('id', 'unknown')}_")
+
+        def _link():
+            try:
+                os.unlink(dest)
+                os.link(source, dest)
+            except OSError:
+                shutil.copyfile(source, dest)
+
+        try:
+            await asyncio.to_thread(_link)
+        except OSError:
+            # Cache file vanished (temp cleanup); forget it
+            self._prepared_cache.pop(digest, None)
+            return None
+
+        self.logger.debug(f"Prepared-PDF cache hit for {digest[:12]}")
+        return dest
+
+    async def _prepared_cache_put(self, digest: str, path: str):
+        """Link a freshly prepared PDF into the dedup cache, evicting LRU"""
+        cache_dir = os.path.join(tempfile.gettempdir(), "print_prepared_cache")
+
+        def _store():
+            os.makedirs(cache_dir, exist_ok=True)
+            target = os.path.join(cache_dir, digest + ".pdf")
+            if not os.path.exists(target):
+                try:
+                    os.link(path, target)
+                except OSError:
+                    shutil.copyfile(path, target)
+            return target
+
+        try:
+            target = await asyncio.to_thread(_store)
+        except OSError:
+            return
+
+        self._prepared_cache[digest] = target
+        self._prepared_cache.move_to_end(digest)
+        while len(self._prepared_cache) > self.PREPARED_CACHE_ENTRIES:
+            _, old_path = self._prepared_cache.popitem(last=False)
+            try:
+                os.unlink(old_path)
+            except OSError:
+                pass
+
+    @staticmethod
+    async def _new_tempfile(suffix: str, prefix: str) -> str:
+        """Create a closed temp file off-loop and return its path
+
+        NamedTemporaryFile stats the temp directory and opens the file
+        synchronously; on slow or network-backed temp dirs that blocks
+        the event loop, so the mkstemp runs on the thread pool.
+        """
+        def _make():
+            fd, path = tempfile.mkstemp(suffix=suffix, prefix=prefix)
+            os.close(fd)
+            return path
+
+        return await asyncio.to_thread(_make)
+
+    async def _read_pdf_bytes(self, pdf_path: str) -> bytes:
+        """Read a PDF's bytes, preferring the in-memory copy
+
+        Small downloads keep their bytes cached against the temp path, so
+        the pure-Python stages skip the disk round-trip entirely.
+        """
+        cached = self._content_bytes.get(pdf_path)
+        if cached is not None:
+            return cached
+        return await asyncio.to_thread(Path(pdf_path).read_bytes)
+
     async def _prepare_pdf_content(self, job: Dict[str, Any]) -> Optional[str]:
         """Prepare PDF content from various sources"""
         content_type = job.get('content_type', '').lower()
@@ -714,6 +1707,10 @@ class PrintExecutor:
                 return await self._handle_base64_content(job)
             elif content_type in ['pdf', 'url']:
                 return await self._handle_url_content(job)
+            elif content_type == 'file':
+                # Already local (e.g. streamed multipart upload); the job
+                # owns the temp file and normal cleanup removes it
+                return job.get('file_path')
             else:
                 self.logger.error(f"Unknown content type: {content_type}")
                 return None
@@ -722,6 +1719,35 @@ class PrintExecutor:
             self.logger.error(f"Content preparation failed: {e}")
             return None
     
+    @staticmethod
+    def _decode_base64_to_file(content, path: str):
+        """Decode base64 into a file chunk-by-chunk
+
+        A single b64decode holds the encoded payload plus the full decoded
+        bytes at once; decoding 256KiB slices (multiples of 4 chars, so
+        each slice is independently decodable) keeps peak memory at one
+        chunk regardless of document size. The payload is normalized to
+        bytes once so the slices are zero-copy memoryviews rather than
+        per-chunk string copies; _B64Stream keeps slices aligned even
+        when the payload carries embedded whitespace.
+        """
+        chunk_chars = 4 * 65536
+        if isinstance(content, str):
+            content = content.encode('ascii')
+        view = memoryview(content)
+        decoder = _B64Stream()
+        # buffering=0 bypasses BufferedWriter: each ~192KiB decoded chunk
+        # goes to the kernel in one write instead of being copied through
+        # an 8KiB Python-side buffer first
+        with open(path, 'wb', buffering=0) as out:
+            for start in range(0, len(view), chunk_chars):
+                decoded = decoder.feed(view[start:start + chunk_chars])
+                if decoded:
+                    out.write(decoded)
+            tail = decoder.finish()
+            if tail:
+                out.write(tail)
+
     async def _handle_base64_content(self, job: Dict[str, Any]) -> Optional[str]:
         """Handle base64 PDF content"""
         try:
@@ -730,21 +1756,28 @@ class PrintExecutor:
                 self.logger.error("Empty base64 content")
                 return None
             
-            pdf_data = base64.b64decode(content)
-            
-            temp_file = tempfile.NamedTemporaryFile(
-                suffix='.pdf', 
-                delete=False,
-                prefix=f"printjob_{job.get('id', 'unknown')}_"
+            # Identical payloads (label reprints) skip decoding: hashing
+            # the encoded bytes identifies the document without touching
+            # it, and SHA-256 runs at GB/s with hardware support
+            digest = hashlib.sha256(
+                content.encode('ascii') if isinstance(content, str) else content
+            ).hexdigest()
+            cached = await self._prepared_cache_get(digest, job)
+            if cached:
+                return cached
+            
+            temp_path = await self._new_tempfile(
+                '.pdf', f"printjob_{job.get('id', 'unknown')}_"
             )
             
-            async with aiofiles.open(temp_file.name, 'wb') as f:
-                await f.write(pdf_data)
+            # Decode+write runs off-loop; the streamed decode never holds
+            # the whole decoded document in memory
+            await asyncio.to_thread(self._decode_base64_to_file, content, temp_path)
             
-            temp_file.close()
+            await self._prepared_cache_put(digest, temp_path)
             
-            self.logger.debug(f"Created PDF from base64 content: {temp_file.name}")
-            return temp_file.name
+            self.logger.debug(f"Created PDF from base64 content: {temp_path}")
+            return temp_path
             
         except Exception as e:
             self.logger.error(f"Base64 content handling failed: {e}")
@@ -759,35 +1792,50 @@ class PrintExecutor:
                 return None
             
             self.logger.debug(f"Downloading PDF from: {url}")
-            
-            timeout = aiohttp.ClientTimeout(total=15, connect=5)
-            headers = {'User-Agent': 'WindowsPrintService/1.0'}
-            
-            connector = aiohttp.TCPConnector(limit=10)
-            
-            async with aiohttp.ClientSession(timeout=timeout, headers=headers, connector=connector) as session:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        self.logger.error(f"Download failed with status {response.status}")
-                        return None
-                    
-                    content_type = response.headers.get('content-type', '').lower()
-                    if 'pdf' not in content_type:
-                        self.logger.warning(f"Unexpected content type: {content_type}")
-                    
-                    temp_file = tempfile.NamedTemporaryFile(
-                        suffix='.pdf',
-                        delete=False,
-                        prefix=f"printjob_{job.get('id', 'unknown')}_"
-                    )
-                    temp_file.close()
-                    
-                    async with aiofiles.open(temp_file.name, 'wb') as f:
-                        async for chunk in response.content.iter_chunked(8192):
-                            await f.write(chunk)
-                    
-                    self.logger.debug(f"Downloaded PDF to: {temp_file.name}")
-                    return temp_file.name
+
+            session = self._get_session()
+
+            async with session.get(url, timeout=_DOWNLOAD_TIMEOUT) as response:
+                if response.status != 200:
+                    self.logger.error(f"Download failed with status {response.status}")
+                    return None
+                
+                content_type = response.headers.get('content-type', '').lower()
+                if 'pdf' not in content_type:
+                    self.logger.warning(f"Unexpected content type: {content_type}")
+                
+                temp_path = await self._new_tempfile(
+                    '.pdf', f"printjob_{job.get('id', 'unknown')}_"
+                )
+                
+                # readany yields everything buffered per await (the
+                # session reads with a 128KiB buffer), and writing the
+                # slice straight through os.write skips the aiofiles
+                # file-object layer - one copy per chunk instead of two.
+                # Small documents also accumulate in memory so later
+                # Python stages skip the read-back from disk.
+                buffered = bytearray()
+                fd = await asyncio.to_thread(
+                    os.open, temp_path, os.O_WRONLY | getattr(os, 'O_BINARY', 0)
+                )
+                try:
+                    while True:
+                        chunk = await response.content.readany()
+                        if not chunk:
+                            break
+                        await asyncio.to_thread(os.write, fd, chunk)
+                        if buffered is not None:
+                            buffered += chunk
+                            if len(buffered) > self.CONTENT_BYTES_LIMIT:
+                                buffered = None
+                finally:
+                    await asyncio.to_thread(os.close, fd)
+                
+                if buffered is not None:
+                    self._content_bytes[temp_path] = bytes(buffered)
+                
+                self.logger.debug(f"Downloaded PDF to: {temp_path}")
+                return temp_path
             
         except asyncio.TimeoutError:
             self.logger.error("PDF download timeout")
@@ -804,19 +1852,53 @@ class PrintExecutor:
         if self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(f"Starting print execution: {pdf_path} -> {printer_name}")
         
-        scaling_mode = settings.get('scaling', 'auto_scale').lower()
-        force_orientation = settings.get('force_orientation', False)
-        rotation = settings.get('rotation', 0)
+        snap = _ExecSettings(settings)
+        scaling_mode = snap.scaling
+        force_orientation = snap.force_orientation
+        rotation = snap.rotation
         
         if force_orientation or rotation != 0:
+            # Rotation plus fit-to-paper fuses into one Ghostscript pass
+            # instead of an orientation rewrite followed by a fit rewrite
+            if scaling_mode == 'fit_to_paper' and self.ghostscript_path:
+                fused_pdf = await self._run_ghostscript_pipeline(
+                    pdf_path,
+                    rotation=rotation,
+                    paper_size=snap.paper_size,
+                    orientation=snap.orientation,
+                    fit_to_paper=True,
+                    force_orientation=force_orientation
+                )
+                if fused_pdf:
+                    try:
+                        fused_settings = settings.copy()
+                        fused_settings['scaling'] = 'no_scale'
+                        fused_settings.pop('rotation', None)
+                        fused_settings.pop('force_orientation', None)
+                        fused_settings.pop('auto_scale', None)
+                        
+                        if self.preferred_tool == "sumatra":
+                            return await self._print_with_sumatra_simple(fused_pdf, printer_name, fused_settings)
+                        elif self.preferred_tool == "adobe":
+                            return await self._print_with_adobe(fused_pdf, printer_name, fused_settings)
+                        else:
+                            return await self._print_with_system_default(fused_pdf, printer_name)
+                    finally:
+                        self._cleanup_temp_file(fused_pdf)
+            
             preprocessed_pdf = None
             
             if rotation != 0:
-                preprocessed_pdf = await self._rotate_pdf_python(pdf_path, rotation)
-                if not preprocessed_pdf and self.ghostscript_path:
+                preprocessed_pdf = None
+                if PIKEPDF_AVAILABLE:
+                    preprocessed_pdf = await self._rotate_pdf_pikepdf(pdf_path, rotation)
+                if not preprocessed_pdf:
+                    preprocessed_pdf = await self._rotate_pdf_python(pdf_path, rotation)
+                if not preprocessed_pdf and (PIKEPDF_AVAILABLE or self.ghostscript_path):
+                    preprocessed_pdf = await self._preprocess_pdf_orientation(pdf_path, settings)
+            elif force_orientation and (PIKEPDF_AVAILABLE or self.ghostscript_path):
+                if await self._needs_orientation_fix(pdf_path, settings):
                     preprocessed_pdf = await self._preprocess_pdf_orientation(pdf_path, settings)
-            elif force_orientation and self.ghostscript_path:
-                preprocessed_pdf = await self._preprocess_pdf_orientation(pdf_path, settings)
             
             if preprocessed_pdf:
                 try:
@@ -855,6 +1937,42 @@ class PrintExecutor:
         else:
             return await self._print_with_system_default(pdf_path, printer_name)
     
+    async def _rotate_pdf_pikepdf(self, pdf_path: str, rotation: int) -> Optional[str]:
+        """Rotate by editing each page's /Rotate key with pikepdf
+
+        A metadata-only rewrite: qpdf copies the content streams through
+        without decompressing them, where the PyPDF2 path rebuilds the
+        whole object graph in Python. Runs on the thread pool since qpdf
+        releases the GIL.
+        """
+        rotation = rotation % 360
+        if rotation == 0:
+            return None
+
+        def _run():
+            out_file = tempfile.NamedTemporaryFile(
+                suffix='_rotated.pdf', delete=False, prefix="rotated_"
+            )
+            out_file.close()
+            try:
+                with pikepdf.open(pdf_path) as pdf:
+                    for page in pdf.pages:
+                        page.Rotate = (int(page.obj.get('/Rotate', 0)) + rotation) % 360
+                    pdf.save(out_file.name, linearize=False)
+                return out_file.name
+            except Exception:
+                try:
+                    os.unlink(out_file.name)
+                except OSError:
+                    pass
+                raise
+
+        try:
+            return await asyncio.to_thread(_run)
+        except Exception as e:
+            self.logger.debug(f"pikepdf rotation failed, falling back: {e}")
+            return None
+
     async def _rotate_pdf_python(self, pdf_path: str, rotation: int) -> Optional[str]:
         """Rotate PDF using Python PDF library"""
         try:
@@ -862,42 +1980,21 @@ class PrintExecutor:
             if rotation == 0:
                 return None
             
-            pdf_lib = None
-            try:
-                import PyPDF2 as pdf_lib
-                pdf_class = pdf_lib.PdfReader
-                pdf_writer_class = pdf_lib.PdfWriter
-            except (ImportError, AttributeError):
-                try:
-                    import PyPDF4 as pdf_lib
-                    pdf_class = pdf_lib.PdfFileReader
-                    pdf_writer_class = pdf_lib.PdfFileWriter
-                except ImportError:
-                    try:
-                        import pypdf as pdf_lib
-                        pdf_class = pdf_lib.PdfReader
-                        pdf_writer_class = pdf_lib.PdfWriter
-                    except ImportError:
-                        return None
-            
-            if not pdf_lib:
+            if _PDF_READER_CLS is None:
                 return None
             
-            async with aiofiles.open(pdf_path, 'rb') as input_file:
-                content = await input_file.read()
-            
-            from io import BytesIO
-            pdf_reader = pdf_class(BytesIO(content))
-            pdf_writer = pdf_writer_class()
+            content = await self._read_pdf_bytes(pdf_path)
             
-            page_count = len(pdf_reader.pages) if hasattr(pdf_reader, 'pages') else pdf_reader.getNumPages()
+            pdf_reader = _open_pdf_reader(BytesIO(content))
+            pdf_writer = _PDF_WRITER_CLS()
             
-            for page_num in range(page_count):
-                if hasattr(pdf_reader, 'pages'):
-                    page = pdf_reader.pages[page_num]
-                    rotated_page = page.rotate(rotation)
-                    pdf_writer.add_page(rotated_page)
-                else:
+            # The API generation is fixed at import time, so each branch
+            # is straight-line code with no per-page hasattr probes
+            if _PDF_NEW_API:
+                for page in pdf_reader.pages:
+                    pdf_writer.add_page(page.rotate(rotation))
+            else:
+                for page_num in range(pdf_reader.getNumPages()):
                     page = pdf_reader.getPage(page_num)
                     if rotation == 90:
                         rotated_page = page.rotateClockwise(90)
@@ -909,55 +2006,125 @@ class PrintExecutor:
                         rotated_page = page
                     pdf_writer.addPage(rotated_page)
             
-            output_file = tempfile.NamedTemporaryFile(
-                suffix='_rotated.pdf', 
-                delete=False,
-                prefix="rotated_"
-            )
+            output_path = await self._new_tempfile('_rotated.pdf', "rotated_")
             
-            pdf_writer.write(output_file)
-            output_file.close()
+            with open(output_path, 'wb') as output_file:
+                pdf_writer.write(output_file)
             
-            if os.path.exists(output_file.name) and os.path.getsize(output_file.name) > 0:
-                return output_file.name
+            if os.path.getsize(output_path) > 0:
+                return output_path
             else:
-                self._cleanup_temp_file(output_file.name)
+                self._cleanup_temp_file(output_path)
                 return None
                     
         except Exception as e:
             self.logger.error(f"Python PDF rotation error: {e}")
             return None
     
-    async def _preprocess_pdf_orientation(self, pdf_path: str, settings: Dict[str, Any]) -> Optional[str]:
-        """Preprocess PDF to fix orientation and rotation using Ghostscript"""
+    async def _needs_orientation_fix(self, pdf_path: str, settings: Dict[str, Any]) -> bool:
+        """Check whether orientation preprocessing would actually change anything
+
+        Documents generated for the requested paper size and orientation
+        are common, and for those the preprocess pass rewrites every page
+        into an identical temp PDF. A pikepdf scan of the page dicts
+        (/Rotate and /MediaBox, no content streams touched) detects that
+        case so the rewrite - and its temp file - can be skipped. Errs on
+        the side of True: any doubt and the normal path runs.
+        """
+        if not PIKEPDF_AVAILABLE:
+            return True
+
+        orientation = settings.get('orientation', 'portrait').lower()
+        paper_size = settings.get('paper_size', 'letter').lower()
+        width, height = _PAPER_SIZES.get(paper_size, (612, 792))
+        if orientation == 'landscape':
+            width, height = height, width
+
+        def _run():
+            with pikepdf.open(pdf_path) as pdf:
+                for page in pdf.pages:
+                    if int(page.obj.get('/Rotate', 0)) % 360 != 0:
+                        return True
+                    box = [float(v) for v in page.obj.get('/MediaBox', [0, 0, 0, 0])]
+                    page_w = abs(box[2] - box[0])
+                    page_h = abs(box[3] - box[1])
+                    if abs(page_w - width) > 1 or abs(page_h - height) > 1:
+                        return True
+            return False
+
         try:
-            output_file = tempfile.NamedTemporaryFile(
-                suffix='_oriented.pdf', 
-                delete=False,
-                prefix="oriented_"
+            return await asyncio.to_thread(_run)
+        except Exception as e:
+            self.logger.debug(f"Orientation check failed, preprocessing anyway: {e}")
+            return True
+
+    async def _preprocess_pdf_orientation(self, pdf_path: str, settings: Dict[str, Any]) -> Optional[str]:
+        """Preprocess PDF to fix orientation and rotation
+
+        pikepdf handles this in-process as page-dict edits (/Rotate and
+        /MediaBox) without decompressing content streams; the Ghostscript
+        re-render only runs when pikepdf is missing or fails.
+        """
+        if PIKEPDF_AVAILABLE:
+            preprocessed = await self._preprocess_orientation_pikepdf(pdf_path, settings)
+            if preprocessed:
+                return preprocessed
+        if not self.ghostscript_path:
+            return None
+        return await self._preprocess_orientation_ghostscript(pdf_path, settings)
+
+    async def _preprocess_orientation_pikepdf(self, pdf_path: str, settings: Dict[str, Any]) -> Optional[str]:
+        """Apply rotation and target page size as pikepdf metadata edits"""
+        rotation = settings.get('rotation', 0) % 360
+        orientation = settings.get('orientation', 'portrait').lower()
+        paper_size = settings.get('paper_size', 'letter').lower()
+
+        width, height = _PAPER_SIZES.get(paper_size, (612, 792))
+        if orientation == 'landscape':
+            width, height = height, width
+
+        def _run():
+            out_file = tempfile.NamedTemporaryFile(
+                suffix='_oriented.pdf', delete=False, prefix="oriented_"
             )
-            output_file.close()
+            out_file.close()
+            try:
+                with pikepdf.open(pdf_path) as pdf:
+                    for page in pdf.pages:
+                        if rotation:
+                            page.Rotate = (int(page.obj.get('/Rotate', 0)) + rotation) % 360
+                        page.MediaBox = [0, 0, width, height]
+                    pdf.save(out_file.name, linearize=False)
+                return out_file.name
+            except Exception:
+                try:
+                    os.unlink(out_file.name)
+                except OSError:
+                    pass
+                raise
+
+        try:
+            return await asyncio.to_thread(_run)
+        except Exception as e:
+            self.logger.debug(f"pikepdf orientation preprocess failed, falling back: {e}")
+            return None
+
+    async def _preprocess_orientation_ghostscript(self, pdf_path: str, settings: Dict[str, Any]) -> Optional[str]:
+        """Preprocess PDF orientation with a Ghostscript re-render"""
+        try:
+            output_path = await self._new_tempfile('_oriented.pdf', "oriented_")
             
             orientation = settings.get('orientation', 'portrait').lower()
             rotation = settings.get('rotation', 0)
             paper_size = settings.get('paper_size', 'letter').lower()
             
-            paper_sizes = {
-                'letter': (612, 792),
-                'a4': (595, 842), 
-                'legal': (612, 1008),
-                'a3': (842, 1191),
-                'tabloid': (792, 1224)
-            }
-            
-            width, height = paper_sizes.get(paper_size, (612, 792))
+            width, height = _PAPER_SIZES.get(paper_size, (612, 792))
             
             target_width, target_height = width, height
             if orientation == 'landscape':
                 target_width, target_height = height, width
             
             cmd = [
-                self.ghostscript_path,
                 "-dNOPAUSE",
                 "-dBATCH",
                 "-sDEVICE=pdfwrite",
@@ -988,56 +2155,40 @@ class PrintExecutor:
             if postscript_commands:
                 cmd.extend(["-c", " ".join(postscript_commands)])
             
-            cmd.extend([pdf_path, f"-sOutputFile={output_file.name}"])
-            
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
+            cmd.extend([pdf_path, f"-sOutputFile={output_path}"])
             
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=10)
+            returncode, stdout, stderr = await self._run_ghostscript(cmd, timeout=10)
             
-            if process.returncode == 0 and os.path.exists(output_file.name):
-                return output_file.name
+            if returncode == 0 and os.path.exists(output_path):
+                return output_path
             else:
-                self._cleanup_temp_file(output_file.name)
+                self._cleanup_temp_file(output_path)
                 return None
                     
         except Exception as e:
             self.logger.error(f"PDF orientation preprocessing error: {e}")
             return None
     
-    async def _print_with_ghostscript_fit_to_paper(self, pdf_path: str, printer_name: str, settings: Dict[str, Any]) -> bool:
-        """Use Ghostscript to properly fit PDF to paper size without cropping"""
+    async def _run_ghostscript_pipeline(self, pdf_path: str, *, page_range: Optional[str] = None,
+                                        rotation: int = 0, paper_size: str = 'letter',
+                                        orientation: str = 'portrait', fit_to_paper: bool = False,
+                                        force_orientation: bool = False) -> Optional[str]:
+        """Run page selection, sizing, rotation and fit as one pdfwrite pass
+
+        Every pdfwrite invocation re-parses and re-emits the whole
+        document, so stacking stages as separate runs multiplies that
+        cost (and writes an intermediate temp PDF per stage). All the
+        flags compose onto one command line with one output file.
+        Only simple "n"/"a-b" ranges map onto -dFirstPage/-dLastPage.
+        """
         try:
-            output_file = tempfile.NamedTemporaryFile(
-                suffix='_fitted.pdf', 
-                delete=False,
-                prefix="fitted_"
-            )
-            output_file.close()
-            
-            paper_size = settings.get('paper_size', 'letter').lower()
-            orientation = settings.get('orientation', 'portrait').lower()
-            rotation = settings.get('rotation', 0)
-            force_orientation = settings.get('force_orientation', False)
-            
-            paper_sizes = {
-                'letter': (612, 792),
-                'a4': (595, 842), 
-                'legal': (612, 1008),
-                'a3': (842, 1191),
-                'tabloid': (792, 1224)
-            }
-            
-            width, height = paper_sizes.get(paper_size, (612, 792))
-            
+            output_path = await self._new_tempfile('_gs_pipeline.pdf', "gs_pipe_")
+
+            width, height = _PAPER_SIZES.get(paper_size, (612, 792))
             if orientation == 'landscape':
                 width, height = height, width
-            
+
             cmd = [
-                self.ghostscript_path,
                 "-dNOPAUSE",
                 "-dBATCH",
                 "-sDEVICE=pdfwrite",
@@ -1046,34 +2197,54 @@ class PrintExecutor:
                 f"-dDEVICEWIDTHPOINTS={width}",
                 f"-dDEVICEHEIGHTPOINTS={height}",
                 "-dFIXEDMEDIA",
-                "-dPDFFitPage",
             ]
-            
-            if force_orientation:
+
+            if page_range:
+                first, _, last = page_range.partition('-')
+                cmd.append(f"-dFirstPage={first}")
+                cmd.append(f"-dLastPage={last or first}")
+
+            if fit_to_paper:
+                cmd.append("-dPDFFitPage")
+
+            rotation = rotation % 360
+            if force_orientation or rotation:
+                cmd.append("-dAutoRotatePages=/None")
+                if rotation:
+                    cmd.extend(["-c", f"<</Orientation {rotation // 90}>> setpagedevice"])
+            elif orientation == 'portrait':
                 cmd.append("-dAutoRotatePages=/None")
-                
-                if rotation and rotation != 0:
-                    rotation = rotation % 360
-                    if rotation != 0:
-                        cmd.extend(["-c", f"<</Orientation {rotation//90}>> setpagedevice"])
             else:
-                if orientation == 'portrait':
-                    cmd.append("-dAutoRotatePages=/None")
-                else:
-                    cmd.append("-dAutoRotatePages=/PageByPage")
-            
+                cmd.append("-dAutoRotatePages=/PageByPage")
+
             cmd.append("-dUseCropBox")
-            cmd.extend([f"-sOutputFile={output_file.name}", pdf_path])
-            
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+            cmd.extend([f"-sOutputFile={output_path}", pdf_path])
+
+            returncode, stdout, stderr = await self._run_ghostscript(cmd, timeout=15)
+
+            if returncode == 0 and os.path.getsize(output_path) > 0:
+                return output_path
+
+            self._cleanup_temp_file(output_path)
+            return None
+
+        except Exception as e:
+            self.logger.error(f"Ghostscript pipeline failed: {e}")
+            return None
+
+    async def _print_with_ghostscript_fit_to_paper(self, pdf_path: str, printer_name: str, settings: Dict[str, Any]) -> bool:
+        """Use Ghostscript to properly fit PDF to paper size without cropping"""
+        try:
+            output_path = await self._run_ghostscript_pipeline(
+                pdf_path,
+                rotation=settings.get('rotation', 0) if settings.get('force_orientation', False) else 0,
+                paper_size=settings.get('paper_size', 'letter').lower(),
+                orientation=settings.get('orientation', 'portrait').lower(),
+                fit_to_paper=True,
+                force_orientation=settings.get('force_orientation', False)
             )
             
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=10)
-            
-            if process.returncode == 0 and os.path.exists(output_file.name):
+            if output_path:
                 fitted_settings = settings.copy()
                 fitted_settings['scaling'] = 'no_scale'
                 fitted_settings.pop('auto_scale', None)
@@ -1081,17 +2252,16 @@ class PrintExecutor:
                 fitted_settings['force_orientation'] = True
                 
                 if self.preferred_tool == "sumatra":
-                    success = await self._print_with_sumatra_simple(output_file.name, printer_name, fitted_settings)
+                    success = await self._print_with_sumatra_simple(output_path, printer_name, fitted_settings)
                 elif self.preferred_tool == "adobe":
-                    success = await self._print_with_adobe(output_file.name, printer_name, fitted_settings)
+                    success = await self._print_with_adobe(output_path, printer_name, fitted_settings)
                 else:
-                    success = await self._print_with_system_default(output_file.name, printer_name)
+                    success = await self._print_with_system_default(output_path, printer_name)
                 
-                self._cleanup_temp_file(output_file.name)
+                self._cleanup_temp_file(output_path)
                 return success
                 
             else:
-                self._cleanup_temp_file(output_file.name)
                 return False
                 
         except Exception as e:
@@ -1103,53 +2273,15 @@ class PrintExecutor:
         try:
             cmd = [self.sumatra_path, "-print-to", printer_name, "-silent"]
             
-            print_settings = []
-            
-            copies = settings.get('copies', 1)
-            if copies > 1:
-                print_settings.append(f"copies={copies}")
-            
-            orientation = settings.get('orientation', '').lower()
-            scaling_mode = settings.get('scaling', 'auto_scale').lower()
-            
-            if orientation == 'landscape':
-                print_settings.append("orientation=landscape")
-            elif orientation == 'portrait':
-                print_settings.append("orientation=portrait")
-            
-            if scaling_mode in ['fit_to_paper', 'fit_to_paper_enhanced']:
-                print_settings.append("duplex=off")
-            
-            if scaling_mode == 'fit_to_paper_enhanced':
-                print_settings.append("scale=noscale")
-                print_settings.append("autorotate=yes")
-                print_settings.append("center=yes")
-            elif scaling_mode == 'fit_to_paper':
-                print_settings.append("scale=noscale")
-                print_settings.append("autorotate=yes")
-            elif scaling_mode == 'fit_to_paper_force':
-                print_settings.append("scale=fit")
-                print_settings.append("autorotate=yes")
-            elif scaling_mode == 'shrink_to_fit':
-                print_settings.append("scale=shrink")
-            elif scaling_mode == 'actual_size' or scaling_mode == 'none':
-                print_settings.append("scale=none")
-            elif scaling_mode == 'no_scale':
-                print_settings.append("scale=noscale")
-            elif scaling_mode.startswith('custom_'):
-                try:
-                    scale_percent = int(scaling_mode.split('_')[1])
-                    if 10 <= scale_percent <= 500:
-                        print_settings.append(f"scale={scale_percent}%")
-                    else:
-                        print_settings.append("scale=noscale")
-                except (ValueError, IndexError):
-                    print_settings.append("scale=noscale")
-            elif settings.get('auto_scale', True):
-                print_settings.append("scale=shrink")
+            print_settings = _build_sumatra_settings(
+                settings.get('copies', 1),
+                settings.get('orientation', '').lower(),
+                settings.get('scaling', 'auto_scale').lower(),
+                bool(settings.get('auto_scale', True))
+            )
             
             if print_settings:
-                cmd.extend(["-print-settings", ",".join(print_settings)])
+                cmd.extend(["-print-settings", print_settings])
             
             cmd.append(pdf_path)
             
@@ -1222,16 +2354,87 @@ class PrintExecutor:
             return False
     
     def _cleanup_temp_file(self, file_path: str):
-        """Clean up temporary files safely"""
+        """Queue a temporary file for background deletion
+
+        The unlink happens in the batch cleanup worker so jobs never pay
+        for filesystem deletion inline; without a running loop (tests,
+        shutdown) it falls back to deleting immediately.
+        """
+        if not file_path:
+            return
+        self._content_bytes.pop(file_path, None)
         try:
-            if file_path and os.path.exists(file_path):
-                os.unlink(file_path)
-        except Exception as e:
-            self.logger.warning(f"Failed to cleanup {file_path}: {e}")
+            asyncio.get_running_loop()
+        except RuntimeError:
+            try:
+                if os.path.exists(file_path):
+                    os.unlink(file_path)
+            except Exception as e:
+                self.logger.warning(f"Failed to cleanup {file_path}: {e}")
+            return
+
+        self._ensure_cleanup_worker()
+        PrintExecutor._cleanup_queue.put_nowait(file_path)
+
+    @classmethod
+    def _ensure_cleanup_worker(cls):
+        """Start the batch cleanup task once per loop"""
+        if cls._cleanup_task is None or cls._cleanup_task.done():
+            cls._cleanup_task = asyncio.create_task(cls._cleanup_worker())
+
+    @classmethod
+    async def _cleanup_worker(cls):
+        """Drain queued temp paths and unlink them in one thread hop"""
+        logger = logging.getLogger(__name__)
+        while True:
+            paths = [await cls._cleanup_queue.get()]
+            while not cls._cleanup_queue.empty():
+                paths.append(cls._cleanup_queue.get_nowait())
+            try:
+                await asyncio.to_thread(cls._unlink_all, paths, logger)
+            finally:
+                for _ in paths:
+                    cls._cleanup_queue.task_done()
+
+    @staticmethod
+    def _unlink_all(paths: List[str], logger):
+        """Delete a batch of files, logging (not raising) per-file errors"""
+        for path in paths:
+            try:
+                if os.path.exists(path):
+                    os.unlink(path)
+            except Exception as e:
+                logger.warning(f"Failed to cleanup {path}: {e}")
     
+    @staticmethod
+    def _compress_page_list(pages: List[int]) -> str:
+        """Collapse a sorted page list into range notation ("1-5,7,9-10")"""
+        if not pages:
+            return ""
+        parts = []
+        run_start = prev = pages[0]
+        for page in pages[1:]:
+            if page == prev + 1:
+                prev = page
+                continue
+            parts.append(str(run_start) if run_start == prev else f"{run_start}-{prev}")
+            run_start = prev = page
+        parts.append(str(run_start) if run_start == prev else f"{run_start}-{prev}")
+        return ",".join(parts)
+
     async def _extract_pages(self, pdf_path: str, page_range: str) -> Optional[str]:
         """Extract specific pages from PDF"""
         try:
+            # Fast path: a range covering the whole document needs no
+            # extraction at all (page count is memoized, so this check is
+            # cheap after the first lookup)
+            page_count = await self._get_pdf_page_count(pdf_path)
+            if page_count:
+                selected = self._parse_page_range(page_range, page_count)
+                if selected == list(range(page_count)):
+                    self.logger.debug("Page range covers whole document, skipping extraction")
+                    return pdf_path
+
             if self.pdftk_path:
                 return await self._extract_pages_pdftk(pdf_path, page_range)
             elif self.ghostscript_path:
@@ -1245,14 +2448,9 @@ class PrintExecutor:
     async def _extract_pages_pdftk(self, pdf_path: str, page_range: str) -> Optional[str]:
         """Extract pages using PDFtk"""
         try:
-            output_file = tempfile.NamedTemporaryFile(
-                suffix='_extracted.pdf', 
-                delete=False,
-                prefix="extracted_"
-            )
-            output_file.close()
+            output_path = await self._new_tempfile('_extracted.pdf', "extracted_")
             
-            cmd = [self.pdftk_path, pdf_path, "cat", page_range, "output", output_file.name]
+            cmd = [self.pdftk_path, pdf_path, "cat", page_range, "output", output_path]
             
             process = await asyncio.create_subprocess_exec(
                 *cmd,
@@ -1262,10 +2460,10 @@ class PrintExecutor:
             
             stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=10)
             
-            if process.returncode == 0 and os.path.exists(output_file.name):
-                return output_file.name
+            if process.returncode == 0 and os.path.exists(output_path):
+                return output_path
             else:
-                self._cleanup_temp_file(output_file.name)
+                self._cleanup_temp_file(output_path)
                 return None
                 
         except Exception as e:
@@ -1275,12 +2473,7 @@ class PrintExecutor:
     async def _extract_pages_ghostscript(self, pdf_path: str, page_range: str) -> Optional[str]:
         """Extract pages using Ghostscript"""
         try:
-            output_file = tempfile.NamedTemporaryFile(
-                suffix='_extracted.pdf', 
-                delete=False,
-                prefix="extracted_"
-            )
-            output_file.close()
+            output_path = await self._new_tempfile('_extracted.pdf', "extracted_")
             
             if page_range == "1":
                 gs_range = "1-1"
@@ -1289,29 +2482,20 @@ class PrintExecutor:
             else:
                 gs_range = f"{page_range}-{page_range}"
             
-            cmd = [
-                self.ghostscript_path,
+            returncode, stdout, stderr = await self._run_ghostscript([
                 "-dNOPAUSE",
                 "-dBATCH",
                 "-sDEVICE=pdfwrite",
                 f"-dFirstPage={gs_range.split('-')[0]}",
                 f"-dLastPage={gs_range.split('-')[-1]}",
-                f"-sOutputFile={output_file.name}",
+                f"-sOutputFile={output_path}",
                 pdf_path
-            ]
-            
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=10)
+            ], timeout=10)
             
-            if process.returncode == 0 and os.path.exists(output_file.name):
-                return output_file.name
+            if returncode == 0 and os.path.exists(output_path):
+                return output_path
             else:
-                self._cleanup_temp_file(output_file.name)
+                self._cleanup_temp_file(output_path)
                 return None
                 
         except Exception as e:
@@ -1321,25 +2505,7 @@ class PrintExecutor:
     async def _extract_pages_python(self, pdf_path: str, page_range: str) -> Optional[str]:
         """Extract pages using Python"""
         try:
-            pdf_lib = None
-            try:
-                import PyPDF2 as pdf_lib
-                pdf_class = pdf_lib.PdfFileReader
-                pdf_writer_class = pdf_lib.PdfFileWriter
-            except ImportError:
-                try:
-                    import PyPDF4 as pdf_lib
-                    pdf_class = pdf_lib.PdfFileReader
-                    pdf_writer_class = pdf_lib.PdfFileWriter
-                except ImportError:
-                    try:
-                        import pypdf as pdf_lib
-                        pdf_class = pdf_lib.PdfReader
-                        pdf_writer_class = pdf_lib.PdfWriter
-                    except ImportError:
-                        return None
-            
-            if not pdf_lib:
+            if _PDF_READER_CLS is None:
                 return None
             
             if page_range == "1":
@@ -1350,54 +2516,256 @@ class PrintExecutor:
             else:
                 pages_to_extract = [int(page_range) - 1]
             
-            async with aiofiles.open(pdf_path, 'rb') as input_file:
-                content = await input_file.read()
+            content = await self._read_pdf_bytes(pdf_path)
             
-            from io import BytesIO
-            pdf_reader = pdf_class(BytesIO(content))
-            pdf_writer = pdf_writer_class()
+            pdf_reader = _open_pdf_reader(BytesIO(content))
+            pdf_writer = _PDF_WRITER_CLS()
             
-            for page_num in pages_to_extract:
-                if page_num < len(pdf_reader.pages if hasattr(pdf_reader, 'pages') else pdf_reader.getNumPages()):
-                    if hasattr(pdf_reader, 'pages'):
-                        pdf_writer.add_page(pdf_reader.pages[page_num])
-                    else:
+            if _PDF_NEW_API:
+                pages = pdf_reader.pages
+                page_count = len(pages)
+                for page_num in pages_to_extract:
+                    if page_num < page_count:
+                        pdf_writer.add_page(pages[page_num])
+            else:
+                page_count = pdf_reader.getNumPages()
+                for page_num in pages_to_extract:
+                    if page_num < page_count:
                         pdf_writer.addPage(pdf_reader.getPage(page_num))
             
-            output_file = tempfile.NamedTemporaryFile(
-                suffix='_extracted.pdf', 
-                delete=False,
-                prefix="extracted_"
-            )
+            output_path = await self._new_tempfile('_extracted.pdf', "extracted_")
             
-            pdf_writer.write(output_file)
-            output_file.close()
+            with open(output_path, 'wb') as output_file:
+                pdf_writer.write(output_file)
             
-            if os.path.exists(output_file.name) and os.path.getsize(output_file.name) > 0:
-                return output_file.name
+            if os.path.getsize(output_path) > 0:
+                return output_path
             else:
-                self._cleanup_temp_file(output_file.name)
+                self._cleanup_temp_file(output_path)
                 return None
                     
         except Exception as e:
             self.logger.error(f"Python PDF extraction error: {e}")
             return None
     
+    async def _remember_page_count(self, pdf_path: str, count: int):
+        """Seed the page-count memo from a stage that already parsed the PDF
+
+        Later pipeline steps then answer _get_pdf_page_count from the memo
+        instead of re-parsing the same file.
+        """
+        try:
+            key = (pdf_path, os.path.getmtime(pdf_path))
+        except OSError:
+            return
+        async with self._page_count_lock:
+            self._page_count_cache[key] = count
+            self._page_count_cache.move_to_end(key)
+            if len(self._page_count_cache) > 128:
+                self._page_count_cache.popitem(last=False)
+
     async def _get_pdf_page_count(self, pdf_path: str) -> Optional[int]:
-        """Get the number of pages in a PDF"""
+        """Get the number of pages in a PDF (memoized by path + mtime)"""
         try:
-            if self.pdftk_path:
-                return await self._get_page_count_pdftk(pdf_path)
-            
-            if self.ghostscript_path:
-                return await self._get_page_count_ghostscript(pdf_path)
-            
-            return await self._get_page_count_python(pdf_path)
+            try:
+                key = (pdf_path, os.path.getmtime(pdf_path))
+            except OSError:
+                key = None
+
+            if key is not None:
+                async with self._page_count_lock:
+                    if key in self._page_count_cache:
+                        self._page_count_cache.move_to_end(key)
+                        return self._page_count_cache[key]
+
+            # Temp paths are unique per job, so the path memo misses when
+            # the same document is downloaded again; the fingerprint
+            # cache catches those repeats before any parsing or spawning
+            fingerprint = await asyncio.to_thread(self._content_fingerprint, pdf_path)
+            hash_cache = PrintExecutor._page_count_by_hash
+            if fingerprint is not None:
+                async with self._page_count_lock:
+                    if fingerprint in hash_cache:
+                        hash_cache.move_to_end(fingerprint)
+                        count = hash_cache[fingerprint]
+                        if key is not None:
+                            self._page_count_cache[key] = count
+                        return count
+
+            # The xref tail parser answers from a few KB of reads without
+            # touching the page objects at all; pikepdf covers documents
+            # it cannot handle (xref streams), and the external tools are
+            # only consulted after both in-process paths fail
+            count = await asyncio.to_thread(self._page_count_from_xref, pdf_path)
+            if count is None and PIKEPDF_AVAILABLE:
+                count = await self._get_page_count_pikepdf(pdf_path)
+            if count is None:
+                if self.pdftk_path:
+                    count = await self._get_page_count_pdftk(pdf_path)
+                elif self.ghostscript_path:
+                    count = await self._get_page_count_ghostscript(pdf_path)
+                else:
+                    count = await self._get_page_count_python(pdf_path)
+
+            if count is not None:
+                async with self._page_count_lock:
+                    if key is not None:
+                        self._page_count_cache[key] = count
+                        if len(self._page_count_cache) > 128:
+                            self._page_count_cache.popitem(last=False)
+                    if fingerprint is not None:
+                        hash_cache[fingerprint] = count
+                        if len(hash_cache) > PrintExecutor.PAGE_COUNT_HASH_ENTRIES:
+                            hash_cache.popitem(last=False)
+
+            return count
             
         except Exception as e:
             self.logger.error(f"Failed to get PDF page count: {e}")
             return None
 
+    def _content_fingerprint(self, pdf_path: str) -> Optional[tuple]:
+        """Fingerprint a PDF as (md5 of first 64KB, total size)
+
+        The header plus the leading objects pin down the document for
+        cache purposes without hashing multi-MB files; size breaks the
+        rare tie between documents sharing a prefix.
+        """
+        try:
+            cached = self._content_bytes.get(pdf_path)
+            if cached is not None:
+                return (hashlib.md5(cached[:65536]).hexdigest(), len(cached))
+            with open(pdf_path, 'rb') as f:
+                head = f.read(65536)
+            return (hashlib.md5(head).hexdigest(), os.path.getsize(pdf_path))
+        except OSError:
+            return None
+
+    def _page_count_from_xref(self, pdf_path: str) -> Optional[int]:
+        """Read the page count straight from the cross-reference tail
+
+        A well-formed PDF records /Count in the root /Pages node, reachable
+        from the trailer in three small seeks: startxref at the file tail,
+        the trailer's /Root reference, and the catalog's /Pages reference.
+        That keeps I/O to a few KB regardless of document size, where the
+        library fallbacks read and parse the whole file. Only classic xref
+        tables are handled - documents using cross-reference streams (or
+        anything else surprising) return None and fall through.
+        """
+        try:
+            cached = self._content_bytes.get(pdf_path)
+            stream = BytesIO(cached) if cached is not None else open(pdf_path, 'rb')
+            try:
+                head = stream.read(1024)
+                stream.seek(0, os.SEEK_END)
+                size = stream.tell()
+                stream.seek(max(0, size - 2048))
+                tail = stream.read()
+
+                # Linearized files carry the count in their first KB; an
+                # incremental update would make that stale, so only trust
+                # it when the tail trailer shows no /Prev chain
+                lin_match = _LINEARIZED_N_RE.search(head)
+                if lin_match and b'/Prev' not in tail:
+                    return int(lin_match.group(1))
+
+                idx = tail.rfind(b'startxref')
+                if idx < 0:
+                    return None
+                match = _XREF_STARTXREF_RE.match(tail, idx)
+                if not match:
+                    return None
+
+                # Walk the trailer chain, newest first: the most recent
+                # xref section wins for both object offsets and /Root
+                offsets: Dict[int, int] = {}
+                root_num = None
+                xref_offset = int(match.group(1))
+                for _ in range(8):
+                    trailer = self._read_xref_section(stream, xref_offset, offsets)
+                    if trailer is None:
+                        return None
+                    if root_num is None:
+                        root_match = _XREF_ROOT_RE.search(trailer)
+                        if root_match:
+                            root_num = int(root_match.group(1))
+                    prev_match = _XREF_PREV_RE.search(trailer)
+                    if not prev_match:
+                        break
+                    xref_offset = int(prev_match.group(1))
+                if root_num is None:
+                    return None
+
+                catalog = self._read_object_at(stream, offsets.get(root_num), root_num)
+                if catalog is None:
+                    return None
+                pages_match = _XREF_PAGES_RE.search(catalog)
+                if not pages_match:
+                    return None
+                pages_num = int(pages_match.group(1))
+
+                pages = self._read_object_at(stream, offsets.get(pages_num), pages_num)
+                if pages is None:
+                    return None
+                count_match = _XREF_COUNT_RE.search(pages)
+                if count_match:
+                    return int(count_match.group(1))
+                return None
+            finally:
+                stream.close()
+        except Exception as e:
+            self.logger.debug(f"xref page count failed, falling back: {e}")
+            return None
+
+    @staticmethod
+    def _read_xref_section(stream, offset: int, offsets: Dict[int, int]) -> Optional[bytes]:
+        """Parse one classic xref table, filling offsets, returning the trailer
+
+        Entries already present in offsets are newer and are kept. Returns
+        None for cross-reference streams and malformed tables.
+        """
+        stream.seek(offset)
+        if stream.readline().strip() != b'xref':
+            return None
+        while True:
+            line = stream.readline().strip()
+            if line == b'trailer':
+                return stream.read(1024)
+            parts = line.split()
+            if len(parts) != 2 or not parts[0].isdigit() or not parts[1].isdigit():
+                return None
+            start, entry_count = int(parts[0]), int(parts[1])
+            for obj_num in range(start, start + entry_count):
+                entry = stream.read(20)
+                if len(entry) < 18:
+                    return None
+                if entry[17:18] == b'n' and obj_num not in offsets:
+                    offsets[obj_num] = int(entry[:10])
+
+    @staticmethod
+    def _read_object_at(stream, offset: Optional[int], obj_num: int) -> Optional[bytes]:
+        """Read an indirect object's dict bytes, verifying the object number"""
+        if offset is None:
+            return None
+        stream.seek(offset)
+        data = stream.read(2048)
+        header = data.split(b'obj', 1)[0].split()
+        if not header or header[0] != str(obj_num).encode():
+            return None
+        return data
+
+    async def _get_page_count_pikepdf(self, pdf_path: str) -> Optional[int]:
+        """Get page count from the /Pages tree via pikepdf"""
+        def _run():
+            with pikepdf.open(pdf_path) as pdf:
+                return len(pdf.pages)
+
+        try:
+            return await asyncio.to_thread(_run)
+        except Exception as e:
+            self.logger.debug(f"pikepdf page count failed: {e}")
+            return None
+
     async def _get_page_count_pdftk(self, pdf_path: str) -> Optional[int]:
         """Get page count using PDFtk"""
         try:
@@ -1412,10 +2780,9 @@ class PrintExecutor:
             stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=5)
             
             if process.returncode == 0:
-                output = stdout.decode()
-                for line in output.split('\n'):
-                    if line.startswith('NumberOfPages:'):
-                        return int(line.split(':')[1].strip())
+                match = _PDFTK_PAGES_RE.search(stdout)
+                if match:
+                    return int(match.group(1))
             
             return None
             
@@ -1423,28 +2790,32 @@ class PrintExecutor:
             return None
 
     async def _get_page_count_ghostscript(self, pdf_path: str) -> Optional[int]:
-        """Get page count using Ghostscript"""
+        """Get page count using Ghostscript
+
+        On-disk documents go through the persistent interpreter, paying
+        only a stdin round trip per query; in-memory documents keep the
+        one-shot stdin-piped invocation, since the daemon's stdin is its
+        command channel and cannot also carry the PDF bytes.
+        """
         try:
-            cmd = [
-                self.ghostscript_path,
+            # Downloaded documents are still sitting in the content-bytes
+            # cache; piping them over stdin saves gs a second disk read
+            content = self._content_bytes.get(pdf_path)
+            if content is None:
+                count = await self._gs_count_via_daemon(pdf_path)
+                if count is not None:
+                    return count
+            returncode, stdout, stderr = await self._run_ghostscript([
                 "-dNODISPLAY",
                 "-dBATCH",
                 "-dNOPAUSE",
                 "-c",
                 "pdfpagecount",
                 "-f",
-                pdf_path
-            ]
+                "-" if content is not None else pdf_path
+            ], timeout=5, input_bytes=content)
             
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=5)
-            
-            if process.returncode == 0:
+            if returncode == 0:
                 output = stdout.decode().strip()
                 try:
                     return int(output.split()[-1])
@@ -1456,32 +2827,62 @@ class PrintExecutor:
         except Exception as e:
             return None
 
+    async def _gs_count_via_daemon(self, pdf_path: str) -> Optional[int]:
+        """Ask the persistent Ghostscript interpreter for a page count
+
+        Process creation dominates one-shot gs invocations (~50-200ms on
+        Windows versus microseconds of counting); one interpreter kept in
+        -dNODISPLAY mode amortizes that across every query. The lock
+        serializes the stdin/stdout conversation; anything unexpected
+        tears the daemon down so the caller falls back to a one-shot run.
+        """
+        try:
+            async with self._gs_count_lock:
+                process = self._gs_count_process
+                if process is None or process.returncode is not None:
+                    process = await asyncio.create_subprocess_exec(
+                        self.ghostscript_path,
+                        "-dNODISPLAY", "-dNOPAUSE", "-q",
+                        stdin=asyncio.subprocess.PIPE,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.DEVNULL
+                    )
+                    self._gs_count_process = process
+
+                # PostScript string literal: backslashes and parens escaped
+                escaped = (pdf_path.replace('\\', '\\\\')
+                           .replace('(', '\\(').replace(')', '\\)'))
+                process.stdin.write(f"({escaped}) pdfpagecount = flush\n".encode())
+                await process.stdin.drain()
+                line = await asyncio.wait_for(process.stdout.readline(), timeout=5)
+                return int(line.strip())
+        except Exception as e:
+            self.logger.debug(f"Ghostscript count daemon failed, falling back: {e}")
+            self._shutdown_gs_count_daemon()
+            return None
+
+    def _shutdown_gs_count_daemon(self):
+        """Terminate the persistent Ghostscript interpreter, if running"""
+        process = self._gs_count_process
+        self._gs_count_process = None
+        if process is not None and process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+
     async def _get_page_count_python(self, pdf_path: str) -> Optional[int]:
         """Get page count using Python PDF library"""
         try:
-            try:
-                import PyPDF2 as pdf_lib
-                pdf_class = pdf_lib.PdfFileReader
-            except ImportError:
-                try:
-                    import PyPDF4 as pdf_lib
-                    pdf_class = pdf_lib.PdfFileReader
-                except ImportError:
-                    try:
-                        import pypdf as pdf_lib
-                        pdf_class = pdf_lib.PdfReader
-                    except ImportError:
-                        return None
+            if _PDF_READER_CLS is None:
+                return None
             
-            async with aiofiles.open(pdf_path, 'rb') as file:
-                content = await file.read()
+            content = await self._read_pdf_bytes(pdf_path)
             
-            from io import BytesIO
-            pdf_reader = pdf_class(BytesIO(content))
-            if hasattr(pdf_reader, 'pages'):
+            pdf_reader = _open_pdf_reader(BytesIO(content))
+            if _PDF_NEW_API:
                 return len(pdf_reader.pages)
-            else:
-                return pdf_reader.getNumPages()
+            return pdf_reader.getNumPages()
             
         except Exception as e:
             return None
@@ -1504,20 +2905,35 @@ class PrintExecutor:
                 return False
             
             try:
-                # Execute all printer assignments concurrently
-                tasks = []
-                for assignment in printer_assignments:
-                    task = self._print_pages_to_printer(
-                        pdf_path=pdf_path,
-                        printer_name=assignment['printer_name'],
-                        page_range=assignment.get('pages', 'all'),
-                        settings=assignment.get('settings', {})
-                    )
-                    tasks.append(task)
+                # Execute printer assignments concurrently, but bounded:
+                # each assignment runs its own prepare/crop/extract stages
+                # before reaching the print semaphore, and an unbounded
+                # gather would start all of them at once on large fleets
+                dispatch_gate = asyncio.Semaphore(PrintExecutor.MULTI_DISPATCH_CONCURRENCY)
                 
-                results = await asyncio.gather(*tasks, return_exceptions=True)
+                async def _bounded(assignment):
+                    async with dispatch_gate:
+                        # wait_for cancels the wedged pipeline (semaphores
+                        # release via their async with), and the timeout
+                        # lands in the results as a per-printer failure
+                        return await asyncio.wait_for(
+                            self._print_pages_to_printer(
+                                pdf_path=pdf_path,
+                                printer_name=assignment['printer_name'],
+                                page_range=assignment.get('pages', 'all'),
+                                settings=assignment.get('settings', {})
+                            ),
+                            timeout=PrintExecutor.MULTI_PRINT_TIMEOUT
+                        )
+                
+                results = await self._gather_guarded(
+                    [_bounded(assignment) for assignment in printer_assignments]
+                )
                 
-                successful = sum(1 for result in results if result is True)
+                # C-level count in listobject; the tasks only ever return
+                # bool (exceptions stay as exception objects), so ==True
+                # matching is equivalent to the old identity test
+                successful = results.count(True)
                 total = len(results)
                 
                 if self.logger.isEnabledFor(logging.INFO):
@@ -1539,15 +2955,16 @@ class PrintExecutor:
             if page_range and page_range != 'all':
                 job_settings['page_range'] = page_range
             
-            job = {
-                'printer_name': printer_name,
-                'settings': job_settings
-            }
-            
+            # The prepared file is handed over directly and flagged as
+            # dispatcher-owned: every assignment reads the same on-disk
+            # copy (one file in the OS cache for all print subprocesses)
+            # instead of staging a private duplicate per printer
             return await self.execute_print_job({
-                **job,
-                'content_type': 'pdf',
-                'content_url': f'file://{pdf_path}',
+                'printer_name': printer_name,
+                'settings': job_settings,
+                'content_type': 'file',
+                'file_path': pdf_path,
+                'retain_source': True,
                 'id': f'multi_page_{int(time.time())}'
             })
             
@@ -1556,11 +2973,16 @@ class PrintExecutor:
             return False
     
     def get_performance_stats(self) -> Dict[str, Any]:
-        """Get performance statistics"""
+        """Get performance statistics (rebuilt only when the counters move)"""
+        key = (self.jobs_processed, self.successful_jobs, self.preferred_tool)
+        if self._stats_cache is not None and self._stats_cache_key == key:
+            return self._stats_cache
+        
         avg_time = (self.total_processing_time / self.jobs_processed) if self.jobs_processed > 0 else 0
         success_rate = (self.successful_jobs / self.jobs_processed * 100) if self.jobs_processed > 0 else 0
         
-        return {
+        self._stats_cache_key = key
+        self._stats_cache = {
             "jobs_processed": self.jobs_processed,
             "successful_jobs": self.successful_jobs,
             "failed_jobs": self.jobs_processed - self.successful_jobs,
@@ -1570,31 +2992,15 @@ class PrintExecutor:
             "preferred_tool": self.preferred_tool,
             "concurrent_print_limit": PrintExecutor._print_semaphore._value
         }
+        return self._stats_cache
     
     def _get_page_extraction_method(self) -> str:
-        """Get the preferred page extraction method"""
-        if self.pdftk_path:
-            return "pdftk"
-        elif self.ghostscript_path:
-            return "ghostscript"
-        else:
-            return "python_builtin"
+        """Get the preferred page extraction method (decided at tool selection)"""
+        return self._page_extraction_method
     
     def _python_pdf_available(self) -> bool:
-        """Check if Python PDF libraries are available"""
-        try:
-            import PyPDF2
-            return True
-        except ImportError:
-            try:
-                import PyPDF4
-                return True
-            except ImportError:
-                try:
-                    import pypdf
-                    return True
-                except ImportError:
-                    return False
+        """Check if Python PDF libraries are available (bound at import)"""
+        return _PYTHON_PDF_AVAILABLE
     
     def get_tool_info(self) -> Dict[str, Any]:
         """Get information about available PDF tools"""
@@ -3,36 +3,151 @@ Printer Manager
 Handles printer detection, capabilities, and status monitoring
 """
 
+import asyncio
 import logging
+import re
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Any
 
 try:
     import win32print
     import win32api
+    import win32event
     WIN32_AVAILABLE = True
 except ImportError:
     WIN32_AVAILABLE = False
 
+# Spooler status codes are dense 0..17 integers, so text lookup is a
+# straight tuple index; the offline sets back _is_printer_online without
+# rebuilding list literals per call
+_STATUS_TEXT = (
+    "Ready", "Paused", "Error", "Idle", "Paper Jam", "Paper Out",
+    "Manual Feed Required", "Paper Problem", "Offline", "I/O Active",
+    "Busy", "Printing", "Output Bin Full", "Not Available", "Waiting",
+    "Processing", "Initializing", "Warming Up"
+)
+_OFFLINE_STATUS_NETWORK = frozenset((8, 13))
+_OFFLINE_STATUS_DEFAULT = frozenset((2, 8, 13))
+
+# Capability tables are immutable data; building them as fresh dict/list
+# literals per printer per refresh allocated the same ~20 objects over
+# and over. They only ever flow out through JSON serialization, so the
+# shared tuples are safe to hand to every printer entry.
+_PAPER_SIZES_FULL = (
+    {"name": "A4", "width": 210, "height": 297, "units": "mm"},
+    {"name": "Letter", "width": 8.5, "height": 11, "units": "inches"},
+    {"name": "Legal", "width": 8.5, "height": 14, "units": "inches"},
+    {"name": "A3", "width": 297, "height": 420, "units": "mm"}
+)
+_PAPER_SIZES_DEFAULT = _PAPER_SIZES_FULL[:2]
+_ORIENTATIONS = ("Portrait", "Landscape")
+_PRINT_QUALITIES_FULL = ("Draft", "Normal", "High", "Best")
+_PRINT_QUALITIES_DEFAULT = ("Draft", "Normal", "High")
+_COLOR_MODES_FULL = ("Color", "Grayscale", "Black and White")
+_COLOR_MODES_MONO = ("Black and White", "Grayscale")
+_DUPLEX_MODES_FULL = ("None", "Long Edge", "Short Edge")
+_DUPLEX_MODES_NONE = ("None",)
+_SCALING_FULL = {
+    "auto_scale": True,
+    "fit_to_page": True,
+    "custom_scale": True,
+    "scale_range": {"min": 25, "max": 400}
+}
+_SCALING_DEFAULT = {
+    "auto_scale": True,
+    "fit_to_page": True,
+    "custom_scale": False,
+    "scale_range": {"min": 100, "max": 100}
+}
+
+# Every capability keyword in one alternation: a single C-level scan of
+# the printer name replaces three lowered copies and three any() sweeps
+_CAPABILITY_KW_RE = re.compile(
+    r'colour|color|inkjet|laser|mono|duplex|double-sided|photo|borderless',
+    re.IGNORECASE
+)
+
 class PrinterManager:
     """Manages printer detection and capabilities"""
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.printers: List[Dict[str, Any]] = []
+        # Copy-on-write snapshot: refresh builds a fresh tuple and swaps
+        # it in with one attribute assignment (atomic under the GIL), so
+        # readers never take a lock and never see a half-built list
+        self.printers: tuple = ()
         self.last_refresh = 0
         self.refresh_lock = threading.Lock()
+
+        # Set by the change-notification listener when the spooler reports
+        # a printer change; get_printers() refreshes on it instead of on a
+        # wall-clock staleness guess
+        self._dirty = False
+        self._listener_active = False
+
+        # Lookup structures rebuilt once per refresh: case-folded name
+        # index plus precomputed default/online views, so the per-job
+        # lookups stop scanning (and re-lowercasing) the whole list
+        self._name_index: Dict[str, Dict[str, Any]] = {}
+        self._default_printer: Optional[Dict[str, Any]] = None
+        self._online_printers: tuple = ()
         
         # Initialize printer list
         self.refresh_printers()
+        self._start_change_listener()
+    
+    def _start_change_listener(self):
+        """Subscribe to spooler change notifications on a daemon thread
+
+        FindFirstPrinterChangeNotification turns the periodic full
+        re-enumeration into an event: the thread blocks in the kernel
+        until a printer is added, removed or changes state, then marks
+        the cached list dirty. While the listener runs, unchanged fleets
+        pay zero EnumPrinters/GetPrinter RPCs; if it cannot start, the
+        time-based staleness refresh stays as the fallback.
+        """
+        if not WIN32_AVAILABLE:
+            return
+        try:
+            thread = threading.Thread(
+                target=self._watch_printer_changes,
+                name="printer-change-listener",
+                daemon=True
+            )
+            thread.start()
+            self._listener_active = True
+        except Exception as e:
+            self.logger.warning(f"Printer change listener not started: {e}")
+
+    def _watch_printer_changes(self):
+        """Block on spooler change notifications and mark the cache dirty"""
+        try:
+            # A NULL printer name opens the local print server, so one
+            # subscription covers every installed printer
+            handle = win32print.OpenPrinter(None)
+            notification = win32print.FindFirstPrinterChangeNotification(
+                handle, win32print.PRINTER_CHANGE_PRINTER, 0, None
+            )
+            while True:
+                result = win32event.WaitForSingleObject(notification, win32event.INFINITE)
+                if result != win32event.WAIT_OBJECT_0:
+                    break
+                win32print.FindNextPrinterChangeNotification(notification)
+                self._dirty = True
+        except Exception as e:
+            self.logger.warning(f"Printer change listener stopped: {e}")
+        finally:
+            self._listener_active = False
     
     def refresh_printers(self):
         """Refresh the complete printer list with capabilities"""
+        # The lock only serializes concurrent refreshers; readers go
+        # through the published snapshot and never wait on it
         with self.refresh_lock:
             try:
                 self.logger.info("Refreshing printer list...")
-                self.printers = []
                 
                 if not WIN32_AVAILABLE:
                     self._create_fallback_printers()
@@ -47,12 +162,18 @@ class PrinterManager:
                     
                     self.logger.debug(f"Found {len(printers)} raw printers")
                     
-                    for printer_tuple in printers:
-                        printer_name = printer_tuple[2]  # Name is at index 2
-                        printer_info = self._get_printer_details(printer_name)
-                        
-                        if printer_info:
-                            self.printers.append(printer_info)
+                    # Each OpenPrinter/GetPrinter pair is a blocking RPC
+                    # (50-200ms on network printers) and win32print drops
+                    # the GIL inside the call, so fetching details in a
+                    # thread pool is close to linear in worker count
+                    names = [printer_tuple[2] for printer_tuple in printers]
+                    if len(names) > 1:
+                        workers = min(16, len(names))
+                        with ThreadPoolExecutor(max_workers=workers) as executor:
+                            details = executor.map(self._get_printer_details, names)
+                    else:
+                        details = map(self._get_printer_details, names)
+                    self._publish(tuple(info for info in details if info))
                     
                     self.last_refresh = time.time()
                     self.logger.info(f"Successfully refreshed {len(self.printers)} printers")
@@ -67,7 +188,7 @@ class PrinterManager:
     
     def _create_fallback_printers(self):
         """Create fallback printer list when win32print is not available"""
-        self.printers = [
+        self._publish((
             {
                 "name": "Microsoft Print to PDF",
                 "display_name": "Microsoft Print to PDF",
@@ -80,10 +201,24 @@ class PrinterManager:
                 "location": "",
                 "comment": "Built-in PDF printer",
                 "capabilities": self._get_default_capabilities()
-            }
-        ]
+            },
+        ))
         self.logger.warning("Using fallback printer configuration (win32print not available)")
     
+    def _publish(self, snapshot: tuple):
+        """Swap in a new printer snapshot plus its derived lookup views
+
+        The views are built on locals first so a concurrent reader sees
+        either the old structures or the new ones, never a partial state.
+        """
+        name_index = {p['name'].lower(): p for p in snapshot}
+        online = tuple(p for p in snapshot if p.get('is_online', False))
+        default = next((p for p in snapshot if p.get('is_default', False)), None)
+        self._name_index = name_index
+        self._online_printers = online
+        self._default_printer = default
+        self.printers = snapshot
+
     def _get_printer_details(self, printer_name: str) -> Optional[Dict[str, Any]]:
         """Get comprehensive printer information"""
         try:
@@ -145,7 +280,7 @@ class PrinterManager:
     def _is_printer_online(self, status_code: int, attributes: int) -> bool:
         """Determine if printer is online"""
         # Status codes: 0=Ready, 3=Idle, 8=Offline
-        if status_code in [0, 3]:
+        if status_code == 0 or status_code == 3:
             return True
         elif status_code == 8:
             return False
@@ -153,36 +288,18 @@ class PrinterManager:
         # For network printers, be optimistic
         try:
             if attributes & win32print.PRINTER_ATTRIBUTE_NETWORK:
-                return status_code not in [8, 13]  # Not offline or unavailable
+                return status_code not in _OFFLINE_STATUS_NETWORK
         except:
             pass
         
         # Default assumption
-        return status_code not in [2, 8, 13]  # Not error, offline, or unavailable
+        return status_code not in _OFFLINE_STATUS_DEFAULT
     
     def _get_status_text(self, status_code: int) -> str:
         """Convert status code to human-readable text"""
-        status_map = {
-            0: "Ready",
-            1: "Paused",
-            2: "Error", 
-            3: "Idle",
-            4: "Paper Jam",
-            5: "Paper Out",
-            6: "Manual Feed Required",
-            7: "Paper Problem",
-            8: "Offline",
-            9: "I/O Active",
-            10: "Busy",
-            11: "Printing",
-            12: "Output Bin Full",
-            13: "Not Available",
-            14: "Waiting",
-            15: "Processing",
-            16: "Initializing",
-            17: "Warming Up"
-        }
-        return status_map.get(status_code, f"Status {status_code}")
+        if 0 <= status_code < len(_STATUS_TEXT):
+            return _STATUS_TEXT[status_code]
+        return f"Status {status_code}"
     
     def _get_printer_type(self, attributes: int) -> str:
         """Determine printer type from attributes"""
@@ -201,82 +318,63 @@ class PrinterManager:
     def _get_printer_capabilities(self, printer_name: str) -> Dict[str, Any]:
         """Get printer capabilities and supported features"""
         try:
+            # One regex pass collects every capability keyword the name
+            # contains; the detectors below just test membership
+            keywords = frozenset(
+                match.lower() for match in _CAPABILITY_KW_RE.findall(printer_name)
+            )
+            
             # For now, return comprehensive default capabilities
             # In a full implementation, this would query actual printer capabilities
-            capabilities = {
-                "paper_sizes": [
-                    {"name": "A4", "width": 210, "height": 297, "units": "mm"},
-                    {"name": "Letter", "width": 8.5, "height": 11, "units": "inches"},
-                    {"name": "Legal", "width": 8.5, "height": 14, "units": "inches"},
-                    {"name": "A3", "width": 297, "height": 420, "units": "mm"}
-                ],
-                "orientations": ["Portrait", "Landscape"],
-                "color_modes": self._detect_color_support(printer_name),
-                "print_qualities": ["Draft", "Normal", "High", "Best"],
-                "duplex_modes": self._detect_duplex_support(printer_name),
-                "scaling_options": {
-                    "auto_scale": True,
-                    "fit_to_page": True,
-                    "custom_scale": True,
-                    "scale_range": {"min": 25, "max": 400}
-                },
+            return {
+                "paper_sizes": _PAPER_SIZES_FULL,
+                "orientations": _ORIENTATIONS,
+                "color_modes": self._detect_color_support(keywords),
+                "print_qualities": _PRINT_QUALITIES_FULL,
+                "duplex_modes": self._detect_duplex_support(keywords),
+                "scaling_options": _SCALING_FULL,
                 "advanced_features": {
                     "collation": True,
                     "multiple_copies": True,
                     "page_ranges": True,
-                    "borderless": self._detect_borderless_support(printer_name)
+                    "borderless": self._detect_borderless_support(keywords)
                 }
             }
             
-            return capabilities
-            
         except Exception as e:
             self.logger.warning(f"Failed to get capabilities for {printer_name}: {e}")
             return self._get_default_capabilities()
     
-    def _detect_color_support(self, printer_name: str) -> List[str]:
-        """Detect color support based on printer name and type"""
-        name_lower = printer_name.lower()
-        
-        if any(keyword in name_lower for keyword in ['color', 'colour', 'inkjet']):
-            return ["Color", "Grayscale", "Black and White"]
-        elif any(keyword in name_lower for keyword in ['laser', 'mono']):
-            return ["Black and White", "Grayscale"]
+    def _detect_color_support(self, keywords: frozenset) -> tuple:
+        """Detect color support from the scanned name keywords"""
+        if keywords & {'color', 'colour', 'inkjet'}:
+            return _COLOR_MODES_FULL
+        elif keywords & {'laser', 'mono'}:
+            return _COLOR_MODES_MONO
         else:
             # Default to color support
-            return ["Color", "Grayscale", "Black and White"]
+            return _COLOR_MODES_FULL
     
-    def _detect_duplex_support(self, printer_name: str) -> List[str]:
-        """Detect duplex support"""
-        name_lower = printer_name.lower()
-        
-        if any(keyword in name_lower for keyword in ['duplex', 'double-sided']):
-            return ["None", "Long Edge", "Short Edge"]
+    def _detect_duplex_support(self, keywords: frozenset) -> tuple:
+        """Detect duplex support from the scanned name keywords"""
+        if keywords & {'duplex', 'double-sided'}:
+            return _DUPLEX_MODES_FULL
         else:
-            return ["None"]
+            return _DUPLEX_MODES_NONE
     
-    def _detect_borderless_support(self, printer_name: str) -> bool:
-        """Detect borderless printing support"""
-        name_lower = printer_name.lower()
-        return any(keyword in name_lower for keyword in ['photo', 'inkjet', 'borderless'])
+    def _detect_borderless_support(self, keywords: frozenset) -> bool:
+        """Detect borderless printing support from the scanned name keywords"""
+        return bool(keywords & {'photo', 'inkjet', 'borderless'})
     
     def _get_default_capabilities(self) -> Dict[str, Any]:
         """Get default capabilities for fallback"""
         return {
-            "paper_sizes": [
-                {"name": "A4", "width": 210, "height": 297, "units": "mm"},
-                {"name": "Letter", "width": 8.5, "height": 11, "units": "inches"}
-            ],
-            "orientations": ["Portrait", "Landscape"],
-            "color_modes": ["Color", "Grayscale", "Black and White"],
-            "print_qualities": ["Draft", "Normal", "High"],
-            "duplex_modes": ["None"],
-            "scaling_options": {
-                "auto_scale": True,
-                "fit_to_page": True,
-                "custom_scale": False,
-                "scale_range": {"min": 100, "max": 100}
-            },
+            "paper_sizes": _PAPER_SIZES_DEFAULT,
+            "orientations": _ORIENTATIONS,
+            "color_modes": _COLOR_MODES_FULL,
+            "print_qualities": _PRINT_QUALITIES_DEFAULT,
+            "duplex_modes": _DUPLEX_MODES_NONE,
+            "scaling_options": _SCALING_DEFAULT,
             "advanced_features": {
                 "collation": True,
                 "multiple_copies": True,
@@ -286,39 +384,95 @@ class PrinterManager:
         }
     
     # Public interface methods
-    def get_printers(self) -> List[Dict[str, Any]]:
-        """Get list of all printers (auto-refresh if stale)"""
-        # Auto-refresh if data is older than 5 minutes
-        if time.time() - self.last_refresh > 300:
+    def get_printers(self) -> tuple:
+        """Get the current printer snapshot (refreshed on spooler change events)"""
+        # The listener flags actual changes; the 5-minute staleness check
+        # only applies when it is not running
+        if self._dirty:
+            self._dirty = False
+            self.refresh_printers()
+        elif not self._listener_active and time.time() - self.last_refresh > 300:
             self.refresh_printers()
         
-        return self.printers.copy()
+        # The snapshot is an immutable tuple, so it goes out as-is - no
+        # defensive per-call copy needed
+        return self.printers
     
     def get_printer_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """Get specific printer by name (case-insensitive)"""
-        for printer in self.get_printers():
-            if printer['name'].lower() == name.lower():
-                return printer
-        return None
+        self.get_printers()  # apply any pending refresh
+        return self._name_index.get(name.lower())
+    
+    async def refresh_printers_async(self):
+        """Refresh off-loop: the spooler RPC sweep runs on the thread pool
+
+        The async endpoints and the polling loop run on the event loop;
+        calling refresh_printers there blocks every other request for the
+        full enumeration (seconds on large fleets).
+        """
+        await asyncio.to_thread(self.refresh_printers)
+
+    async def get_printers_async(self) -> tuple:
+        """get_printers for async callers; any refresh runs off-loop"""
+        if self._dirty:
+            self._dirty = False
+            await asyncio.to_thread(self.refresh_printers)
+        elif not self._listener_active and time.time() - self.last_refresh > 300:
+            await asyncio.to_thread(self.refresh_printers)
+        return self.printers
+
+    async def is_printer_available_async(self, name: str) -> bool:
+        """is_printer_available for async callers; miss-refresh runs off-loop"""
+        printer = self.get_printer_by_name_cached(name)
+        if printer is None:
+            await asyncio.to_thread(self.refresh_printers)
+            printer = self.get_printer_by_name_cached(name)
+        return printer is not None and printer.get('is_online', False)
+
+    def get_printer_by_name_cached(self, name: str) -> Optional[Dict[str, Any]]:
+        """Look up a printer in the current snapshot, never refreshing
+
+        For hot-path checks where a slightly stale answer beats risking a
+        full EnumPrinters/GetPrinter sweep on the caller's latency.
+        """
+        return self._name_index.get(name.lower())
     
     def is_printer_available(self, name: str) -> bool:
-        """Check if printer exists and is online"""
-        printer = self.get_printer_by_name(name)
+        """Check if printer exists and is online
+
+        Answers from the current snapshot when the name is known; only a
+        miss (a printer we have never seen) forces a refresh, so checks
+        against installed printers never pay the enumeration cost.
+        """
+        printer = self.get_printer_by_name_cached(name)
+        if printer is None:
+            self.refresh_printers()
+            printer = self.get_printer_by_name_cached(name)
         return printer is not None and printer.get('is_online', False)
+
+    def are_available(self, names: List[str]) -> Dict[str, bool]:
+        """Check availability for several printers with one list pass
+
+        Avoids repeating the printer scan per name when validating
+        multi-printer assignments.
+        """
+        self.get_printers()  # apply any pending refresh
+        online = {p['name'].lower() for p in self._online_printers}
+        return {name: name.lower() in online for name in names}
     
     def get_default_printer(self) -> Optional[Dict[str, Any]]:
         """Get the default printer"""
-        for printer in self.get_printers():
-            if printer.get('is_default', False):
-                return printer
+        self.get_printers()  # apply any pending refresh
+        if self._default_printer is not None:
+            return self._default_printer
         
         # If no default found, return first available online printer
-        online_printers = [p for p in self.get_printers() if p.get('is_online', False)]
-        return online_printers[0] if online_printers else None
+        return self._online_printers[0] if self._online_printers else None
     
-    def get_online_printers(self) -> List[Dict[str, Any]]:
+    def get_online_printers(self) -> tuple:
         """Get only online printers"""
-        return [p for p in self.get_printers() if p.get('is_online', False)]
+        self.get_printers()  # apply any pending refresh
+        return self._online_printers
     
     def get_printer_statistics(self) -> Dict[str, Any]:
         """Get printer statistics"""
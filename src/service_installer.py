@@ -4,12 +4,102 @@ Handles Windows service installation, management, and configuration
 """
 
 import os
+import re
 import sys
 import subprocess
 import logging
 import time
+import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
+from requests.adapters import HTTPAdapter
+
+# Direct Service Control Manager calls skip the ~30-100ms fork and text
+# parse that every sc.exe invocation costs; sc.exe stays as the fallback
+# when pywin32 is missing
+try:
+    import win32service
+    import pywintypes
+    WIN32SERVICE_AVAILABLE = True
+except ImportError:
+    WIN32SERVICE_AVAILABLE = False
+
+# SERVICE_STATUS dwCurrentState values, spelled like sc.exe prints them
+# so both status paths speak the same vocabulary
+_SERVICE_STATE_TEXT = {
+    1: "STOPPED",
+    2: "START_PENDING",
+    3: "STOP_PENDING",
+    4: "RUNNING",
+    5: "CONTINUE_PENDING",
+    6: "PAUSE_PENDING",
+    7: "PAUSED"
+}
+
+# Suppresses the console window each sc.exe child would otherwise
+# flash when the installer runs from a GUI or service context (the flag
+# only exists on Windows; elsewhere the calls fail before it matters)
+_SC_CREATIONFLAGS = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
+def _run_sc(args, text=True):
+    """Run an sc.exe command with output captured and no console window"""
+    return subprocess.run(
+        ["sc.exe", *args],
+        capture_output=True,
+        text=text,
+        creationflags=_SC_CREATIONFLAGS
+    )
+
+# Pulls the state word straight out of sc.exe's raw bytes - no text
+# decode of the whole output and no per-line split loop
+_STATE_RE = re.compile(rb'STATE\s*:\s*\d+\s+(\S+)')
+
+# Shared pool for the status probes, so repeated check_status calls do
+# not pay thread creation per probe
+_PROBE_POOL = ThreadPoolExecutor(max_workers=2)
+
+# Keep-alive session for the local API probe: repeat status checks reuse
+# one TCP connection instead of a fresh handshake per call
+_probe_session = requests.Session()
+_probe_session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=1))
+
+# One ConfigManager shared across status calls; instantiating it per
+# call re-read and re-parsed the config file every time
+_cfg_manager = None
+_cfg_mtime = None
+
+def _get_config_manager():
+    """Return the cached ConfigManager, reloading only when the file changed
+
+    After the first load, repeated status checks pay one os.stat instead
+    of a full read-and-parse of the configuration file.
+    """
+    global _cfg_manager, _cfg_mtime
+    from config_manager import ConfigManager
+    
+    if _cfg_manager is None:
+        _cfg_manager = ConfigManager()
+        try:
+            _cfg_mtime = os.stat(_cfg_manager.config_path).st_mtime
+        except OSError:
+            _cfg_mtime = None
+        return _cfg_manager
+    
+    try:
+        mtime = os.stat(_cfg_manager.config_path).st_mtime
+    except OSError:
+        mtime = None
+    if mtime != _cfg_mtime:
+        _cfg_manager.reload()
+        _cfg_mtime = mtime
+    return _cfg_manager
+
+# winerror codes the installer branches on
+_ERROR_SERVICE_EXISTS = 1073
+_ERROR_SERVICE_DOES_NOT_EXIST = 1060
+_ERROR_SERVICE_ALREADY_RUNNING = 1056
+_ERROR_SERVICE_NOT_ACTIVE = 1062
 
 class ServiceInstaller:
     """Manages Windows service installation and lifecycle"""
@@ -19,6 +109,41 @@ class ServiceInstaller:
         self.service_name = "WindowsPrintService"
         self.service_display_name = "Windows Print Service - Ultra Fast"
         self.service_description = "Ultra-fast print service for web applications with zero-dialog printing"
+        self._scm = None
+    
+    def _get_scm(self):
+        """Open the Service Control Manager handle once and reuse it"""
+        if self._scm is None:
+            self._scm = win32service.OpenSCManager(
+                None, None, win32service.SC_MANAGER_ALL_ACCESS
+            )
+        return self._scm
+    
+    def _open_service(self, access):
+        """Open a handle to the service (raises pywintypes.error on absence)"""
+        return win32service.OpenService(self._get_scm(), self.service_name, access)
+    
+    def is_installed(self) -> bool:
+        """Check whether the service exists, without a full status query
+
+        OpenService answering (or failing with DOES_NOT_EXIST) is the
+        cheapest existence test the SCM offers - no state parse at all.
+        """
+        if WIN32SERVICE_AVAILABLE:
+            try:
+                handle = self._open_service(win32service.SERVICE_QUERY_STATUS)
+                win32service.CloseServiceHandle(handle)
+                return True
+            except pywintypes.error as e:
+                if e.winerror == _ERROR_SERVICE_DOES_NOT_EXIST:
+                    return False
+                # Exists but is not openable with our access rights
+                return True
+        return self._get_service_status() is not None
+    
+    def is_running(self) -> bool:
+        """Check whether the service is currently running"""
+        return self._get_service_status() == "RUNNING"
     
     def install_service(self, server_url: str) -> bool:
         """Install the Windows service"""
@@ -35,25 +160,26 @@ class ServiceInstaller:
             
             self.logger.info(f"Service executable: {exe_path}")
             
-            # Create service using sc.exe
-            cmd = [
-                "sc.exe", "create", self.service_name,
-                f"binPath= \"{exe_path}\" --service",
-                f"DisplayName= {self.service_display_name}",
-                "start= auto",
-                "type= own"
-            ]
+            # Cheap existence preflight instead of creating and matching
+            # the failure message afterwards
+            if self.is_installed():
+                self.logger.warning("Service already exists. Use --uninstall first if you want to reinstall.")
+                return False
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            created, error_msg, handle = self._create_service(exe_path)
             
-            if result.returncode == 0:
+            if created:
                 self.logger.info("✓ Service created successfully")
                 
-                # Set service description
-                self._set_service_description()
-                
-                # Configure service to restart on failure
-                self._configure_service_recovery()
+                # Configure on the handle CreateService returned: both
+                # settings go through ChangeServiceConfig2 without
+                # reopening the service (or forking sc.exe twice)
+                try:
+                    self._set_service_description(handle)
+                    self._configure_service_recovery(handle)
+                finally:
+                    if handle is not None:
+                        win32service.CloseServiceHandle(handle)
                 
                 # Update configuration with server URL
                 self._update_server_config(server_url)
@@ -75,7 +201,6 @@ class ServiceInstaller:
                     return False
                     
             else:
-                error_msg = result.stderr.strip()
                 if "already exists" in error_msg.lower():
                     self.logger.warning("Service already exists. Use --uninstall first if you want to reinstall.")
                     return False
@@ -87,24 +212,83 @@ class ServiceInstaller:
             self.logger.error(f"Service installation failed: {e}")
             return False
     
-    def _set_service_description(self):
+    def _create_service(self, exe_path: str):
+        """Register the service, returning (created, error_message, handle)
+
+        The handle from CreateService is handed back (win32 path only) so
+        the follow-up configuration reuses it instead of reopening.
+        """
+        if WIN32SERVICE_AVAILABLE:
+            try:
+                handle = win32service.CreateService(
+                    self._get_scm(),
+                    self.service_name,
+                    self.service_display_name,
+                    win32service.SERVICE_ALL_ACCESS,
+                    win32service.SERVICE_WIN32_OWN_PROCESS,
+                    win32service.SERVICE_AUTO_START,
+                    win32service.SERVICE_ERROR_NORMAL,
+                    f'"{exe_path}" --service',
+                    None, 0, None, None, None
+                )
+                return True, "", handle
+            except pywintypes.error as e:
+                if e.winerror == _ERROR_SERVICE_EXISTS:
+                    return False, "already exists", None
+                return False, e.strerror or str(e), None
+        
+        result = _run_sc([
+            "create", self.service_name,
+            f"binPath= \"{exe_path}\" --service",
+            f"DisplayName= {self.service_display_name}",
+            "start= auto",
+            "type= own"
+        ])
+        if result.returncode == 0:
+            return True, "", None
+        return False, result.stderr.strip(), None
+    
+    def _set_service_description(self, handle=None):
         """Set the service description"""
         try:
-            cmd = ["sc.exe", "description", self.service_name, self.service_description]
-            subprocess.run(cmd, capture_output=True)
+            if handle is not None:
+                win32service.ChangeServiceConfig2(
+                    handle,
+                    win32service.SERVICE_CONFIG_DESCRIPTION,
+                    self.service_description
+                )
+            else:
+                _run_sc(["description", self.service_name, self.service_description])
             self.logger.debug("Service description set")
         except Exception as e:
             self.logger.warning(f"Failed to set service description: {e}")
     
-    def _configure_service_recovery(self):
+    def _configure_service_recovery(self, handle=None):
         """Configure service to restart on failure"""
         try:
-            cmd = [
-                "sc.exe", "failure", self.service_name,
-                "reset= 86400",  # Reset failure count after 24 hours
-                "actions= restart/5000/restart/10000/restart/30000"  # Restart after 5s, 10s, 30s
-            ]
-            subprocess.run(cmd, capture_output=True)
+            if handle is not None:
+                win32service.ChangeServiceConfig2(
+                    handle,
+                    win32service.SERVICE_CONFIG_FAILURE_ACTIONS,
+                    {
+                        # Reset failure count after 24 hours; restart
+                        # after 5s, 10s, 30s
+                        'ResetPeriod': 86400,
+                        'RebootMsg': None,
+                        'Command': None,
+                        'Actions': [
+                            (win32service.SC_ACTION_RESTART, 5000),
+                            (win32service.SC_ACTION_RESTART, 10000),
+                            (win32service.SC_ACTION_RESTART, 30000)
+                        ]
+                    }
+                )
+            else:
+                _run_sc([
+                    "failure", self.service_name,
+                    "reset= 86400",  # Reset failure count after 24 hours
+                    "actions= restart/5000/restart/10000/restart/30000"  # Restart after 5s, 10s, 30s
+                ])
             self.logger.debug("Service recovery configured")
         except Exception as e:
             self.logger.warning(f"Failed to configure service recovery: {e}")
@@ -112,9 +296,7 @@ class ServiceInstaller:
     def _update_server_config(self, server_url: str):
         """Update configuration with server URL"""
         try:
-            from config_manager import ConfigManager
-            
-            config_manager = ConfigManager()
+            config_manager = _get_config_manager()
             config_manager.update_config({"server_url": server_url})
             self.logger.info(f"Updated server URL to: {server_url}")
             
@@ -129,9 +311,26 @@ class ServiceInstaller:
             # Stop service first
             self.stop_service()
             
+            if WIN32SERVICE_AVAILABLE:
+                try:
+                    handle = self._open_service(win32service.SERVICE_ALL_ACCESS)
+                    try:
+                        win32service.DeleteService(handle)
+                    finally:
+                        win32service.CloseServiceHandle(handle)
+                    self.logger.info("✓ Service uninstalled successfully")
+                    print("\n✓ Service uninstalled successfully")
+                    return True
+                except pywintypes.error as e:
+                    if e.winerror == _ERROR_SERVICE_DOES_NOT_EXIST:
+                        self.logger.info("Service was not installed")
+                        print("Service was not installed")
+                        return True
+                    self.logger.error(f"Service uninstallation failed: {e.strerror}")
+                    return False
+            
             # Delete service
-            cmd = ["sc.exe", "delete", self.service_name]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = _run_sc(["delete", self.service_name])
             
             if result.returncode == 0:
                 self.logger.info("✓ Service uninstalled successfully")
@@ -156,10 +355,9 @@ class ServiceInstaller:
         try:
             self.logger.info("Starting Windows Print Service...")
             
-            cmd = ["sc.exe", "start", self.service_name]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            issued, error_msg = self._issue_start()
             
-            if result.returncode == 0:
+            if issued:
                 self.logger.info("✓ Service start command issued")
                 
                 # Wait for service to actually start
@@ -171,7 +369,6 @@ class ServiceInstaller:
                     return False
                     
             else:
-                error_msg = result.stderr.strip()
                 if "already running" in error_msg.lower():
                     self.logger.info("Service is already running")
                     return True
@@ -183,15 +380,34 @@ class ServiceInstaller:
             self.logger.error(f"Service start failed: {e}")
             return False
     
+    def _issue_start(self):
+        """Ask the SCM to start the service, returning (issued, error_message)"""
+        if WIN32SERVICE_AVAILABLE:
+            try:
+                handle = self._open_service(win32service.SERVICE_START)
+                try:
+                    win32service.StartService(handle, None)
+                finally:
+                    win32service.CloseServiceHandle(handle)
+                return True, ""
+            except pywintypes.error as e:
+                if e.winerror == _ERROR_SERVICE_ALREADY_RUNNING:
+                    return False, "already running"
+                return False, e.strerror or str(e)
+        
+        result = _run_sc(["start", self.service_name])
+        if result.returncode == 0:
+            return True, ""
+        return False, result.stderr.strip()
+    
     def stop_service(self) -> bool:
         """Stop the Windows service"""
         try:
             self.logger.info("Stopping Windows Print Service...")
             
-            cmd = ["sc.exe", "stop", self.service_name]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            issued, error_msg = self._issue_stop()
             
-            if result.returncode == 0:
+            if issued:
                 self.logger.info("✓ Service stop command issued")
                 
                 # Wait for service to actually stop
@@ -203,7 +419,6 @@ class ServiceInstaller:
                     return True  # Consider it successful anyway
                     
             else:
-                error_msg = result.stderr.strip()
                 if "not started" in error_msg.lower() or "does not exist" in error_msg.lower():
                     self.logger.info("Service was not running")
                     return True
@@ -215,9 +430,36 @@ class ServiceInstaller:
             self.logger.error(f"Service stop failed: {e}")
             return False
     
+    def _issue_stop(self):
+        """Ask the SCM to stop the service, returning (issued, error_message)"""
+        if WIN32SERVICE_AVAILABLE:
+            try:
+                handle = self._open_service(win32service.SERVICE_STOP)
+                try:
+                    win32service.ControlService(
+                        handle, win32service.SERVICE_CONTROL_STOP
+                    )
+                finally:
+                    win32service.CloseServiceHandle(handle)
+                return True, ""
+            except pywintypes.error as e:
+                if e.winerror == _ERROR_SERVICE_NOT_ACTIVE:
+                    return False, "not started"
+                if e.winerror == _ERROR_SERVICE_DOES_NOT_EXIST:
+                    return False, "does not exist"
+                return False, e.strerror or str(e)
+        
+        result = _run_sc(["stop", self.service_name])
+        if result.returncode == 0:
+            return True, ""
+        return False, result.stderr.strip()
+    
     def _wait_for_service_status(self, target_status: str, timeout: int = 30) -> bool:
         """Wait for service to reach target status"""
         try:
+            if WIN32SERVICE_AVAILABLE:
+                return self._wait_for_status_win32(target_status, timeout)
+            
             start_time = time.time()
             
             while time.time() - start_time < timeout:
@@ -233,19 +475,57 @@ class ServiceInstaller:
             self.logger.error(f"Error waiting for service status: {e}")
             return False
     
+    def _wait_for_status_win32(self, target_status: str, timeout: int) -> bool:
+        """Wait for a state transition with fast adaptive status polls
+
+        QueryServiceStatus is a cheap IOCTL, so the wait can start at
+        50ms and back off toward one second instead of sleeping a full
+        second between forked sc.exe queries - most starts are noticed
+        within tens of milliseconds rather than after the old ~1s
+        average. (An APC via NotifyServiceStatusChange would be fully
+        event-driven, but pywin32 does not expose it; adaptive polling
+        on one kept-open handle is the closest this stack offers.)
+        """
+        target = target_status.upper()
+        try:
+            handle = self._open_service(win32service.SERVICE_QUERY_STATUS)
+        except pywintypes.error:
+            return False
+        try:
+            deadline = time.monotonic() + timeout
+            delay = 0.05
+            while True:
+                status = win32service.QueryServiceStatus(handle)
+                if _SERVICE_STATE_TEXT.get(status[1]) == target:
+                    return True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                time.sleep(min(delay, remaining))
+                delay = min(delay * 2, 1.0)
+        finally:
+            win32service.CloseServiceHandle(handle)
+    
     def _get_service_status(self) -> Optional[str]:
         """Get current service status"""
         try:
-            cmd = ["sc.exe", "query", self.service_name]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            if WIN32SERVICE_AVAILABLE:
+                try:
+                    handle = self._open_service(win32service.SERVICE_QUERY_STATUS)
+                    try:
+                        status = win32service.QueryServiceStatus(handle)
+                    finally:
+                        win32service.CloseServiceHandle(handle)
+                    return _SERVICE_STATE_TEXT.get(status[1])
+                except pywintypes.error:
+                    return None
+            
+            result = _run_sc(["query", self.service_name], text=False)
             
             if result.returncode == 0:
-                # Parse status from output
-                for line in result.stdout.split('\n'):
-                    if "STATE" in line:
-                        parts = line.split()
-                        if len(parts) >= 4:
-                            return parts[3]  # Status is typically the 4th part
+                match = _STATE_RE.search(result.stdout)
+                if match:
+                    return match.group(1).decode('ascii', 'replace')
                 
             return None
             
@@ -256,59 +536,61 @@ class ServiceInstaller:
     def check_status(self):
         """Check and display service status"""
         try:
-            print("🔍 Windows Print Service Status")
-            print("=" * 40)
+            # Compose the whole report and flush it with one write: a
+            # single syscall to the console instead of one per print
+            # (console writes on Windows are comparatively expensive)
+            out = [
+                "🔍 Windows Print Service Status",
+                "=" * 40
+            ]
+            
+            # The API probe (HTTP round trip) and the config check (disk
+            # read) overlap the service query instead of running after it
+            api_future = _PROBE_POOL.submit(self._check_api_status)
+            config_future = _PROBE_POOL.submit(self._check_configuration)
             
             # Check if service exists
-            cmd = ["sc.exe", "query", self.service_name]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = _run_sc(["query", self.service_name])
             
             if result.returncode == 0:
                 # Parse service information
-                lines = result.stdout.split('\n')
-                
                 service_info = {}
-                for line in lines:
+                for line in result.stdout.split('\n'):
                     if ':' in line:
                         key, value = line.split(':', 1)
                         service_info[key.strip()] = value.strip()
                 
-                # Display status
-                status = "Unknown"
-                for line in lines:
-                    if "STATE" in line:
-                        parts = line.split()
-                        if len(parts) >= 4:
-                            status = parts[3]
-                            break
+                # Display status (same parse as _get_service_status)
+                match = _STATE_RE.search(result.stdout.encode('ascii', 'replace'))
+                status = match.group(1).decode('ascii', 'replace') if match else "Unknown"
                 
-                print(f"Service Name: {self.service_name}")
-                print(f"Status: {status}")
+                out.append(f"Service Name: {self.service_name}")
+                out.append(f"Status: {status}")
                 
                 # Check if API is responding
-                api_status = self._check_api_status()
-                print(f"Local API: {api_status}")
+                out.append(f"Local API: {api_future.result()}")
                 
                 # Check configuration
-                config_status = self._check_configuration()
-                print(f"Configuration: {config_status}")
+                out.append(f"Configuration: {config_future.result()}")
                 
-                print("\nService Details:")
+                out.append("\nService Details:")
                 for key, value in service_info.items():
                     if key in ["SERVICE_NAME", "DISPLAY_NAME", "TYPE", "START_TYPE"]:
-                        print(f"  {key}: {value}")
+                        out.append(f"  {key}: {value}")
                 
                 # Show management commands
-                print("\nManagement Commands:")
-                print("  Start:     python main.py --start")
-                print("  Stop:      python main.py --stop") 
-                print("  Restart:   python main.py --stop && python main.py --start")
-                print("  Uninstall: python main.py --uninstall")
+                out.append("\nManagement Commands:")
+                out.append("  Start:     python main.py --start")
+                out.append("  Stop:      python main.py --stop")
+                out.append("  Restart:   python main.py --stop && python main.py --start")
+                out.append("  Uninstall: python main.py --uninstall")
                 
             else:
-                print("❌ Service is not installed")
-                print("\nTo install the service:")
-                print("  python main.py --install http://your-django-server:8000")
+                out.append("❌ Service is not installed")
+                out.append("\nTo install the service:")
+                out.append("  python main.py --install http://your-django-server:8000")
+            
+            sys.stdout.write("\n".join(out) + "\n")
                 
         except Exception as e:
             print(f"❌ Error checking service status: {e}")
@@ -316,8 +598,7 @@ class ServiceInstaller:
     def _check_api_status(self) -> str:
         """Check if local API is responding"""
         try:
-            import requests
-            response = requests.get("http://localhost:8081/", timeout=5)
+            response = _probe_session.get("http://localhost:8081/", timeout=5)
             if response.status_code == 200:
                 return "✓ Running (http://localhost:8081)"
             else:
@@ -331,10 +612,7 @@ class ServiceInstaller:
     def _check_configuration(self) -> str:
         """Check configuration status"""
         try:
-            from config_manager import ConfigManager
-            
-            config_manager = ConfigManager()
-            config = config_manager.get_config()
+            config = _get_config_manager().get_config()
             
             server_url = config.get('server_url', 'Not configured')
             client_id = config.get('client_id', 'Not configured')
@@ -34,7 +34,18 @@ class WindowsPrintService:
         
         # Tasks
         self.tasks = []
-        
+
+        # Listen socket for the API server, bound during initialization
+        # and deliberately kept open across server restarts
+        self._listen_socket = None
+
+        # Status caches (filled once components exist)
+        self._components_status = None
+        self._is_healthy = None
+        self._get_metrics = None
+        self._printer_stats_cache = None
+        self._printer_stats_time = 0.0
+
         self.logger.info("Windows Print Service initialized")
     
     async def initialize_components(self):
@@ -55,14 +66,35 @@ class WindowsPrintService:
             self.job_manager = JobManager(config, self.print_executor, self.printer_manager)
             self.logger.info("✓ Job manager initialized")
             
-            # Initialize API server
+            # Initialize API server on a socket bound up front: binding
+            # here fails fast on a taken port, and server restarts reuse
+            # the already-listening socket instead of repeating
+            # bind+listen (kernel keeps queueing connections meanwhile)
+            api_port = self.config_manager.get_config().get('local_api_port', 8081)
+            self._listen_socket = APIServer.create_listen_socket(api_port)
             self.api_server = APIServer(
                 self.printer_manager,
                 self.job_manager,
-                self.config_manager
+                self.config_manager,
+                listen_socket=self._listen_socket
             )
-            self.logger.info("✓ API server initialized")
+            self.logger.info(f"✓ API server initialized (port {api_port} bound)")
+            
+            # Component identity never changes after this point; the
+            # status endpoint reuses this dict instead of re-deriving it
+            self._components_status = {
+                "printer_manager": True,
+                "print_executor": True,
+                "job_manager": True,
+                "api_server": True
+            }
             
+            # Bind the health-monitor hooks once; the monitor loop then
+            # calls them directly instead of re-running hasattr/getattr
+            # lookups every iteration
+            self._is_healthy = getattr(self.job_manager, 'is_healthy', None)
+            self._get_metrics = getattr(self.job_manager, 'get_performance_metrics', None)
+
             self.logger.info("✓ All components initialized successfully")
             
         except Exception as e:
@@ -113,16 +145,26 @@ class WindowsPrintService:
             
             while self.running:
                 try:
-                    # Log health status every 5 minutes
-                    await asyncio.sleep(300)  # 5 minutes
+                    # React to health transitions immediately; the
+                    # 5-minute ceiling covers time-based conditions (loss
+                    # of server contact) and the periodic metrics log
+                    event = getattr(self.job_manager, 'health_changed', None)
+                    if event is not None:
+                        try:
+                            await asyncio.wait_for(event.wait(), timeout=300)
+                            event.clear()
+                        except asyncio.TimeoutError:
+                            pass
+                    else:
+                        await asyncio.sleep(300)  # 5 minutes
                     
-                    if self.job_manager and hasattr(self.job_manager, 'is_healthy'):
-                        health = self.job_manager.is_healthy()
+                    if self._is_healthy is not None:
+                        health = self._is_healthy()
                         if not health:
                             self.logger.warning("Job manager health check failed")
-                        else:
+                        elif self._get_metrics is not None:
                             # Log performance metrics
-                            metrics = self.job_manager.get_performance_metrics()
+                            metrics = self._get_metrics()
                             self.logger.info(
                                 f"Service healthy - "
                                 f"Polls: {metrics.get('total_polls', 0)}, "
@@ -169,41 +211,55 @@ class WindowsPrintService:
         """Display service startup information"""
         try:
             config = self.config_manager.get_config()
-            
-            # Service information
-            self.logger.info(f"Service Version: 1.0.0")
-            self.logger.info(f"Client ID: {config['client_id']}")
-            self.logger.info(f"Django Server: {config['server_url']}")
-            self.logger.info(f"Local API: http://localhost:{config['local_api_port']}")
-            self.logger.info(f"Poll Interval: {config['poll_interval']*1000:.0f}ms")
-            
+
+            # Compose the whole banner and emit it as one log record: a
+            # single formatter/handler pass (and one console write)
+            # instead of ~15, and the banner can never be interleaved
+            # with records from other tasks
+            lines = [
+                "Service Version: 1.0.0",
+                f"Client ID: {config['client_id']}",
+                f"Django Server: {config['server_url']}",
+                f"Local API: http://localhost:{config['local_api_port']}",
+                f"Poll Interval: {config['poll_interval']*1000:.0f}ms"
+            ]
+
             # Printer information
             printers = self.printer_manager.get_printers()
-            online_printers = [p for p in printers if p.get('is_online', False)]
-            
-            self.logger.info("-" * 40)
-            self.logger.info(f"Printers Found: {len(printers)} total, {len(online_printers)} online")
-            
+            # The online subset is precomputed at refresh time; no filter
+            # pass over the fleet here
+            online_printers = self.printer_manager.get_online_printers()
+
+            lines.append("-" * 40)
+            lines.append(f"Printers Found: {len(printers)} total, {len(online_printers)} online")
+
             if online_printers:
                 for printer in online_printers[:3]:  # Show first 3
                     status = "✓" if printer.get('is_online') else "✗"
                     default = " (Default)" if printer.get('is_default') else ""
-                    self.logger.info(f"  {status} {printer['name']}{default}")
-                
+                    lines.append(f"  {status} {printer['name']}{default}")
+
                 if len(online_printers) > 3:
-                    self.logger.info(f"  ... and {len(online_printers) - 3} more")
+                    lines.append(f"  ... and {len(online_printers) - 3} more")
             else:
-                self.logger.warning("No online printers found")
-            
+                lines.append("⚠ No online printers found")
+
             # Print executor information
             tool_info = self.print_executor.get_tool_info()
             preferred_tool = tool_info.get('preferred_tool', 'system_default')
-            self.logger.info(f"Print Tool: {preferred_tool}")
-            
-            self.logger.info("-" * 40)
-            self.logger.info("🚀 Service ready for print jobs!")
-            self.logger.info("Press Ctrl+C to stop the service")
-            self.logger.info("=" * 60)
+            lines.append(f"Print Tool: {preferred_tool}")
+
+            lines.append("-" * 40)
+            lines.append("🚀 Service ready for print jobs!")
+            lines.append("Press Ctrl+C to stop the service")
+            lines.append("=" * 60)
+
+            self.logger.info("\n".join(lines))
+
+            # Keep the empty-fleet condition visible at WARNING level,
+            # outside the banner record
+            if not online_printers:
+                self.logger.warning("No online printers found")
             
         except Exception as e:
             self.logger.error(f"Failed to display startup info: {e}")
@@ -223,15 +279,17 @@ class WindowsPrintService:
                     self.logger.debug(f"Cancelling task: {task.get_name()}")
                     task.cancel()
             
-            # Wait for tasks to complete cancellation
+            # Wait for tasks to complete cancellation; asyncio.wait
+            # times out without cancelling, so stragglers can be named
             if self.tasks:
-                try:
-                    await asyncio.wait_for(
-                        asyncio.gather(*self.tasks, return_exceptions=True),
-                        timeout=10.0
-                    )
-                except asyncio.TimeoutError:
-                    self.logger.warning("Task cancellation timeout")
+                done, pending = await asyncio.wait(
+                    self.tasks,
+                    timeout=10.0,
+                    return_when=asyncio.ALL_COMPLETED
+                )
+                if pending:
+                    names = ", ".join(task.get_name() for task in pending)
+                    self.logger.warning(f"Tasks still pending after shutdown timeout: {names}")
             
             # Stop individual components
             if self.job_manager:
@@ -240,6 +298,9 @@ class WindowsPrintService:
             if self.api_server:
                 await self.api_server.stop_server()
             
+            if self.print_executor:
+                await self.print_executor.close()
+            
             # Calculate uptime
             if self.start_time:
                 uptime = time.time() - self.start_time
@@ -253,16 +314,22 @@ class WindowsPrintService:
     def get_service_status(self) -> dict:
         """Get comprehensive service status"""
         try:
-            status = {
-                "running": self.running,
-                "start_time": self.start_time,
-                "uptime_seconds": time.time() - self.start_time if self.start_time else 0,
-                "components": {
+            # The components dict is prebuilt once initialization
+            # finishes; before that the per-attribute checks still run
+            components = self._components_status
+            if components is None:
+                components = {
                     "printer_manager": self.printer_manager is not None,
                     "print_executor": self.print_executor is not None,
                     "job_manager": self.job_manager is not None,
                     "api_server": self.api_server is not None
                 }
+            
+            status = {
+                "running": self.running,
+                "start_time": self.start_time,
+                "uptime_seconds": time.time() - self.start_time if self.start_time else 0,
+                "components": components
             }
             
             # Add component-specific status
@@ -270,7 +337,15 @@ class WindowsPrintService:
                 status["job_manager_status"] = self.job_manager.get_status()
             
             if self.printer_manager:
-                status["printer_statistics"] = self.printer_manager.get_printer_statistics()
+                # Statistics hold still for a few seconds at a time; a
+                # short-TTL memo keeps high-frequency status scrapes from
+                # recounting the printer snapshot per call
+                now = time.monotonic()
+                if (self._printer_stats_cache is None
+                        or now - self._printer_stats_time > 5.0):
+                    self._printer_stats_cache = self.printer_manager.get_printer_statistics()
+                    self._printer_stats_time = now
+                status["printer_statistics"] = self._printer_stats_cache
             
             return status
             
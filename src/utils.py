@@ -0,0 +1,30 @@
+"""
+Shared Utilities
+Small helpers used across service components
+"""
+
+import functools
+import time
+
+def ttl_cache(ttl: float):
+    """Memoize a zero-argument callable for `ttl` seconds
+
+    Intended for cheap-to-stale snapshots (status dicts, statistics) that
+    are polled far more often than they meaningfully change. Uses a
+    monotonic clock so the expiry is immune to wall-clock adjustments.
+    """
+    def decorator(fn):
+        last_time = 0.0
+        last_value = None
+
+        @functools.wraps(fn)
+        def wrapper():
+            nonlocal last_time, last_value
+            now = time.monotonic()
+            if last_value is None or now - last_time > ttl:
+                last_value = fn()
+                last_time = now
+            return last_value
+
+        return wrapper
+    return decorator